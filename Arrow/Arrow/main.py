@@ -3,11 +3,13 @@ import sys
 import time
 import traceback
 from pathlib import Path
+from Arrow.Utils.import_profiler import start_import_profiler
 from Arrow.Externals.cloud.upload_run_statistics import upload_statistics
 
 
 def main(args=None):
     start_time = time.time()
+    import_profiler = start_import_profiler(args)  # None unless '--import_profile True'
 
     ensure_correct_setting()
 
@@ -15,26 +17,34 @@ def main(args=None):
     from Arrow.Utils.logger_management import get_logger
     from Arrow.Utils.configuration_management import get_config_manager
     from Arrow.Utils.statistics_managment import get_statistics_manager
+    from Arrow.Utils.profiler_management import get_profiler
 
     set_basedir_path()
 
     logger = get_logger()
     parse_arguments(args)
     logger.info("==== Arrow main")
+    profiler = get_profiler()  # no-op sections unless '--profile' was asked
 
     try:
 
         from Arrow.Tool.stages import input_stage, evaluation_stage, init_stage, test_stage, final_stage
 
-        input_stage.read_inputs()  # Read inputs, read template, read configuration, ARM/riscv, ...
-        evaluation_stage.evaluate_section()  # review all configs and knobs, set them according to some logic and seal them ...
-        init_stage.init_section()  # initialize the state, register, memory and other managers.
-        test_stage.test_section()  # boot, body (foreach core, foreach scenario), test final
+        with profiler.section("main"):
+            with profiler.section("input_stage", "stage"):
+                input_stage.read_inputs()  # Read inputs, read template, read configuration, ARM/riscv, ...
+            with profiler.section("evaluation_stage", "stage"):
+                evaluation_stage.evaluate_section()  # review all configs and knobs, set them according to some logic and seal them ...
+            with profiler.section("init_stage", "stage"):
+                init_stage.init_section()  # initialize the state, register, memory and other managers.
+            with profiler.section("test_stage", "stage"):
+                test_stage.test_section()  # boot, body (foreach core, foreach scenario), test final
 
-        logger.info("Test generated successful :)")
-        dump_time(start_time, "Test generation")
+            logger.info("Test generated successful :)")
+            dump_time(start_time, "Test generation")
 
-        final_stage.final_section()  # post flows, generate binary, upload to cloud, etc.
+            with profiler.section("final_stage", "stage"):
+                final_stage.final_section()  # post flows, generate binary, upload to cloud, etc.
 
     except Exception as e:
         logger.warning("Test failed :(")
@@ -57,6 +67,17 @@ def main(args=None):
 
     finally:
         config_manager = get_config_manager()
+        if profiler.enabled:
+            try:
+                profiler.dump_report(config_manager.get_value('output_dir_path'))
+                logger.info(f"---- Profile report written to {config_manager.get_value('output_dir_path')}/profile.json")
+            except OSError as e:
+                # e.g. the run failed before creating the output directory, don't hide the original error
+                logger.warning(f"Failed to write the profile report: {e}")
+        if import_profiler is not None:
+            import_profiler.stop()
+            for line in import_profiler.get_report_lines():
+                logger.info(line)
         cloud_mode = config_manager.get_value('Cloud_mode')
         if cloud_mode:
             logger.info(f"Ending main in cloud_mode, resetting tool structures")
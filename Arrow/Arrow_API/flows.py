@@ -2,6 +2,7 @@ from peewee import Expression
 from typing import Union, List, Dict, Any, Optional, Tuple
 from Arrow.Utils.logger_management import get_logger
 from Arrow.Utils.configuration_management import Configuration
+from Arrow.Utils.profiler_management import profile_api_class
 from Arrow.Utils.APIs import choice, range_with_peak, adaptive_choice
 from Arrow.Tool.generation_management.generate import GeneratedInstruction, generate as generate_wrapper
 from Arrow.Tool.register_management.register import Register
@@ -146,4 +147,8 @@ class AR:
         @staticmethod
         def write(offset, register, comment:str=None) -> None:
             # Generate pop assembly code for the given registers.
-            return stack.Stack.write(offset, register, comment)
\ No newline at end of file
+            return stack.Stack.write(offset, register, comment)
+
+
+# time (and allocations) of every public API call, when running with '--profile'
+profile_api_class(AR, "AR")
@@ -1,5 +1,6 @@
 
 from typing import Optional
+from Arrow.Utils.profiler_management import profile_api_class
 
 __all__ = ["MemoryManager_API"]  # Only export MemoryManager_API
 
@@ -64,3 +65,7 @@ class MemoryManager_API:
         current_state = get_current_state()
         current_el_page_table = current_state.current_el_page_table
         return current_el_page_table.segment_manager.allocate_memory_segment(name=name, byte_size=byte_size, memory_type=memory_type)
+
+
+# time (and allocations) of every public API call, when running with '--profile'
+profile_api_class(MemoryManager_API, "MemoryManager")
@@ -1,4 +1,5 @@
 from Arrow.Tool.state_management import get_current_state as _get_current_state
+from Arrow.Utils.profiler_management import profile_api_class
 
 # Expose the classes under the resources package
 __all__ = ["RegisterManager_API"]  # Only export RegisterManager_API
@@ -70,3 +71,6 @@ class RegisterManager_API:
         current_state = _get_current_state()
         current_state.register_manager.print_reg_status()
 
+
+# time (and allocations) of every public API call, when running with '--profile'
+profile_api_class(RegisterManager_API, "RegisterManager")
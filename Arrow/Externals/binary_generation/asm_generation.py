@@ -1,10 +1,11 @@
 import os
-import random
+import numpy as np
 from Arrow.Utils.logger_management import get_logger
 from Arrow.Utils.configuration_management import get_config_manager, Configuration
 from Arrow.Tool.asm_blocks.asm_unit import get_comment_mark
 from Arrow.Tool.state_management import get_state_manager
 from Arrow.Utils.singleton_management import SingletonManager
+from Arrow.Utils.seed_management import get_random_streams
 from Arrow.Tool.memory_management.utils import convert_bytes_to_words
 from Arrow.Tool.asm_libraries.barrier.barrier_manager import get_barrier_manager
 from Arrow.Tool.memory_management.memlayout.page_table_manager import get_page_table_manager
@@ -12,6 +13,8 @@ from Arrow.Tool.memory_management.memlayout.page_table_manager import get_page_t
 
 x86_Assembler_syntax = "NASM"  ## other option is "GAS" (GNU Assembler) syntax but not for NASM
 
+RANDOM_DATA_QUADS_PER_LINE = 8
+
 
 def get_output(location, segment_name=None):
     print_logic = {
@@ -49,35 +52,39 @@ def get_output(location, segment_name=None):
     return print_logic.get(location, {}).get(arch_syntax, "Default output")
 
 
-def generate_asm_from_AsmUnits(instruction_segments):
-    asm_code = ""
-    asm_code += f".global _start\n"
+def generate_asm_from_AsmUnits(instruction_segments, output):
+    """
+    Stream the .text sections of the given code segments into `output` (a writable text stream).
+    Each segment is rendered into its own list of lines and written in one go, so peak memory is bounded by one segment.
+    """
+    output.write(f".global _start\n")
 
     for segment in instruction_segments:
 
         asm_code_counter = 0
-        tmp_asm_code = ""
+        segment_lines = []
 
         segment_name = segment.name
-        tmp_asm_code += get_output(location="text_segment_header", segment_name=segment_name)
-        tmp_asm_code += f".global {segment_name}\n"
+        segment_lines.append(get_output(location="text_segment_header", segment_name=segment_name))
+        segment_lines.append(f".global {segment_name}\n")
         if Configuration.Architecture.riscv:
-            tmp_asm_code += f".align 2       {get_comment_mark()} Align to 4-byte boundary\n"
-        tmp_asm_code += f"{segment_name}:\n"
+            segment_lines.append(f".align 2       {get_comment_mark()} Align to 4-byte boundary\n")
+        segment_lines.append(f"{segment_name}:\n")
+        header_line_count = len(segment_lines)  # one line each
 
         # Access or initialize the singleton variable
         is_first_segment = SingletonManager.get("is_first_segment", default=True)
         if is_first_segment:
             asm_code_counter += 1
-            tmp_asm_code += f"_start:\n"
+            segment_lines.append(f"_start:\n")
             SingletonManager.set("is_first_segment", False)
 
         # Process each asm unit in the segment
         for asm_unit in segment.asm_units_list:
             asm_code_counter += 1
-            tmp_asm_code += f"    {asm_unit}\n"
+            segment_lines.append(f"    {asm_unit}\n")
 
-        tmp_asm_code += "\n"
+        segment_lines.append("\n")
 
         # planting  .text segment only if some entries exist in that section
 
@@ -85,9 +92,8 @@ def generate_asm_from_AsmUnits(instruction_segments):
         if asm_code_counter == 0:
             skip_text_section = True
         elif asm_code_counter == 1:
-            lines = tmp_asm_code.split("\n")
-            lines = [line for line in lines if line.strip()]
-            if len(lines) == 4:
+            # a single (one line) entry under the section header, .global and segment label lines
+            if header_line_count + asm_code_counter == 4:
                 # Some text sections contain only labels like the below - skipping them
                 '''
                 .global core_1__code_segment_5_1316
@@ -97,18 +103,16 @@ def generate_asm_from_AsmUnits(instruction_segments):
                 skip_text_section = True
 
         if skip_text_section:
-            asm_code += f"{get_comment_mark()} No code on {segment_name} segment. skipping .text section\n\n"
+            output.write(f"{get_comment_mark()} No code on {segment_name} segment. skipping .text section\n\n")
         else:
-            asm_code += tmp_asm_code
-        asm_code_counter = 0
-        tmp_asm_code = ""
-
-    return asm_code
+            output.write("".join(segment_lines))
 
 
-def generate_data_from_DataUnits(data_segments):
-
-    data_code = ""
+def generate_data_from_DataUnits(data_segments, output, data_payloads=None):
+    """
+    Stream the .data sections of the given data segments into `output` (a writable text stream), one segment at a time.
+    data_payloads: optional dict, filled with the random payload of every shared data segment by segment name
+    """
 
     for segment in data_segments:
 
@@ -117,10 +121,10 @@ def generate_data_from_DataUnits(data_segments):
         segment_pa_address = hex(segment.pa_address)
         segment_size = segment.byte_size
         data_code_counter = 0
-        tmp_data_code = "\n"
+        segment_lines = ["\n"]
 
         # First, process initialized data (go to .data section)
-        tmp_data_code += get_output(location="data_segment_header", segment_name=segment_name)
+        segment_lines.append(get_output(location="data_segment_header", segment_name=segment_name))
         
         data_unit_list = segment.data_units_list
 
@@ -131,13 +135,18 @@ def generate_data_from_DataUnits(data_segments):
             # the entire segment sequentially, placing each label at the exact offset required
             # and filling the spaces between labels with random data.
 
-            assembly_code = generate_random_data_section(data_unit_list, segment_size)
+            payload_file = None
+            if get_config_manager().get_value('Incbin_data'):
+                payload_file = os.path.join(get_config_manager().get_value('output_dir_path'), f"{segment_name}.bin")
+            # each segment payload has its own stream, independent of the generation order of the test
+            payload = get_random_streams().numpy_stream(None, ("data_payload", segment_name)).bytes(segment_size)
+            if data_payloads is not None:
+                data_payloads[segment_name] = payload
+            assembly_code = generate_random_data_section(data_unit_list, segment_size, payload_file, payload=payload)
             for line in assembly_code:
-                tmp_data_code += f"{line}\n"
+                segment_lines.append(f"{line}\n")
 
-            data_code += tmp_data_code
-            data_code_counter = 0
-            tmp_data_code = ""
+            output.write("".join(segment_lines))
             continue
 
         if segment.memory_type != Configuration.Memory_types.DATA_PRESERVE and segment.memory_type != Configuration.Memory_types.STACK:
@@ -171,36 +180,36 @@ def generate_data_from_DataUnits(data_segments):
                 break_lines_between_different_data_units = "" if first_data_unit else "\n"
                 first_data_unit = False
                 
-                tmp_data_code += f".org {hex(segment_offset)}\n"
+                segment_lines.append(f".org {hex(segment_offset)}\n")
                 if alignment is not None:
-                    tmp_data_code += f".align {alignment}\n"
+                    segment_lines.append(f".align {alignment}\n")
                 #tmp_data_code += f"{break_lines_between_different_data_units}{unique_label}:\n"
-                tmp_data_code += f"{unique_label}:\n"
+                segment_lines.append(f"{unique_label}:\n")
 
                 if Configuration.Architecture.x86:
                     # x86 Assembly: Use `.long` for 4-byte values
                     for value, value_type in words_tuple:
                         if value_type == "word":
-                            tmp_data_code += f"{break_lines_between_same_data_unit}    .long 0x{value:08x}  {get_comment_mark()} 4 bytes\n"
+                            segment_lines.append(f"{break_lines_between_same_data_unit}    .long 0x{value:08x}  {get_comment_mark()} 4 bytes\n")
                         elif value_type == "byte":
-                            tmp_data_code += f"{break_lines_between_same_data_unit}    .byte 0x{value:02x}  {get_comment_mark()} 1 bytes\n"
+                            segment_lines.append(f"{break_lines_between_same_data_unit}    .byte 0x{value:02x}  {get_comment_mark()} 1 bytes\n")
                 elif Configuration.Architecture.arm:
                     # ARM Assembly: Use `.word` for 4-byte values
                     for value, value_type in words_tuple:
                         if value_type == "word":
-                            tmp_data_code += f"    .word 0x{value:08x}  {get_comment_mark()} 4 bytes\n"
+                            segment_lines.append(f"    .word 0x{value:08x}  {get_comment_mark()} 4 bytes\n")
                             #tmp_data_code += f"{break_lines_between_same_data_unit}    .word 0x{value:08x}  {get_comment_mark()} 4 bytes\n"
                         elif value_type == "byte":
-                            tmp_data_code += f"    .byte 0x{value:02x}  {get_comment_mark()} 1 byte\n"
+                            segment_lines.append(f"    .byte 0x{value:02x}  {get_comment_mark()} 1 byte\n")
                             #tmp_data_code += f"{break_lines_between_same_data_unit}    .byte 0x{value:02x}  {get_comment_mark()} 1 byte\n"
-                    tmp_data_code += "\n"
+                    segment_lines.append("\n")
                 elif Configuration.Architecture.riscv:
                     # RISC-V Assembly: Use `.dword` for 8-byte values and `.byte` for smaller chunks
                     for value, value_type in words_tuple:
                         if value_type == "word":
-                            tmp_data_code += f"{break_lines_between_same_data_unit}    .dword 0x{value:08x}  {get_comment_mark()} 4 bytes\n"  # 4 bytes (adjust if architecture supports larger)
+                            segment_lines.append(f"{break_lines_between_same_data_unit}    .dword 0x{value:08x}  {get_comment_mark()} 4 bytes\n")  # 4 bytes (adjust if architecture supports larger)
                         elif value_type == "byte":
-                            tmp_data_code += f"{break_lines_between_same_data_unit}    .byte 0x{value:02x}  {get_comment_mark()} 1 byte\n"
+                            segment_lines.append(f"{break_lines_between_same_data_unit}    .byte 0x{value:02x}  {get_comment_mark()} 1 byte\n")
                 else:
                     raise ValueError('Unsupported Architecture')
 
@@ -216,13 +225,11 @@ def generate_data_from_DataUnits(data_segments):
 
         # planting  .data segment only if some entries exist in that section
         if data_code_counter != 0:
-            tmp_data_code += "\n"
-            data_code += tmp_data_code
+            segment_lines.append("\n")
+            output.write("".join(segment_lines))
         else:
-            data_code += f"{get_comment_mark()} No uninitialized data on {segment_name} data segment. skipping .data section\n\n"
+            output.write(f"{get_comment_mark()} No uninitialized data on {segment_name} data segment. skipping .data section\n\n")
             # tmp_data_code += f".space {segment_size}\n"
-        data_code_counter = 0
-        tmp_data_code = ""
 
         # # Now, process uninitialized data (go to .bss section)
         # tmp_data_code += get_output(location="bss_segment_header", segment_name=segment_name)
@@ -297,10 +304,12 @@ def generate_data_from_DataUnits(data_segments):
         # keep the above as is, and dont change to something like the below! regardless to the extra "
         # data_code += f"test_pass_str: .string \"** TEST PASSED OK **\"\n"
 
-    return data_code
-
 
-def generate_assembly():
+def generate_assembly(data_payloads=None):
+    """
+    Write the asm file of the test.
+    data_payloads: optional dict, filled with the random payload of every shared data segment by segment name
+    """
     logger = get_logger()
     state_manager = get_state_manager()
 
@@ -332,14 +341,6 @@ def generate_assembly():
             all_code_segments.insert(0, found)
             break
 
-    # Generate assembly code for instructions and data segments
-    asm_code = generate_asm_from_AsmUnits(all_code_segments)
-    data_code = generate_data_from_DataUnits(all_data_segments)
-
-
-    # Combine the instruction and data parts
-    full_asm_code = asm_code + "\n" + data_code
-
     config_manager = get_config_manager()
     output_dir = config_manager.get_value('output_dir_path')
     if Configuration.Architecture.x86:
@@ -353,9 +354,11 @@ def generate_assembly():
 
     config_manager.set_value('asm_file', asm_file)
 
-    # Output the result to a .s file
+    # Stream the instruction and data parts segment by segment into the .s file
     with open(asm_file, "w") as f:
-        f.write(full_asm_code)
+        generate_asm_from_AsmUnits(all_code_segments, f)
+        f.write("\n")
+        generate_data_from_DataUnits(all_data_segments, f, data_payloads)
 
     logger.info(f"---- Assembly code generated successfully. Check {asm_file}")
 
@@ -388,24 +391,26 @@ def handle_barrier_vector(data_unit):
             return byte_array
 
 
-def generate_random_data_section(data_unit_list, segment_size):
+def generate_random_data_section(data_unit_list, segment_size, payload_file=None, random_generator=None, payload=None):
     """
     Generate assembly code for a data section with random values and embedded labels.
     
-    This function creates assembly directives (.quad, .word, .byte) filled with random 
-    values while ensuring labels are placed at their specified offsets. It processes
-    the entire segment sequentially, placing each label at the exact offset required
-    and filling the spaces between labels with random data.
+    The whole segment payload is drawn at once from the given numpy Generator (the global numpy stream if None), and the labels are
+    spliced in at their specified offsets. The spaces between labels are emitted with the largest data
+    directive that won't overlap with the next label (.quad for 8 bytes, .word for 4 bytes, .byte for
+    1 byte), several values per .quad line, in the little-endian layout of the payload bytes.
     
-    The function tries to use the largest data directive possible (.quad for 8 bytes,
-    .word for 4 bytes, .byte for 1 byte) that won't overlap with the next label,
-    optimizing for both assembly file size and generation efficiency.
+    When a payload_file is given, the payload is written to it as is and the spaces between labels are
+    emitted as `.incbin` slices of that file instead, which keeps large shared segments out of the assembly text.
     
     Args:
         data_unit_list: List of data_unit objects, each containing:
             - label: String with the label name
             - segment_offset: Integer offset within the segment where label should be placed
         segment_size: Total size of the segment in bytes
+        payload_file: Optional path of a binary file to hold the segment payload (.incbin mode)
+        random_generator: Optional numpy Generator to draw the payload from
+        payload: Optional segment payload bytes, already drawn by the caller (random_generator is then unused)
         
     Returns:
         List of strings containing assembly directives with embedded labels
@@ -416,54 +421,67 @@ def generate_random_data_section(data_unit_list, segment_size):
     """
     # Ensure the data_unit_list is sorted by segment_offset
     data_unit_list = sorted(data_unit_list, key=lambda x: x.segment_offset)
-    
-    # Track offset and remaining data units
-    current_offset = 0
-    remaining_units = data_unit_list.copy()
-    
+
+    # Draw the entire segment payload in one go
+    if payload is None:
+        payload = (random_generator if random_generator is not None else np.random).bytes(segment_size)
+
+    if payload_file is not None:
+        with open(payload_file, "wb") as f:
+            f.write(payload)
+        incbin_directive = "incbin" if (Configuration.Architecture.x86 and x86_Assembler_syntax == "NASM") else ".incbin"
+        incbin_name = os.path.basename(payload_file)
+
     # Assembly output
     assembly_lines = []
-    
-    # Process until we've covered the entire segment
+
+    # Walk the segment from label to label
+    current_offset = 0
+    unit_index = 0
+    unit_count = len(data_unit_list)
     while current_offset < segment_size:
-        # Check if we need to output labels at this offset
-        labels_at_current_offset = []
-        
-        while remaining_units and remaining_units[0].segment_offset == current_offset:
-            labels_at_current_offset.append(remaining_units.pop(0).name)
-        
         # Output any labels at this position
-        for label in labels_at_current_offset:
-            assembly_lines.append(f"{label}:")
-        
-        # Determine what size chunk to output next
-        if current_offset + 8 <= segment_size:
-            # No label in the way, can output a quad
-            next_label_offset = remaining_units[0].segment_offset if remaining_units else segment_size
-            if current_offset + 8 <= next_label_offset:
-                # Generate random 8-byte value
-                random_value = random.randint(0, 0xFFFFFFFFFFFFFFFF)
-                assembly_lines.append(f"    .quad 0x{random_value:016x}")
-                current_offset += 8
-                continue
-        
-        if current_offset + 4 <= segment_size:
-            # Try a word
-            next_label_offset = remaining_units[0].segment_offset if remaining_units else segment_size
-            if current_offset + 4 <= next_label_offset:
-                # Generate random 4-byte value
-                random_value = random.randint(0, 0xFFFFFFFF)
-                assembly_lines.append(f"    .word 0x{random_value:08x}")
-                current_offset += 4
-                continue
-        
-        # Just output a byte
-        random_value = random.randint(0, 0xFF)
-        assembly_lines.append(f"    .byte 0x{random_value:02x}")
-        current_offset += 1
-    
+        while unit_index < unit_count and data_unit_list[unit_index].segment_offset == current_offset:
+            assembly_lines.append(f"{data_unit_list[unit_index].name}:")
+            unit_index += 1
+
+        next_label_offset = data_unit_list[unit_index].segment_offset if unit_index < unit_count else segment_size
+        if not current_offset < next_label_offset <= segment_size:
+            next_label_offset = segment_size
+
+        if payload_file is not None:
+            assembly_lines.append(f'    {incbin_directive} "{incbin_name}", {current_offset}, {next_label_offset - current_offset}')
+        else:
+            assembly_lines.extend(_format_random_data(payload, current_offset, next_label_offset))
+        current_offset = next_label_offset
+
     # Verify all labels were processed
-    if remaining_units:
-        print(f"WARNING: {len(remaining_units)} labels were not placed because their offsets exceed segment size")
-    
-    return assembly_lines
\ No newline at end of file
+    if unit_index < unit_count:
+        print(f"WARNING: {unit_count - unit_index} labels were not placed because their offsets exceed segment size")
+
+    return assembly_lines
+
+
+def _format_random_data(payload, start, end):
+    """
+    Emit payload[start:end] as .quad lines (RANDOM_DATA_QUADS_PER_LINE values each), then a .word and .byte tail.
+    """
+    lines = []
+    quad_count = (end - start) // 8
+    if quad_count:
+        # byte-swap every 8 bytes, so a single hex() gives the little-endian quad values back to back
+        quad_bytes = np.frombuffer(payload, dtype=np.uint8, count=quad_count * 8, offset=start)
+        quad_hex = quad_bytes.reshape(quad_count, 8)[:, ::-1].tobytes().hex()
+        quad_values = [f"0x{quad_hex[i:i + 16]}" for i in range(0, len(quad_hex), 16)]
+        for i in range(0, quad_count, RANDOM_DATA_QUADS_PER_LINE):
+            lines.append(f"    .quad {', '.join(quad_values[i:i + RANDOM_DATA_QUADS_PER_LINE])}")
+        start += quad_count * 8
+
+    if end - start >= 4:
+        lines.append(f"    .word 0x{int.from_bytes(payload[start:start + 4], 'little'):08x}")
+        start += 4
+
+    for offset in range(start, end):
+        lines.append(f"    .byte 0x{payload[offset]:02x}")
+
+    return lines
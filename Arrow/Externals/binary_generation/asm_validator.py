@@ -0,0 +1,215 @@
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from typing import Dict, List, Tuple
+from peewee import Model, SqliteDatabase, CharField, TextField, BooleanField, CompositeKey, PeeweeException
+from Arrow.Utils.logger_management import get_logger
+from Arrow.Utils.singleton_management import SingletonManager
+
+"""
+File: asm_validator.py
+
+Description:
+Batched assembler validation of generated instructions (Debug_mode + Create_binary).
+Instead of forking the assembler once per instruction, candidates are written into a single `.s` file
+(one instruction per line, each preceded by a marker comment), assembled once, and the assembler errors
+are mapped back to the instructions by their line numbers.
+
+Results are memoized in-process and persisted in a small SQLite cache (keyed by toolchain + instruction text),
+so known-good/known-bad instructions are never re-assembled across runs. The toolchain key includes the assembler
+identity (resolved path, mtime and first `--version` line), so an assembler upgrade starts from a fresh set of results.
+
+Usage:
+    validator = get_asm_validator()
+    results = validator.validate(["add x1, x2, x3", "ldr x0, [x1, #3]"])   # [(True, ""), (False, "...Error...")]
+"""
+
+# Maximum number of instructions assembled in a single assembler invocation
+ASM_VALIDATION_BATCH_SIZE = 1024
+
+asm_validation_db = SqliteDatabase(None)
+
+
+class AsmValidationResult(Model):
+    toolchain = CharField()     # assembler identity and flags the result was computed with
+    instruction = TextField()   # instruction text, without comments
+    is_valid = BooleanField()
+    error = TextField(default="")
+
+    class Meta:
+        database = asm_validation_db
+        primary_key = CompositeKey('toolchain', 'instruction')
+
+
+def get_asm_validation_cache_path() -> str:
+    cache_path = os.environ.get('ARROW_ASM_VALIDATION_CACHE')
+    if cache_path:
+        return cache_path
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, 'db_manager', 'db', 'asm_validation_cache.db')
+
+
+class AsmValidator:
+    def __init__(self, assembler: str = "aarch64-unknown-linux-gnu-as", flags: str = "-march=armv9-a+cssc+bf16+crypto"):
+        self.assembler = assembler
+        self.flags = flags
+        self.toolchain = f"{assembler} {flags} [{self._assembler_identity()}]"
+        self._known: Dict[str, Tuple[bool, str]] = {}
+        self._persistent = self._load_cache()
+
+    def _tool_env(self) -> Dict[str, str]:
+        # Create local environment with Arrow tool paths
+        env = os.environ.copy()
+        if 'ARROW_TOOL_PATH' in os.environ:
+            env['PATH'] = os.environ['ARROW_TOOL_PATH']
+        return env
+
+    def _assembler_identity(self) -> str:
+        """Resolved path, mtime and first `--version` line of the assembler, to key the persistent results."""
+        env = self._tool_env()
+        assembler_path = shutil.which(self.assembler, path=env.get('PATH'))
+        if assembler_path is None:
+            return "not found"
+        assembler_path = os.path.realpath(assembler_path)
+        try:
+            version = subprocess.run([assembler_path, "--version"], capture_output=True, text=True, env=env,
+                                     timeout=10).stdout.splitlines()
+            version = version[0].strip() if version else ""
+        except (OSError, subprocess.SubprocessError):
+            version = ""
+        return f"{assembler_path}@{os.stat(assembler_path).st_mtime_ns}: {version}"
+
+    def _load_cache(self) -> bool:
+        """Load the known results of this toolchain from the persistent cache. Returns False if the cache is unusable."""
+        logger = get_logger()
+        try:
+            cache_path = get_asm_validation_cache_path()
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            if asm_validation_db.is_closed():
+                asm_validation_db.init(cache_path, pragmas={'journal_mode': 'wal', 'busy_timeout': 5000})
+                asm_validation_db.connect()
+            asm_validation_db.create_tables([AsmValidationResult], safe=True)
+            query = AsmValidationResult.select().where(AsmValidationResult.toolchain == self.toolchain).tuples()
+            for _, instruction, is_valid, error in query.iterator():
+                self._known[instruction] = (is_valid, error)
+        except (OSError, PeeweeException) as e:
+            logger.warning(f"AsmValidator: persistent cache is not available, validating in-memory only ({e})")
+            return False
+        logger.info(f"AsmValidator: loaded {len(self._known)} known instructions for '{self.toolchain}'")
+        return True
+
+    def _store(self, results: Dict[str, Tuple[bool, str]]) -> None:
+        self._known.update(results)
+        if not self._persistent or not results:
+            return
+        rows = [{'toolchain': self.toolchain, 'instruction': instruction, 'is_valid': is_valid, 'error': error}
+                for instruction, (is_valid, error) in results.items()]
+        try:
+            with asm_validation_db.atomic():
+                # SQLite limits the number of bound variables per statement
+                for i in range(0, len(rows), 100):
+                    AsmValidationResult.insert_many(rows[i:i + 100]).on_conflict_replace().execute()
+        except PeeweeException as e:
+            get_logger().warning(f"AsmValidator: failed to update the persistent cache ({e})")
+            self._persistent = False
+
+    def validate(self, instructions: List[str]) -> List[Tuple[bool, str]]:
+        """
+        Validate the given instructions with the assembler.
+
+        Args:
+            instructions: asm text of each instruction (comments are allowed but reduce cache hits).
+
+        Returns:
+            A (success, error) tuple per instruction, in the same order.
+        """
+        unknown = list(dict.fromkeys(instruction for instruction in instructions if instruction not in self._known))
+        for i in range(0, len(unknown), ASM_VALIDATION_BATCH_SIZE):
+            self._store(self._assemble_batch(unknown[i:i + ASM_VALIDATION_BATCH_SIZE]))
+        return [self._known[instruction] for instruction in instructions]
+
+    def _run_assembler(self, asm_path: str, obj_path: str) -> subprocess.CompletedProcess:
+        cmd = [self.assembler] + self.flags.split() + ["-o", obj_path, asm_path]
+        return subprocess.run(cmd, capture_output=True, text=True, env=self._tool_env())
+
+    def _assemble_batch(self, instructions: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Assemble all instructions in one file and map the reported errors back to their lines.
+        Instructions that can't be attributed safely (multi-line text, unmapped errors) are assembled one by one.
+        """
+        single_line = [instruction for instruction in instructions if "\n" not in instruction]
+        results = {instruction: self._assemble_single(instruction) for instruction in instructions if "\n" in instruction}
+        if not single_line:
+            return results
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            asm_path = os.path.join(tmpdir, "test.s")
+            obj_path = os.path.join(tmpdir, "test.o")
+
+            # Wrap instructions in minimal valid ASM, with a marker line before each instruction
+            lines = ["\t.text", "\t.global _start", "_start:"]
+            line_to_instruction = {}
+            for index, instruction in enumerate(single_line):
+                lines.append(f"// arrow_validate {index}")
+                lines.append(f"\t{instruction}")
+                line_to_instruction[len(lines)] = instruction  # assembler line numbers are 1-based
+            with open(asm_path, "w") as f:
+                f.write("\n".join(lines) + "\n")
+
+            result = self._run_assembler(asm_path, obj_path)
+
+        if result.returncode == 0:
+            results.update((instruction, (True, "")) for instruction in single_line)
+            return results
+
+        # map '<file>:<line>: Error: <message>' back to the instruction on that line
+        errors: Dict[str, List[str]] = {}
+        unmapped_error = False
+        error_pattern = re.compile(rf"^{re.escape(asm_path)}:(\d+): (?:Fatal )?[Ee]rror: (.*)$")
+        for line in result.stderr.splitlines():
+            match = error_pattern.match(line)
+            if match is None:
+                continue
+            instruction = line_to_instruction.get(int(match.group(1)))
+            if instruction is None:
+                unmapped_error = True
+                continue
+            errors.setdefault(instruction, []).append(line)
+
+        if unmapped_error or not errors:
+            # failure can't be attributed to specific lines, fall back to one assembler run per instruction
+            results.update((instruction, self._assemble_single(instruction)) for instruction in single_line)
+            return results
+
+        for instruction in single_line:
+            if instruction in errors:
+                results[instruction] = (False, "Assembler messages:\n" + "\n".join(errors[instruction]) + "\n")
+            else:
+                results[instruction] = (True, "")
+        return results
+
+    def _assemble_single(self, instruction: str) -> Tuple[bool, str]:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            asm_path = os.path.join(tmpdir, "test.s")
+            obj_path = os.path.join(tmpdir, "test.o")
+
+            # Wrap instruction in minimal valid ASM
+            with open(asm_path, "w") as f:
+                f.write(f"\t.text\n\t.global _start\n_start:\n\t{instruction}\n")
+
+            result = self._run_assembler(asm_path, obj_path)
+        if result.returncode == 0:
+            return True, ""
+        return False, result.stderr
+
+
+# Factory function to retrieve the AsmValidator instance
+def get_asm_validator() -> AsmValidator:
+    # Access or initialize the singleton variable
+    asm_validator_instance = SingletonManager.get("asm_validator_instance", default=None)
+    if asm_validator_instance is None:
+        asm_validator_instance = AsmValidator()
+        SingletonManager.set("asm_validator_instance", asm_validator_instance)
+    return asm_validator_instance
@@ -1,9 +1,6 @@
 import os
 from Arrow.Utils.logger_management import get_logger
 from Arrow.Utils.configuration_management import Configuration, get_config_manager
-from Arrow.Externals.binary_generation.arm_binary import ArmBuildPipeline
-from Arrow.Externals.binary_generation.riscv_binary import RiscvBuildPipeline
-from Arrow.Externals.binary_generation.x86_binary import x86BuildPipeline
 from Arrow.Externals.binary_generation.merge_asm_objdump import merge_files
 
 def generate_binary():
@@ -27,12 +24,16 @@ def generate_binary():
     iss_prerun_log_file = os.path.join(output_dir, f"iss_prerun.log")
     debug_aid_file = os.path.join(output_dir, f"{base_name}_debug_aid.asm")
 
+    # architecture specific modules are loaded on demand, only the running architecture is imported
     pipeline = None
     if Configuration.Architecture.x86:
+        from Arrow.Externals.binary_generation.x86_binary import x86BuildPipeline
         pipeline = x86BuildPipeline()
     elif Configuration.Architecture.arm:
+        from Arrow.Externals.binary_generation.arm_binary import ArmBuildPipeline
         pipeline = ArmBuildPipeline()
     elif Configuration.Architecture.riscv:
+        from Arrow.Externals.binary_generation.riscv_binary import RiscvBuildPipeline
         pipeline = RiscvBuildPipeline()
     else:
         raise ValueError(f"Unknown Architecture requested")
@@ -36,7 +36,7 @@ class RiscvBuildPipeline(BuildPipeline):
         tool = f"{self.toolchain_prefix}-as"
         check_tool_exists(tool)
 
-        assemble_cmd = [tool, "-o", object_file, assembly_file]
+        assemble_cmd = [tool, "-I", os.path.dirname(os.path.abspath(assembly_file)), "-o", object_file, assembly_file]
         check_file_exists(assembly_file, "Assembly File")
         run_command(assemble_cmd, f"Assembling '{assembly_file}' to '{object_file}'")
 
@@ -32,7 +32,7 @@ class x86BuildPipeline(BuildPipeline):
         tool = "nasm"
         check_tool_exists(tool)
 
-        assemble_cmd = [tool, "-f", "win64", assembly_file, "-o", object_file]
+        assemble_cmd = [tool, "-f", "win64", "-i", os.path.dirname(os.path.abspath(assembly_file)) + os.sep, assembly_file, "-o", object_file]
         check_file_exists(assembly_file, "Assembly File")
         run_command(assemble_cmd, f"Assembling '{assembly_file}' to '{object_file}'")
 
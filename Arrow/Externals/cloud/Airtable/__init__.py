@@ -1,29 +1,28 @@
-import requests
-
+import time
+from typing import Callable, Dict, List, Optional, Tuple
 
 ## Airtable API endpoint
 # BASE_ID = 'appOJKrcvb4gxH65d'
 # TABLE_NAME = 'run_statistics'
 # URL = f"https://api.airtable.com/v0/{BASE_ID}/{TABLE_NAME}"
 
-# Function to upload run statistics
-def upload_run_statistics(template, command_line, duration, architecture, cloud_mode, system_metadata, user_id,
-                          run_status: str = "Pass"):
-    """Send data to the backend for asynchronous Airtable upload."""
+UPLOAD_URL = "https://szoharbu.pythonanywhere.com/upload"
 
-    UPLOAD_URL = "https://szoharbu.pythonanywhere.com/upload"
+'''
+To view Airtable statistics:
+- enter: https://airtable.com/appOJKrcvb4gxH65d/tblWab8HLi2azhcxJ
 
-    '''
-    To view Airtable statistics:
-    - enter: https://airtable.com/appOJKrcvb4gxH65d/tblWab8HLi2azhcxJ
+To debug PythoneAnywhare issues:
+- enter https://www.pythonanywhere.com/user/szoharbu/
+- click on the Web tab
+- see Error log 
+'''
 
-    To debug PythoneAnywhare issues:
-    - enter https://www.pythonanywhere.com/user/szoharbu/
-    - click on the Web tab
-    - see Error log 
-    '''
 
-    upload_data = {
+def build_run_record(template, command_line, duration, architecture, cloud_mode, system_metadata, user_id,
+                     run_status: str = "Pass") -> Dict:
+    """Build the backend record of a single run."""
+    return {
         "Template": str(template),
         "Command Line": command_line,
         "Duration": duration,
@@ -34,12 +33,83 @@ def upload_run_statistics(template, command_line, duration, architecture, cloud_
         "System Metadata": system_metadata
     }
 
+
+RETRIED_STATUS_CODES = (408, 429)  # request timeout and rate limit, retried like the 5xx errors
+MAX_RETRY_AFTER = 30.0  # seconds, cap of a backend Retry-After delay
+
+
+def _is_retried(status_code: int) -> bool:
+    return status_code >= 500 or status_code in RETRIED_STATUS_CODES
+
+
+def _retry_delay(response, backoff: float, attempt: int) -> float:
+    """Exponential backoff, or the backend Retry-After (in seconds) if longer."""
+    delay = backoff * (2 ** attempt)
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    try:
+        delay = max(delay, min(float(retry_after), MAX_RETRY_AFTER))
+    except (TypeError, ValueError):
+        pass  # missing, or an HTTP date
+    return delay
+
+
+def post_run_records(records: List[Dict], url: str = UPLOAD_URL, timeout: float = 5.0, retries: int = 2,
+                     backoff: float = 0.5,
+                     on_processed: Optional[Callable[[int, Optional[Dict]], None]] = None) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Post records to the backend over a single keep-alive session, one record per request (the format the backend
+    accepts). Every request is bounded by `timeout` seconds, and retried up to `retries` times with an exponential
+    backoff on connection errors, 5xx, 408 and 429 responses. Once the backend is found unreachable the remaining
+    records are not attempted.
+    on_processed(index, rejected_entry) is called once each record was sent (rejected_entry None) or rejected.
+
+    Returns:
+        tuple: (unsent, rejected), the records that were not sent, in order, and the records the backend refused
+        with another 4xx status, as {"record": record, "status": status_code, "response": response text} entries.
+    """
+    import requests
+
+    headers = {"Content-Type": "application/json"}
+    rejected = []
+    with requests.Session() as session:
+        for index, record in enumerate(records):
+            for attempt in range(retries + 1):
+                response = None
+                try:
+                    response = session.post(url, json=record, headers=headers, timeout=timeout)
+                except requests.exceptions.RequestException:
+                    pass
+                if response is not None and not _is_retried(response.status_code):
+                    rejected_entry = None
+                    if response.status_code >= 400:
+                        rejected_entry = {"record": record, "status": response.status_code,
+                                          "response": response.text[:500]}
+                        rejected.append(rejected_entry)
+                    if on_processed is not None:
+                        on_processed(index, rejected_entry)
+                    break
+                if attempt < retries:
+                    time.sleep(_retry_delay(response, backoff, attempt))
+            else:
+                return records[index:], rejected
+    return [], rejected
+
+
+# Function to upload run statistics
+def upload_run_statistics(template, command_line, duration, architecture, cloud_mode, system_metadata, user_id,
+                          run_status: str = "Pass"):
+    """Send data to the backend for asynchronous Airtable upload, synchronously (see statistics_spool for the
+    non-blocking path used by main)."""
     from Arrow.Utils.logger_management import get_logger
     logger = get_logger()
-    try:
-        headers = {"Content-Type": "application/json"}
-        requests.post(UPLOAD_URL, json=upload_data, headers=headers)
-        logger.info("Data sent to backend successfully.")
-    except requests.exceptions.RequestException as e:
-        logger.error("Failed to send data to backend:", e)
 
+    upload_data = build_run_record(template=template, command_line=command_line, duration=duration,
+                                   architecture=architecture, cloud_mode=cloud_mode, system_metadata=system_metadata,
+                                   user_id=user_id, run_status=run_status)
+    unsent, rejected = post_run_records([upload_data])
+    if unsent:
+        logger.error("Failed to send data to backend")
+    elif rejected:
+        logger.error(f"Backend rejected the data: status {rejected[0]['status']}, {rejected[0]['response']}")
+    else:
+        logger.info("Data sent to backend successfully.")
@@ -0,0 +1,244 @@
+import os
+import sys
+import json
+import atexit
+import argparse
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows, spool access is not serialized between processes
+    fcntl = None
+
+"""
+File: statistics_spool.py
+
+Description:
+Local spool of run statistics. A run only appends its record to a JSON-lines spool file, and waits on the network
+at most EXIT_FLUSH_TIMEOUT seconds; the spooled records are posted in batches, with bounded timeouts and retries, by:
+    - a daemon background thread started by the run, waited for at most EXIT_FLUSH_TIMEOUT seconds at exit, or
+    - the `flush` entry point, e.g. from a cron job of a farm.
+
+Each record is marked processed (the spool offset file, <spool>.offset) as soon as it was sent, and the processed
+head is removed from the spool after every batch and before every flush, so a flush interrupted at any point resends at most one record on
+the next flush (at-least-once delivery). Records the backend refuses (a 4xx other than 408 and
+429) are not retried, they are moved with the backend response to a dead-letter file next to the spool
+(<spool>.rejected) and logged.
+A single flush runs at a time per spool file, concurrent runs keep appending while it posts.
+
+The spool path is $ARROW_STATISTICS_SPOOL, or ~/.arrow/statistics_spool.jsonl by default, and records are posted
+to $ARROW_STATISTICS_URL, or to the Airtable backend by default.
+
+Usage (from the project root):
+    python -m Arrow.Externals.cloud.statistics_spool flush
+    python -m Arrow.Externals.cloud.statistics_spool flush --url http://localhost:8000/upload --timeout 2
+    python -m Arrow.Externals.cloud.statistics_spool status
+"""
+
+SPOOL_ENV_VARIABLE = "ARROW_STATISTICS_SPOOL"
+URL_ENV_VARIABLE = "ARROW_STATISTICS_URL"
+EXIT_FLUSH_TIMEOUT = 2.0  # seconds a run waits at exit for its background flush
+
+
+def get_rejected_path(spool_path: str) -> str:
+    """Dead-letter file of the records rejected by the backend."""
+    return spool_path + ".rejected"
+
+
+def get_spool_path() -> str:
+    spool_path = os.environ.get(SPOOL_ENV_VARIABLE)
+    if spool_path:
+        return spool_path
+    return os.path.join(os.path.expanduser("~"), ".arrow", "statistics_spool.jsonl")
+
+
+@contextmanager
+def _locked(lock_path: str, blocking: bool = True):
+    """Hold an exclusive lock on lock_path, yields False if non-blocking and the lock is already held."""
+    os.makedirs(os.path.dirname(os.path.abspath(lock_path)), exist_ok=True)
+    with open(lock_path, "a") as lock_file:
+        if fcntl is None:
+            yield True
+            return
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def append_record(record: Dict, spool_path: Optional[str] = None) -> None:
+    """Append a record to the spool, a local file write only."""
+    spool_path = spool_path or get_spool_path()
+    line = json.dumps(record, default=str) + "\n"
+    with _locked(spool_path + ".lock"):
+        with open(spool_path, "a") as spool_file:
+            spool_file.write(line)
+
+
+def read_records(spool_path: Optional[str] = None) -> List[Dict]:
+    """The records of the spool not processed yet."""
+    spool_path = spool_path or get_spool_path()
+    with _locked(spool_path + ".lock"):
+        return _read_lines(spool_path, _read_offset(spool_path))[0]
+
+
+def _read_lines(spool_path: str, offset: int = 0):
+    """
+    Returns the parsed records of the spool from byte `offset` on and, for each record, the byte offset right after
+    its line. Lines that can't be parsed are skipped.
+    """
+    if not os.path.exists(spool_path):
+        return [], []
+    with open(spool_path, "rb") as spool_file:
+        spool_file.seek(offset)
+        content = spool_file.read()
+    records = []
+    line_ends = []
+    for line in content.splitlines(keepends=True):
+        offset += len(line)
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue  # a truncated line (e.g. disk full), would never parse
+        line_ends.append(offset)
+    return records, line_ends
+
+
+def _read_offset(spool_path: str) -> int:
+    """
+    Bytes at the head of the spool already processed (sent or dead-lettered), see _write_offset.
+    The offset file names the inode of the spool it belongs to, an offset left from before a compaction is ignored.
+    """
+    try:
+        with open(spool_path + ".offset") as offset_file:
+            inode, offset = map(int, offset_file.read().split())
+        return offset if inode == os.stat(spool_path).st_ino else 0
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_offset(spool_path: str, offset: int) -> None:
+    temp_path = spool_path + ".offset.tmp"
+    with open(temp_path, "w") as offset_file:
+        offset_file.write(f"{os.stat(spool_path).st_ino} {offset}")
+    os.replace(temp_path, spool_path + ".offset")
+
+
+def _compact(spool_path: str) -> None:
+    """Remove the processed head of the spool."""
+    with _locked(spool_path + ".lock"):
+        offset = _read_offset(spool_path)
+        if not offset:
+            return
+        with open(spool_path, "rb") as spool_file:
+            spool_file.seek(offset)
+            remaining = spool_file.read()
+        temp_path = spool_path + ".tmp"
+        with open(temp_path, "wb") as temp_file:
+            temp_file.write(remaining)
+        os.replace(temp_path, spool_path)
+        _write_offset(spool_path, 0)
+
+
+def flush_spool(spool_path: Optional[str] = None, url: Optional[str] = None, timeout: float = 5.0,
+                retries: int = 2, batch_size: int = 100) -> Optional[Dict]:
+    """
+    Post the spooled records, batch_size records at a time. The spool offset is moved past every record once it was
+    sent or dead-lettered, so a flush interrupted at any point (e.g. the run exiting) resends at most the record it
+    was posting, and the processed records are removed from the spool after every batch.
+
+    Records rejected by the backend are moved to the dead-letter file (get_rejected_path).
+
+    Returns:
+        dict: {"sent": n, "pending": m, "rejected": r}, or None if another flush of this spool is already running.
+    """
+    from Arrow.Externals.cloud.Airtable import UPLOAD_URL, post_run_records
+    spool_path = spool_path or get_spool_path()
+    url = url or os.environ.get(URL_ENV_VARIABLE) or UPLOAD_URL
+
+    with _locked(spool_path + ".flush.lock", blocking=False) as acquired:
+        if not acquired:
+            return None
+
+        _compact(spool_path)  # the head processed by a flush cut short
+        with _locked(spool_path + ".lock"):
+            records, line_ends = _read_lines(spool_path, _read_offset(spool_path))
+
+        counts = {"sent": 0, "rejected": 0}
+        for start in range(0, len(records), batch_size):
+            def _processed(index: int, rejected_entry: Optional[Dict]) -> None:
+                with _locked(spool_path + ".lock"):
+                    if rejected_entry is not None:
+                        with open(get_rejected_path(spool_path), "a") as rejected_file:
+                            rejected_file.write(json.dumps(rejected_entry, default=str) + "\n")
+                    _write_offset(spool_path, line_ends[start + index])
+                counts["sent" if rejected_entry is None else "rejected"] += 1
+
+            unsent, _ = post_run_records(records[start:start + batch_size], url=url, timeout=timeout,
+                                         retries=retries, on_processed=_processed)
+            _compact(spool_path)
+            if unsent:
+                break  # backend unreachable, keep the rest for the next flush
+
+        return {**counts, "pending": len(read_records(spool_path))}
+
+
+def start_background_flush(spool_path: Optional[str] = None, url: Optional[str] = None,
+                           timeout: float = 5.0, exit_timeout: float = EXIT_FLUSH_TIMEOUT) -> threading.Thread:
+    """
+    Flush the spool from a daemon thread. At exit the process waits for it at most exit_timeout seconds, what was not
+    posted by then stays spooled for the next flush.
+    """
+    def _flush():
+        try:
+            result = flush_spool(spool_path, url=url, timeout=timeout)
+            if result and result["rejected"]:
+                from Arrow.Utils.logger_management import get_logger
+                get_logger().warning(f"Statistics backend rejected {result['rejected']} records, kept in "
+                                     f"{get_rejected_path(spool_path or get_spool_path())}")
+        except Exception:
+            pass  # statistics must never fail a run, the records stay spooled
+
+    flush_thread = threading.Thread(target=_flush, name="statistics_flush", daemon=True)
+    flush_thread.start()
+    atexit.register(flush_thread.join, exit_timeout)
+    return flush_thread
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Arrow run statistics spool")
+    parser.add_argument('command', choices=['flush', 'status'])
+    parser.add_argument('--spool', type=str, help=f'Spool file. Defaults to ${SPOOL_ENV_VARIABLE} or {get_spool_path()}.')
+    parser.add_argument('--url', type=str, help=f'Backend upload URL. Defaults to ${URL_ENV_VARIABLE} or the Airtable backend.')
+    parser.add_argument('--timeout', type=float, default=5.0, help='Timeout in seconds of every request.')
+    parser.add_argument('--retries', type=int, default=2, help='Retries of every request before giving up.')
+    parser.add_argument('--batch_size', type=int, default=100, help='Records posted per batch.')
+    args = parser.parse_args(args)
+
+    spool_path = args.spool or get_spool_path()
+    if args.command == 'status':
+        print(json.dumps({"spool": spool_path, "pending": len(read_records(spool_path)),
+                          "rejected": len(read_records(get_rejected_path(spool_path)))}))
+        return 0
+
+    result = flush_spool(spool_path, url=args.url, timeout=args.timeout, retries=args.retries,
+                         batch_size=args.batch_size)
+    if result is None:
+        print(json.dumps({"spool": spool_path, "error": "another flush is running"}))
+        return 1
+    if result["rejected"]:
+        print(f"{result['rejected']} records rejected by the backend, moved to {get_rejected_path(spool_path)}",
+              file=sys.stderr)
+    print(json.dumps({"spool": spool_path, **result}))
+    return 0 if result["pending"] == 0 and result["rejected"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
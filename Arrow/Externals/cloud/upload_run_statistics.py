@@ -8,9 +8,11 @@ def upload_statistics(duration, run_status):
     - Status : Pass / Fail
     - Start time
     - Duration
+
+    The record is only appended to the local statistics spool, and posted by a background flush (or the
+    `statistics_spool flush` entry point), so the run never waits on the network.
     '''
     import os
-    from Arrow.Externals.cloud.Airtable import upload_run_statistics
     from Arrow.Utils.configuration_management import get_config_manager
 
     config_manager = get_config_manager()
@@ -18,6 +20,11 @@ def upload_statistics(duration, run_status):
     if not upload_stats:
         return
 
+    # only imported when uploading, the network client itself is imported by the background flush
+    from Arrow.Externals.cloud.Airtable import build_run_record
+    from Arrow.Externals.cloud.statistics_spool import append_record, start_background_flush
+    from Arrow.Utils.logger_management import get_logger
+
     template_path = config_manager.get_value('template_path')
     template_name = os.path.basename(template_path)
     command_line = config_manager.get_value('command_line_string')
@@ -40,15 +47,21 @@ def upload_statistics(duration, run_status):
         user_id = get_anonymized_user()
 
 
-    upload_run_statistics(template=template_name,
-                          command_line=command_line,
-                          duration=duration,
-                          run_status=run_status,
-                          architecture=architecture,
-                          cloud_mode=cloud_mode,
-                          system_metadata=system_summary,
-                          user_id=user_id,
-                          )
+    record = build_run_record(template=template_name,
+                              command_line=command_line,
+                              duration=duration,
+                              run_status=run_status,
+                              architecture=architecture,
+                              cloud_mode=cloud_mode,
+                              system_metadata=system_summary,
+                              user_id=user_id,
+                              )
+    try:
+        append_record(record)
+    except OSError as e:
+        get_logger().warning(f"Failed to spool run statistics: {e}")
+        return
+    start_background_flush()
 
 
 
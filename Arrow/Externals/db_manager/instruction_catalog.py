@@ -0,0 +1,176 @@
+import ast
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from Arrow.Utils.configuration_management import Configuration
+from Arrow.Utils.logger_management import get_logger
+from Arrow.Utils.singleton_management import SingletonManager
+from Arrow.Externals.db_manager.models import get_instruction_db
+
+"""
+File: instruction_catalog.py
+
+Description:
+In-memory snapshot of the instruction DB. The `Instruction` (and for ARM, the `Operand`) tables are
+read once into column arrays, with every instruction's operand list pre-parsed, so instruction picks
+during generation are plain index lookups instead of SQL round-trips.
+
+Usage:
+    catalog = get_instruction_catalog()
+    candidate_indices = catalog.lookup(query_filter)   # one SQL query, primary keys only
+    selected_instruction = catalog.get(candidate_indices[i])
+
+    # memoized, is_valid pre-filtered candidate set for a canonical filter key
+    candidate_indices = catalog.get_candidates(cache_key, build_query_filter)
+"""
+
+# Maximum number of distinct filters kept in the candidate-set cache (least recently used are evicted)
+CANDIDATE_CACHE_SIZE = 256
+
+
+class CatalogRecord:
+    """
+    Lightweight, ORM-free row of the instruction DB.
+    Exposes the same attribute names as the peewee models, so generation code can consume it transparently.
+    """
+
+    def __init__(self, fields: Dict[str, Any]):
+        self.__dict__.update(fields)
+
+    def __repr__(self):
+        return f"CatalogRecord({self.__dict__})"
+
+
+class InstructionCatalog:
+    """
+    Holds the full instruction table of a single architecture in memory.
+
+    Columns are kept as parallel lists indexed by catalog position (DB row order), operand lists are
+    pre-parsed and sorted in DB order, and `_index_by_key` maps each primary key back to its position.
+    """
+
+    def __init__(self, architecture: str):
+        logger = get_logger()
+        logger.info(f"============ InstructionCatalog: loading {architecture} instructions")
+
+        self.architecture = architecture
+
+        db_models = get_instruction_db(architecture)
+        if isinstance(db_models, dict):
+            # ARM ASL case - Instruction and Operand tables
+            self.Instruction = db_models['Instruction']
+            Operand = db_models['Operand']
+        else:
+            self.Instruction = db_models
+            Operand = None
+
+        self.primary_key = self.Instruction._meta.primary_key
+        self.field_names: List[str] = [field.name for field in self.Instruction._meta.sorted_fields]
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.field_names}
+        self.operands: List[list] = []
+        self._index_by_key: Dict[Any, int] = {}
+        self._records: List[Optional[CatalogRecord]] = []
+        self._candidate_cache: OrderedDict[Hashable, Tuple[int, ...]] = OrderedDict()
+
+        for row in self.Instruction.select().dicts().iterator():
+            self._index_by_key[row[self.primary_key.name]] = len(self._records)
+            for name in self.field_names:
+                self.columns[name].append(row[name])
+            self._records.append(None)
+
+        if Operand is not None:
+            operand_fields = [field.name for field in Operand._meta.sorted_fields]
+            self.operands = [[] for _ in self._records]
+            for row in Operand.select().order_by(Operand.id).tuples().iterator():
+                operand = CatalogRecord(dict(zip(operand_fields, row)))
+                self.operands[self._index_by_key[operand.instruction]].append(operand)
+        else:
+            # operands are stored as a serialized list of dicts, parse them once here
+            self.operands = [ast.literal_eval(operands) if isinstance(operands, str) else operands
+                             for operands in self.columns['operands']]
+
+        logger.info(f"============ InstructionCatalog: loaded {len(self._records)} instructions")
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def lookup(self, query_filter) -> List[int]:
+        """
+        Resolve a peewee query on the Instruction model into catalog indices.
+        Only the primary key column is fetched, preserving the query row order (and duplicates from joins).
+        """
+        index_by_key = self._index_by_key
+        return [index_by_key[key] for (key,) in query_filter.select(self.primary_key).tuples().iterator()]
+
+    def get(self, index: int) -> CatalogRecord:
+        """
+        Return the instruction record at the given catalog index.
+        Records are built on first access and shared afterwards.
+        """
+        record = self._records[index]
+        if record is None:
+            fields = {name: self.columns[name][index] for name in self.field_names}
+            fields['operands'] = self.operands[index]
+            record = CatalogRecord(fields)
+            self._records[index] = record
+        return record
+
+    def get_candidates(self, cache_key: Optional[Hashable], build_query_filter: Callable) -> Tuple[int, ...]:
+        """
+        Return the valid candidate indices of a filter, resolving and memoizing them on first use.
+
+        Args:
+            cache_key: canonical form of the filter, or None if the filter can't be cached.
+            build_query_filter: callable returning the peewee query for the filter, only called on a cache miss.
+
+        Raises:
+            ValueError: if no instructions, or no valid instructions, match the filter.
+        """
+        if cache_key is not None and cache_key in self._candidate_cache:
+            self._candidate_cache.move_to_end(cache_key)
+            return self._candidate_cache[cache_key]
+
+        candidate_indices = self.lookup(build_query_filter())
+        if not candidate_indices:
+            raise ValueError("No instructions found matching the specified criteria.")
+
+        valid_indices = tuple(index for index in candidate_indices if self.is_valid(index))
+        if not valid_indices:
+            raise ValueError("No valid instructions found matching the specified criteria.")
+
+        if cache_key is not None:
+            self._candidate_cache[cache_key] = valid_indices
+            if len(self._candidate_cache) > CANDIDATE_CACHE_SIZE:
+                self._candidate_cache.popitem(last=False)
+        return valid_indices
+
+    def is_valid(self, index: int) -> bool:
+        if 'is_valid' not in self.columns:
+            # standard DB has no is_valid column, all of its instructions are considered valid
+            return True
+        return bool(self.columns['is_valid'][index])
+
+
+def invalidate_instruction_catalog(architecture: str) -> None:
+    """
+    Drop the catalog (and its candidate-set cache) of an architecture, it will be reloaded on next use.
+    Called whenever the underlying DB binding changes.
+    """
+    catalog_instances = SingletonManager.get("instruction_catalog_instance", default=None)
+    if catalog_instances is not None:
+        catalog_instances.pop(architecture, None)
+
+
+# Factory function to retrieve the InstructionCatalog instance
+def get_instruction_catalog(architecture: str = None) -> InstructionCatalog:
+    # Access or initialize the singleton variable
+    catalog_instances = SingletonManager.get("instruction_catalog_instance", default=None)
+    if catalog_instances is None:
+        catalog_instances = {}
+        SingletonManager.set("instruction_catalog_instance", catalog_instances)
+
+    if architecture is None:
+        architecture = Configuration.Architecture.arch_str
+
+    if architecture not in catalog_instances:
+        catalog_instances[architecture] = InstructionCatalog(architecture)
+    return catalog_instances[architecture]
@@ -153,4 +153,8 @@ def get_instruction_db(architecture:str=None):
 
         SingletonManager.set("model_cache_instance", model_cache_instance)
 
+        # A new DB binding invalidates any in-memory catalog and candidate sets built on top of the previous one
+        from Arrow.Externals.db_manager.instruction_catalog import invalidate_instruction_catalog
+        invalidate_instruction_catalog(architecture)
+
     return model_cache_instance[architecture]
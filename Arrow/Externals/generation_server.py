@@ -0,0 +1,149 @@
+import os
+import sys
+import json
+import socket
+import argparse
+from typing import Dict, IO, Optional
+from Arrow.Externals import run_tool
+
+"""
+File: generation_server.py
+
+Description:
+Long-lived generation server. Python, numpy/peewee, the Arrow infrastructure modules and the instruction catalog are
+loaded once, and every job only pays for its own test (the per-test state is reset between jobs, and the tool,
+content and template modules are re-executed so a seed reproduces the same test as `run_arrow.py` does).
+
+Jobs are JSON objects, one per line, answered by one JSON line each:
+    {"id": 1, "template": "templates/direct_template.py", "seed": 5, "output": "out/job_1",
+     "defines": {"core_count": 2}, "args": ["--arch", "arm"]}
+    -> {"id": 1, "run": "job_1", "seed": 5, "success": true, "duration": 0.41, "output": "/abs/out/job_1"}
+Control requests: {"command": "ping"} and {"command": "shutdown"}.
+
+Usage (from the project root):
+    python -m Arrow.Externals.generation_server --preload arm                  # JSON-lines over stdin/stdout
+    python -m Arrow.Externals.generation_server --socket /tmp/arrow.sock       # JSON-lines over a unix socket
+
+    result = submit_job("/tmp/arrow.sock", {"template": "templates/direct_template.py", "seed": 5})
+"""
+
+
+class GenerationServer:
+    def __init__(self, output_dir: str = "Arrow_output", preload_architectures=()):
+        # paths in requests are relative to where the server was started, the worker runs from the project root
+        self.launch_dir = os.getcwd()
+        self.output_dir = os.path.abspath(output_dir)
+        self.job_count = 0
+        self.running = True
+
+        run_tool._init_regression_worker(run_tool.get_project_root())
+
+        if preload_architectures:
+            from Arrow.Externals.db_manager.instruction_catalog import get_instruction_catalog
+            for architecture in preload_architectures:
+                get_instruction_catalog(architecture)
+
+    def _resolve_template(self, template: str) -> str:
+        template_path = os.path.join(self.launch_dir, template)
+        # anything else is resolved by the tool itself (relative to the content directories)
+        return os.path.abspath(template_path) if os.path.isfile(template_path) else template
+
+    def build_job(self, request: Dict) -> Dict:
+        if "template" not in request:
+            raise ValueError("Job request must include a 'template'")
+        self.job_count += 1
+        run_str = str(request.get("run", f"job_{self.job_count}"))
+
+        args = [str(arg) for arg in request.get("args", [])]
+        for knob_name, value in request.get("defines", {}).items():
+            args += ["--define", f"{knob_name}={value}"]
+
+        output = request.get("output")
+        output = os.path.join(self.launch_dir, output) if output else os.path.join(self.output_dir, run_str)
+        return {
+            "run": run_str,
+            "template": self._resolve_template(request["template"]),
+            "output": os.path.abspath(output),
+            "seed": request.get("seed"),
+            "args": args,
+        }
+
+    def handle_request(self, request: Dict) -> Dict:
+        command = request.get("command", "run")
+        if command == "ping":
+            response = {"success": True, "jobs": self.job_count}
+        elif command == "shutdown":
+            self.running = False
+            response = {"success": True}
+        elif command == "run":
+            response = run_tool.run_tool_in_process(self.build_job(request))
+        else:
+            raise ValueError(f"Unknown command: {command}")
+
+        if "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def serve_stream(self, in_stream: IO[str], out_stream: IO[str]) -> None:
+        """Answer JSON-lines requests read from in_stream, until shutdown or end of stream."""
+        for line in in_stream:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = self.handle_request(request)
+            except Exception as e:  # a bad request must not bring the server down
+                response = {"success": False, "error": f"{type(e).__name__}: {e}"}
+            out_stream.write(json.dumps(response) + "\n")
+            out_stream.flush()
+            if not self.running:
+                break
+
+    def serve_socket(self, socket_path: str) -> None:
+        """Serve clients of a unix socket one at a time (generation is single threaded), until shutdown."""
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server_socket:
+            server_socket.bind(socket_path)
+            server_socket.listen()
+            try:
+                while self.running:
+                    connection, _ = server_socket.accept()
+                    try:
+                        with connection, connection.makefile("r") as reader, connection.makefile("w") as writer:
+                            self.serve_stream(reader, writer)
+                    except OSError:
+                        pass  # client went away, keep serving others
+            finally:
+                os.remove(socket_path)
+
+
+def submit_job(socket_path: str, request: Dict, timeout: Optional[float] = None) -> Dict:
+    """Send a single request to a generation server listening on socket_path, and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client_socket:
+        client_socket.settimeout(timeout)
+        client_socket.connect(socket_path)
+        with client_socket.makefile("w") as writer, client_socket.makefile("r") as reader:
+            writer.write(json.dumps(request) + "\n")
+            writer.flush()
+            client_socket.shutdown(socket.SHUT_WR)
+            return json.loads(reader.readline())
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Arrow warm generation server")
+    parser.add_argument('--socket', type=str, help='Unix socket path to listen on. Defaults to stdin/stdout.')
+    parser.add_argument('--output', type=str, default="Arrow_output", help='Output root of jobs without an output.')
+    parser.add_argument('--preload', nargs='*', default=[], choices=['x86', 'riscv', 'arm'],
+                        help='Architectures whose instruction catalog is loaded at startup.')
+    args = parser.parse_args(args)
+
+    server = GenerationServer(output_dir=args.output, preload_architectures=args.preload)
+    if args.socket:
+        server.serve_socket(args.socket)
+    else:
+        server.serve_stream(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
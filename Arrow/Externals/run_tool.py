@@ -1,5 +1,12 @@
 import os
+import sys
 import subprocess
+import time
+import traceback
+import multiprocessing
+from io import StringIO
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Dict, Iterator, List, Optional
 
 def run_tool(template_path, output_dir, command_line, run_str):
     """
@@ -11,7 +18,7 @@ def run_tool(template_path, output_dir, command_line, run_str):
     env = os.environ.copy()
     if 'ARROW_TOOL_PATH' in os.environ:
         env['PATH'] = os.environ['ARROW_TOOL_PATH']
-    
+
     result = subprocess.run(command_line, capture_output=True, text=True, env=env)
 
     # Save the result to the specified directory
@@ -24,3 +31,142 @@ def run_tool(template_path, output_dir, command_line, run_str):
     print(f" TEST {run_str}: {status}")
     # Return the return code for success/failure tracking
     return result.returncode == 0  # True if success, False if failure
+
+
+"""
+Regression engine
+
+Instead of paying interpreter startup, third-party imports and DB open per run, each job is executed in-process by a
+pool of long-lived worker processes. Between jobs a worker resets all tool structures (final_stage.reset_tool) and
+unloads the tool modules, so every job starts from the same state as a fresh `run_arrow.py` invocation and a seed
+reproduces the same test as it would from the command line.
+
+Usage:
+    jobs = [{"run": "arm_direct_template.py_seed_1", "template": "templates/direct_template.py",
+             "output": "regression/arm_1", "seed": 1, "args": ["--arch", "arm"]}]
+    for result in run_regression(jobs, workers=8):
+        print(result["run"], result["success"], result["duration"])
+"""
+
+# Arrow packages/modules that a fresh run imports before the seed is set (or that are free of import-time side
+# effects, like the DB models), they are kept warm between jobs.
+# Any other Arrow module (Tool, Arrow_API, content, templates, ...) consumes random numbers or reads the architecture
+# while being imported, so it is unloaded and re-imported by every job.
+_WARM_MODULES = ("Arrow", "Arrow.Externals")
+_WARM_PACKAGES = ("Arrow.Arrow", "Arrow.Utils", "Arrow.Externals.cloud", "Arrow.Externals.run_tool",
+                  "Arrow.Externals.db_manager")
+_TEMPLATE_MODULES = ("template_file", "scenarios_path")
+
+# run-independent singletons (no randomness involved in building them), kept between jobs
+WARM_SINGLETONS = ("model_cache_instance", "instruction_catalog_instance")
+
+
+def _is_warm_module(module_name: str) -> bool:
+    if module_name in _WARM_MODULES:
+        return True
+    return any(module_name == package or module_name.startswith(package + ".") for package in _WARM_PACKAGES)
+
+
+def get_project_root() -> str:
+    # Externals/run_tool.py -> Arrow/ -> project root
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _init_regression_worker(project_root: str) -> None:
+    """Prepare a worker process the same way run_arrow.py does, and pay the heavy imports once."""
+    os.chdir(project_root)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
+    os.environ.setdefault('ARROW_TOOL_PATH', os.environ.get('PATH', ''))
+
+    # warm-up imports, third-party packages (numpy, peewee, ...) stay loaded for all jobs of this worker
+    from Arrow.Arrow import main  # noqa: F401
+    from Arrow.Utils.arg_parser import arg_parser  # noqa: F401
+    import peewee  # noqa: F401
+
+
+def _unload_tool_modules() -> None:
+    for module_name in list(sys.modules):
+        if module_name in _TEMPLATE_MODULES:
+            del sys.modules[module_name]
+        elif module_name.startswith("Arrow.") and not _is_warm_module(module_name):
+            del sys.modules[module_name]
+
+
+def build_command_args(job: Dict) -> List[str]:
+    args = [job["template"], "--output", job["output"]]
+    if job.get("seed") is not None:
+        args += ["--seed", str(job["seed"])]
+    return args + list(job.get("args", []))
+
+
+def run_tool_in_process(job: Dict, keep_singletons=WARM_SINGLETONS) -> Dict:
+    """
+    Run a single regression job inside the current (worker) process.
+    The tool stdout/stderr and traceback (if any) are saved into '<output>/result.txt', like run_tool() does.
+
+    Args:
+        job: dict with 'run' (name), 'template', 'output' and optional 'seed' and extra 'args'.
+        keep_singletons: SingletonManager keys kept warm for the next job.
+
+    Returns:
+        dict: run, seed (the one actually used), success, duration and output of the job.
+    """
+    from Arrow.Arrow import main
+    from Arrow.Utils.configuration_management import get_config_manager
+
+    _unload_tool_modules()
+
+    success = False
+    seed = job.get("seed")
+    output = StringIO()
+    start_time = time.perf_counter()
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            success = bool(main.main(build_command_args(job)))
+        except (Exception, SystemExit):  # argparse exits on invalid arguments
+            traceback.print_exc(file=output)
+        finally:
+            config_manager = get_config_manager()
+            if config_manager.is_exist('Seed'):
+                seed = config_manager.get_value('Seed')
+            # main() resets only in cloud_mode, and not at all when failing before generation starts
+            from Arrow.Tool.stages import final_stage
+            final_stage.reset_tool(keep_singletons=keep_singletons)
+    duration = time.perf_counter() - start_time
+
+    # Save the output to the specified directory (created and cleaned by the tool itself)
+    os.makedirs(job["output"], exist_ok=True)
+    with open(os.path.join(job["output"], "result.txt"), "w") as f:
+        f.write(output.getvalue())
+
+    return {
+        "run": job["run"],
+        "seed": seed,
+        "success": success,
+        "duration": duration,
+        "output": job["output"],
+    }
+
+
+def run_regression(jobs: List[Dict], workers: Optional[int] = None, max_jobs_per_worker: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Fan regression jobs out across a pool of warm Arrow worker processes.
+
+    Args:
+        jobs: list of dicts with 'run' (name), 'template', 'output' and optional 'seed' and extra 'args'.
+        workers: number of worker processes, defaults to the number of CPUs.
+        max_jobs_per_worker: recycle a worker after that many jobs (bounds leaks between runs), None for never.
+
+    Yields:
+        The result dict of each job (see run_tool_in_process), in completion order.
+    """
+    # output directories are resolved against the caller working directory, workers run from the project root
+    jobs = [dict(job, output=os.path.abspath(job["output"])) for job in jobs]
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(jobs)))
+    # spawn: workers start from a clean interpreter, not from a copy of the caller's state
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(processes=workers, initializer=_init_regression_worker, initargs=(get_project_root(),),
+                      maxtasksperchild=max_jobs_per_worker) as pool:
+        yield from pool.imap_unordered(run_tool_in_process, jobs)
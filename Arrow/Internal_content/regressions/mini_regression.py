@@ -1,56 +1,69 @@
-
 import os
+import random
+import argparse
 from Arrow.Externals import run_tool
 
-def main():
+def main(args=None):
     """
-    Main script to run your tool 10 times and save the results.
+    Main script to run your tool over several seeds, architectures and templates, and save the results.
+    Runs are distributed over a pool of warm worker processes (see run_tool.run_regression).
+
+    Run from the project root:
+        python -m Arrow.Internal_content.regressions.mini_regression --seeds 5 --workers 8
     """
-    output_dir = "mini_regression"  # Main output directory
-    summary = []  # To store the results of each run
+    parser = argparse.ArgumentParser(description="Arrow mini regression")
+    parser.add_argument('--output', type=str, default="mini_regression", help='Main output directory.')
+    parser.add_argument('--seeds', type=int, default=5, help='Number of seeds per architecture and template.')
+    parser.add_argument('--base_seed', type=int, help='First seed, consecutive seeds are used. Random if not provided.')
+    parser.add_argument('--workers', type=int, help='Number of worker processes, defaults to the number of CPUs.')
+    parser.add_argument('--arch', nargs='+', default=['x86', 'riscv', 'arm'], help='Architectures to run.')
+    parser.add_argument('--templates', nargs='+', default=['random_template.py', 'direct_template.py'], help='Templates to run.')
+    args = parser.parse_args(args)
+
+    output_dir = os.path.abspath(args.output)  # Main output directory
+    base_seed = args.base_seed if args.base_seed is not None else random.randint(0, 2 ** 32 - 1 - args.seeds)
 
     # Ensure the output directory exists
     os.makedirs(output_dir, exist_ok=True)  # Create the directory if it doesn't exist
 
-    print(f"=== Starting mini regression runs")
-    for i in range(5):
-        for arch in ['x86','riscv', 'arm']:
-            for template in ['random_template.py', 'direct_template.py']:
+    jobs = []
+    for i in range(args.seeds):
+        seed = base_seed + i
+        for arch in args.arch:
+            for template in args.templates:
                 template_path = f"templates/{template}"  # Path to your template
-
-                run_str = f"{arch}_{template}_run_{i + 1}"
-                subdir = os.path.join(output_dir, run_str )
-
-                # Ensure the subdirectory exists
-                os.makedirs(subdir, exist_ok=True)  # Create the directory if it doesn't exist
-
-                # Command to run your tool with the template and output directory
-                command = ["python", "Arrow/main.py", template_path, "--output", subdir, "--arch", arch, "--cloud_mode", "True"]
-
-               # Run the tool and collect the success/failure result
-                success = run_tool.run_tool(template_path, subdir, command_line=command, run_str=run_str)
-
-                # Add the result to the summary list
-                summary.append({
+                run_str = f"{arch}_{template}_seed_{seed}"
+                jobs.append({
                     "run": run_str,
-                    "success": success
+                    "template": template_path,
+                    "output": os.path.join(output_dir, run_str),
+                    "seed": seed,
+                    "args": ["--arch", arch, "--cloud_mode", "True"],
                 })
-    print(f"=== Finished mini regression")
 
-    # Write a summary file to indicate if any test failed
+    print(f"=== Starting mini regression runs: {len(jobs)} runs, base seed {base_seed}")
+    summary = []  # To store the results of each run
+
+    # Write a summary file to indicate if any test failed, results are streamed as runs complete
     summary_file = os.path.join(output_dir, "summary.txt")
     with open(summary_file, "w") as f:
-        all_success = all(entry["success"] for entry in summary)
         f.write("Summary of mini regression tests:\n")
-        for entry in summary:
-            status = "PASSED" if entry["success"] else "FAILED"
-            f.write(f"{entry['run']}: {status}\n")
+        for result in run_tool.run_regression(jobs, workers=args.workers):
+            status = "PASSED" if result["success"] else "FAILED"
+            print(f" TEST {result['run']}: {status} ({result['duration']:.2f}s)")
+            f.write(f"{result['run']}: {status}, seed {result['seed']}, {result['duration']:.2f} seconds\n")
+            f.flush()
+            summary.append(result)
 
         # Add a final line indicating overall result
+        all_success = all(entry["success"] for entry in summary)
         if all_success:
             f.write("\nAll tests PASSED\n")
         else:
             f.write("\nSome tests FAILED\n")
+    print(f"=== Finished mini regression")
+
+    return all_success
 
 if __name__ == "__main__":
     main()
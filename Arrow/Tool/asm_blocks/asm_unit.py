@@ -1,10 +1,17 @@
 from typing import Optional
 from Arrow.Utils.configuration_management import Configuration
-from Arrow.Tool.asm_blocks.data_unit import get_last_user_context
-from Arrow.Utils.statistics_managment import get_statistics_manager
+from Arrow.Tool.asm_blocks.data_unit import get_last_user_context, get_source_context_tracker
 
 
 class AsmUnit:
+    """
+    Compact record of a single asm line (asm string, generated instruction or comment).
+
+    Only the raw parts and a provenance id are stored, the final text (including the aligned provenance comment)
+    is materialized on first str() - i.e. when the asm file or generation.json are written - and cached from then on.
+    """
+    __slots__ = ("type", "prefix", "mnemonic", "operands", "asm_string", "comment", "provenance_id", "_asm_unit")
+
     def __init__(
             self,
             *,
@@ -13,14 +20,13 @@ class AsmUnit:
             operands: Optional[list] = None,
             asm_string: Optional[str] = None,
             comment: Optional[str] = None,
+            source_context: Optional[tuple] = None,
     ):
         """
         Initializes an AsmUnit from an asm, generate or comment syntax. and can later be published into the asm file
+        source_context: optional (file_name, shortened_path, line_number) of the user code, when already known by the caller
         """
 
-        statistics_manager = get_statistics_manager()
-        statistics_manager.increment("asm_unit_count")
-
         if asm_string is not None and (mnemonic is not None or operands is not None):
             raise ValueError("asm_string and mnemonic or operands are mutually excluded.")
 
@@ -36,30 +42,49 @@ class AsmUnit:
 
         self.prefix = prefix
         self.mnemonic = mnemonic
-        self.operands = operands
+        self.operands = tuple(operands) if operands is not None else None
         self.asm_string = asm_string
         self.comment = comment
+        self._asm_unit = None
 
         # extract context to generated data
-        self.file_name, self.file_name_shortened_path, self.line_number = get_last_user_context()
-
-        self.extended_comment = ""
-        self.asm_unit = ""
-
-        if self.prefix:
-            self.asm_unit += self.prefix
+        if source_context is None:
+            source_context = get_last_user_context()
+        self.provenance_id = get_source_context_tracker().register_asm_unit(source_context)
+
+    @property
+    def file_name(self):
+        return get_source_context_tracker().get_provenance(self.provenance_id)[0]
+
+    @property
+    def file_name_shortened_path(self):
+        return get_source_context_tracker().get_provenance(self.provenance_id)[1]
+
+    @property
+    def line_number(self):
+        return get_source_context_tracker().get_provenance(self.provenance_id)[2]
+
+    @property
+    def asm_unit(self) -> str:
+        if self._asm_unit is None:
+            self._asm_unit = self._format()
+        return self._asm_unit
+
+    def get_code(self) -> str:
+        """The asm text of the unit as seen by the assembler, without comments and provenance"""
+        code = self.prefix or ""
         if self.asm_string:
-            self.asm_unit += f" {self.asm_string}"
+            code += f" {self.asm_string}"
         if self.mnemonic:
-            self.asm_unit += f" {self.mnemonic} {', '.join(map(str, self.operands))}"
-        if self.comment:
-            self.asm_unit += f" {get_comment_mark()} {self.comment}"
-
-        # add file and line Inspect
-        self.asm_unit = format_with_alignment(self.asm_unit,
-                                              f"{get_comment_mark()} ( From {self.file_name_shortened_path}, line {self.line_number})")
+            code += f" {self.mnemonic} {', '.join(map(str, self.operands))}"
+        return code.strip()
 
-        # print(f"   {self.asm_unit}")
+    def _format(self) -> str:
+        # add file and line Inspect (skipped when source provenance is disabled)
+        _, file_name_shortened_path, line_number = get_source_context_tracker().get_provenance(self.provenance_id)
+        operands = ', '.join(map(str, self.operands)) if self.mnemonic else None
+        return render_asm_unit(self.prefix, self.asm_string, self.mnemonic, operands, self.comment,
+                               get_comment_mark(), file_name_shortened_path, line_number)
 
     def __str__(self):
         return self.asm_unit
@@ -76,6 +101,25 @@ def get_comment_mark():
         raise ValueError(f"Unknown Architecture requested")
 
 
+def render_asm_unit(prefix: Optional[str], asm_string: Optional[str], mnemonic: Optional[str],
+                    operands: Optional[str], comment: Optional[str], comment_mark: str,
+                    shortened_path: Optional[str], line_number: Optional[int]) -> str:
+    """
+    The asm file text of an asm unit, operands already joined, with its provenance comment if known.
+    Shared by AsmUnit and the generation dump reader (Arrow.Utils.generation_dump).
+    """
+    asm_unit = prefix or ""
+    if asm_string:
+        asm_unit += f" {asm_string}"
+    if mnemonic:
+        asm_unit += f" {mnemonic} {operands}"
+    if comment:
+        asm_unit += f" {comment_mark} {comment}"
+    if shortened_path is not None:
+        asm_unit = format_with_alignment(asm_unit, f"{comment_mark} ( From {shortened_path}, line {line_number})")
+    return asm_unit
+
+
 def format_with_alignment(main_text, comment, width=120):
     """
     Pads main_text to a fixed width and appends comment aligned to that width.
@@ -1,64 +1,155 @@
-import inspect
 import os
+import sys
 from typing import Optional
 from Arrow.Utils.configuration_management import get_config_manager
 from Arrow.Utils.logger_management import get_logger
+from Arrow.Utils.singleton_management import SingletonManager
+from Arrow.Utils.statistics_managment import get_statistics_manager
 
 def normalize_path(path):
     """Helper function to normalize paths to absolute, lowercase, and consistent separator format."""
     return os.path.normpath(os.path.abspath(path)).lower()
 
 
-def get_last_user_context():
-    # Get config values and normalize paths
-    config_manager = get_config_manager()
+class SourceContextTracker:
+    """
+    Cheap provenance tracker, locating the user code (content, template or tool fallback) that created an asm/data unit.
+
+    Walks the live frames with sys._getframe instead of inspect.stack() (which also reads source lines of every frame),
+    and caches the classification and shortened path of each code object, so paths are normalized only once per function.
+    Capture can be disabled entirely with '--source_provenance False' for throughput runs.
+    """
+    USER = "user"
+    TOOL = "tool"
 
-    internal_content_dir_path = config_manager.get_value('internal_content_dir_path')
-    external_content_dir_path = config_manager.get_value('external_content_dir_path')
-    template_file = normalize_path(config_manager.get_value('template_path'))
+    def __init__(self):
+        config_manager = get_config_manager()
+        self.enabled = config_manager.get_value('Source_provenance') if config_manager.is_exist('Source_provenance') else True
 
-    test_stage_path = normalize_path('Arrow/Tool/stages/test_stage')
-    memory_segments_path = normalize_path('Arrow/Tool/memory_management/memlayout/segment_manager.py')  # initial code label is create there
-    exception_tables_path = normalize_path('Arrow/Tool/exception_management/__init__.py')
-    # Capture the stack once as the below code might go over it twice, and it has performance penalty
-    stack_snapshot = inspect.stack()
+        self.internal_content_dir_path = str(config_manager.get_value('internal_content_dir_path')).lower()
+        self.external_content_dir_path = str(config_manager.get_value('external_content_dir_path')).lower()
+        self.template_file = str(normalize_path(config_manager.get_value('template_path'))).lower()
 
-    internal_content_dir_path = str(internal_content_dir_path).lower()
-    external_content_dir_path = str(external_content_dir_path).lower()
-    template_file = str(template_file).lower()
+        self.tool_paths = [
+            normalize_path('Arrow/Tool/stages/test_stage'),
+            normalize_path('Arrow/Tool/memory_management/memlayout/segment_manager.py'),  # initial code label is create there
+            normalize_path('Arrow/Tool/exception_management/__init__.py'),
+        ]
 
-    # Traverse the call stack and look for the first instance of user code
-    for frame_info in stack_snapshot:
+        self._code_cache = {}  # code object -> (kind, filename_abs, shortened_path)
 
-        filename_abs = normalize_path(frame_info.filename)
+        # interned provenance contexts, AsmUnits keep only an index into this table. id 0 is 'no provenance'
+        self.provenance_table = [(None, None, None)]
+        self._provenance_ids = {(None, None, None): 0}
+        self.statistics_manager = get_statistics_manager()
+
+    def _classify(self, code):
+        filename_abs = normalize_path(code.co_filename)
 
         # Check for matches in Internal Content directory first
-        if str(internal_content_dir_path) in filename_abs:
+        if self.internal_content_dir_path in filename_abs:
             # Create a relative path from content_directory
-            relative_path = os.path.relpath(filename_abs, internal_content_dir_path)
-            return filename_abs, relative_path.replace(os.sep, '/'), frame_info.lineno
+            relative_path = os.path.relpath(filename_abs, self.internal_content_dir_path)
+            return self.USER, filename_abs, relative_path.replace(os.sep, '/')
 
         # Check for matches in External Content directory
-        if str(external_content_dir_path) in filename_abs:
+        if self.external_content_dir_path in filename_abs:
             # Create a relative path from content_directory
-            relative_path = os.path.relpath(filename_abs, external_content_dir_path)
-            return filename_abs, relative_path.replace(os.sep, '/'), frame_info.lineno
+            relative_path = os.path.relpath(filename_abs, self.external_content_dir_path)
+            return self.USER, filename_abs, relative_path.replace(os.sep, '/')
 
         # Check for matches in the template directory
-        if template_file in filename_abs:
-            filename_abs = normalize_path(frame_info.filename)
-            shortened_path = "/".join(filename_abs.split(os.sep)[-2:])
-            return filename_abs, shortened_path, frame_info.lineno
+        if self.template_file in filename_abs:
+            return self.USER, filename_abs, "/".join(filename_abs.split(os.sep)[-2:])
+
+        # Tool code like boot, scenario wrapper and such (e.g., test_stage), used as fallback
+        if any(tool_path in filename_abs for tool_path in self.tool_paths):
+            return self.TOOL, filename_abs, "/".join(filename_abs.split(os.sep)[-2:])
 
-    # Fallback: check for first instance of Tool code like boot, scenario wrapper and such (e.g., test_stage)
-    for frame_info in stack_snapshot:
-        filename_abs = normalize_path(frame_info.filename)
-        if (test_stage_path in filename_abs) or (memory_segments_path in filename_abs) or (exception_tables_path in filename_abs):
-            filename_abs = normalize_path(frame_info.filename)
-            shortened_path = "/".join(filename_abs.split(os.sep)[-2:])
-            return filename_abs, shortened_path, frame_info.lineno
+        return None, None, None
+
+    def get_context(self, frame):
+        """
+        Returns (file_name, shortened_path, line_number) of the first user frame, starting at `frame` and going outwards.
+        Falls back to the first Tool frame if no user frame is found.
+        """
+        if not self.enabled:
+            return None, None, None
 
-    raise ValueError("Inspect failed to find last_user_context")
+        code_cache = self._code_cache
+        fallback = None
+        while frame is not None:
+            code = frame.f_code
+            classification = code_cache.get(code)
+            if classification is None:
+                classification = self._classify(code)
+                code_cache[code] = classification
+
+            kind, filename_abs, shortened_path = classification
+            if kind == self.USER:
+                return filename_abs, shortened_path, frame.f_lineno
+            if kind == self.TOOL and fallback is None:
+                fallback = (filename_abs, shortened_path, frame.f_lineno)
+            frame = frame.f_back
+
+        if fallback is not None:
+            return fallback
+
+        raise ValueError("Inspect failed to find last_user_context")
+
+
+    def register_asm_unit(self, source_context: tuple) -> int:
+        """
+        Count a new AsmUnit and return the provenance id of its (file_name, shortened_path, line_number) context.
+        """
+        self.statistics_manager.increment("asm_unit_count")
+        return self.intern_context(source_context)
+
+    def intern_context(self, source_context: tuple) -> int:
+        """
+        Return the provenance id of a (file_name, shortened_path, line_number) context, adding it if new.
+        """
+        provenance_id = self._provenance_ids.get(source_context)
+        if provenance_id is None:
+            provenance_id = len(self.provenance_table)
+            self.provenance_table.append(source_context)
+            self._provenance_ids[source_context] = provenance_id
+        return provenance_id
+
+    def get_provenance(self, provenance_id: int) -> tuple:
+        return self.provenance_table[provenance_id]
+
+
+# Factory function to retrieve the SourceContextTracker instance
+def get_source_context_tracker() -> SourceContextTracker:
+    # Access or initialize the singleton variable
+    source_context_tracker_instance = SingletonManager.get("source_context_tracker_instance", default=None)
+    if source_context_tracker_instance is None:
+        source_context_tracker_instance = SourceContextTracker()
+        SingletonManager.set("source_context_tracker_instance", source_context_tracker_instance)
+    return source_context_tracker_instance
+
+
+def get_last_user_context():
+    """
+    Returns (file_name, shortened_path, line_number) of the last user code in the call stack,
+    or (None, None, None) when source provenance is disabled.
+    """
+    return get_source_context_tracker().get_context(sys._getframe(1))
+
+
+def render_data_unit(name, memory_block_id, memory_segment_id, address, pa_address, segment_offset, byte_size,
+                     alignment, init_value, shortened_path, line_number) -> str:
+    """
+    The memory_usage.json description of a data unit.
+    Shared by DataUnit and the generation dump reader (Arrow.Utils.generation_dump).
+    """
+    formatted_bytes = ", ".join(f"0x{byte:02x}" for byte in init_value) if init_value is not None else "None"
+    data_unit_str = f"[name:{name}, memory_block:{memory_block_id}, memory_segment_name:{memory_segment_id}, "
+    if address is not None:
+        data_unit_str += f"address:{hex(address)}, pa_address:{hex(pa_address)}, segment_offset:{hex(segment_offset)}, "
+    data_unit_str += f"byte_size:{byte_size}, alignment:{alignment}, init_value:{formatted_bytes}, file: {shortened_path}, line: {line_number}]"
+    return data_unit_str
 
 
 class DataUnit:
@@ -92,18 +183,17 @@ class DataUnit:
         # extract context to generated data
         self.file_name, self.file_name_shortened_path, self.line_number = get_last_user_context()
 
-        if self.init_value_byte_representation is not None:
-            formatted_bytes = ", ".join(f"0x{byte:02x}" for byte in self.init_value_byte_representation)
-        else:
-            formatted_bytes = "None"
-
-        self.data_unit_str = f"[name:{self.name}, memory_block:{self.memory_block_id}, memory_segment_name:{self.memory_segment_id}, "
-        if address is not None:
-            self.data_unit_str += f"address:{hex(self.address)}, pa_address:{hex(self.pa_address)}, segment_offset:{hex(self.segment_offset)}, "
-        self.data_unit_str += f"byte_size:{self.byte_size}, alignment:{self.alignment}, init_value:{formatted_bytes}, file: {self.file_name_shortened_path}, line: {self.line_number}]"
         # print(self.data_unit_str)
         # logger = get_logger()
         # logger.debug(f"DataUnit generated: {self.data_unit_str}")
 
+    @property
+    def data_unit_str(self) -> str:
+        """Rendered on demand, only when the data unit is emitted or dumped (formatting a large payload is costly)."""
+        return render_data_unit(self.name, self.memory_block_id, self.memory_segment_id, self.address,
+                                self.pa_address, self.segment_offset, self.byte_size, self.alignment,
+                                self.init_value_byte_representation, self.file_name_shortened_path,
+                                self.line_number)
+
     def __str__(self):
         return self.data_unit_str
@@ -3,7 +3,6 @@ from typing import Optional
 #from Arrow.Tool.asm_libraries.barrier.barrier_base import BarrierBase
 #from Arrow.Tool.asm_libraries.barrier.barrier_x86 import Barrier_x86
 #from Arrow.Tool.asm_libraries.barrier.barrier_riscv import Barrier_riscv
-from Arrow.Tool.asm_libraries.barrier.barrier_arm import barrier_arm
 from Arrow.Utils.configuration_management import Configuration
 
 def Barrier(
@@ -18,6 +17,7 @@ def Barrier(
         raise ValueError(f"riscv architecture barrier is currently not implemented")
         # barrier_instance = Barrier_riscv
     elif Configuration.Architecture.arm:
+        from Arrow.Tool.asm_libraries.barrier.barrier_arm import barrier_arm
         barrier_arm(barrier_name)
         #barrier_instance = Barrier_arm
     else:
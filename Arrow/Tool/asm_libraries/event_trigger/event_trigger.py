@@ -1,8 +1,5 @@
 
 from Arrow.Tool.asm_libraries.event_trigger.event_trigger_base import EventTriggerBase
-from Arrow.Tool.asm_libraries.event_trigger.event_trigger_x86 import EventTrigger_x86
-from Arrow.Tool.asm_libraries.event_trigger.event_trigger_riscv import EventTrigger_riscv
-from Arrow.Tool.asm_libraries.event_trigger.event_trigger_arm import EventTrigger_arm
 from Arrow.Utils.configuration_management import Configuration
 
 def EventTrigger(
@@ -10,12 +7,15 @@ def EventTrigger(
 ) -> EventTriggerBase:
     """Configure Loop with the desired architecture (Arm, riscv, x86)."""
 
+    # architecture specific modules are loaded on demand, only the running architecture is imported
     if Configuration.Architecture.x86:
+        from Arrow.Tool.asm_libraries.event_trigger.event_trigger_x86 import EventTrigger_x86
         ET_instance = EventTrigger_x86
     elif Configuration.Architecture.riscv:
         raise ValueError((f"Functionality not implemented yet for {Configuration.Architecture.arch_str}"))
         # ET_instance = EventTrigger_riscv
     elif Configuration.Architecture.arm:
+        from Arrow.Tool.asm_libraries.event_trigger.event_trigger_arm import EventTrigger_arm
         ET_instance = EventTrigger_arm
     else:
         raise ValueError(f"Unknown Architecture requested")
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-import random
+from Arrow.Utils.seed_management import rng
 from Arrow.Tool.asm_libraries.label import Label
 from Arrow.Utils.configuration_management import Configuration
 from Arrow.Tool.state_management import get_current_state
@@ -22,11 +22,11 @@ class EventTriggerBase(ABC):
         current_state = get_current_state()
 
         self.frequency = frequency
-        self.probability = random.uniform(*self.frequency.value)
+        self.probability = rng("event_trigger").uniform(*self.frequency.value)
         self.label = Label(postfix='skip_label')
         self.pattern = int(self.bit_pattern())
 
-        operand_type = random.choice(["mem","reg"])
+        operand_type = rng("event_trigger").choice(["mem","reg"])
         if Configuration.Architecture.arm:
             operand_type = "reg"
 
@@ -49,17 +49,17 @@ class EventTriggerBase(ABC):
             raise ValueError(f"Invalid frequency range: {prob_min} > {prob_max}")
         
         # Generate probability within the corrected range
-        corrected_probability = random.uniform(prob_min, prob_max)
+        corrected_probability = rng("event_trigger").uniform(prob_min, prob_max)
         
         bit_vector = [
-            1 if random.random() < corrected_probability else 0
+            1 if rng("event_trigger").random() < corrected_probability else 0
             for _ in range(vector_length)
         ]
         
         # Ensure at least one bit is set to 1
         if sum(bit_vector) == 0:
             # Set a random bit to 1
-            random_index = random.randint(0, vector_length - 1)
+            random_index = rng("event_trigger").randint(0, vector_length - 1)
             bit_vector[random_index] = 1
         
         # Convert the list of bits into an integer
@@ -4,7 +4,6 @@ from Arrow.Tool.exception_management import get_exception_manager, AArch64Except
 from Arrow.Tool.asm_libraries.exception.exception_base import ExceptionBase
 #from Arrow.Tool.asm_libraries.exception.exception_x86 import Exception_x86
 #from Arrow.Tool.asm_libraries.exception.exception_riscv import Exception_riscv
-from Arrow.Tool.asm_libraries.exception.exception_arm import Exception_arm
 from Arrow.Utils.configuration_management import Configuration
 
 def Exception(
@@ -22,6 +21,7 @@ def Exception(
         raise ValueError(f"riscv is not supported yet")
         #exception_instance = Exception_riscv
     elif Configuration.Architecture.arm:
+        from Arrow.Tool.asm_libraries.exception.exception_arm import Exception_arm
         exception_instance = Exception_arm
     else:
         raise ValueError(f"Unknown Architecture requested")
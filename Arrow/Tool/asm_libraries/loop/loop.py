@@ -1,9 +1,6 @@
 from typing import Optional
 
 from Arrow.Tool.asm_libraries.loop.loop_base import LoopBase
-from Arrow.Tool.asm_libraries.loop.loop_x86 import Loop_x86
-from Arrow.Tool.asm_libraries.loop.loop_riscv import Loop_riscv
-from Arrow.Tool.asm_libraries.loop.loop_arm import Loop_arm
 from Arrow.Utils.configuration_management import Configuration
 
 def Loop(
@@ -15,11 +12,15 @@ def Loop(
 ) -> LoopBase:
     """Configure Loop with the desired architecture (Arm, riscv, x86)."""
 
+    # architecture specific modules are loaded on demand, only the running architecture is imported
     if Configuration.Architecture.x86:
+        from Arrow.Tool.asm_libraries.loop.loop_x86 import Loop_x86
         loop_instance = Loop_x86
     elif Configuration.Architecture.riscv:
+        from Arrow.Tool.asm_libraries.loop.loop_riscv import Loop_riscv
         loop_instance = Loop_riscv
     elif Configuration.Architecture.arm:
+        from Arrow.Tool.asm_libraries.loop.loop_arm import Loop_arm
         loop_instance = Loop_arm
     else:
         raise ValueError(f"Unknown Architecture requested")
@@ -23,11 +23,8 @@ class MemoryArray:
         self.current_offset_register = "x1"  # Default offset register
 
         # Convert each integer to its byte representation
-        byte_representation = []
-        for value in self.elements:
-            # Convert the integer to bytes, and ensure the byte size
-            byte_rep = value.to_bytes(element_size, byteorder='little')  # or 'big' depending on endianness
-            byte_representation.append(byte_rep)
+        # Convert the integer to bytes, and ensure the byte size
+        byte_representation = b"".join(value.to_bytes(element_size, byteorder='little') for value in self.elements)  # or 'big' depending on endianness
 
         self.array_block = MemoryBlock(name=f"{self.array_name}_array_memory_block", byte_size=self.array_size, init_value_byte_representation=byte_representation, shared=False)
         self.offset_mem = Memory(name=f"{self.array_name}_index_memory", byte_size=2, init_value=0x0)
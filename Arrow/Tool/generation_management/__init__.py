@@ -1,4 +1,4 @@
 from . import generated_instruction
 from . import generate
-from . import generate_x86
-from . import generate_riscv
+# the architecture specific generate modules (generate_x86, generate_riscv, generate_arm_asl) are imported on demand
+# by generate.get_architecture_generate
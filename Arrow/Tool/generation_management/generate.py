@@ -1,16 +1,17 @@
 import os
-import random
 from typing import Optional, Any, List, Dict
 from Arrow.Tool.generation_management.utils import get_operand_type
-from Arrow.Tool.generation_management.generated_instruction import GeneratedInstruction
-from Arrow.Tool.generation_management.generate_x86 import generate_x86
-from Arrow.Tool.generation_management.generate_riscv import generate_riscv
+from Arrow.Tool.generation_management.generated_instruction import GeneratedInstruction, validate_generated_instructions
 #from Arrow.Tool.generation_management.generate_arm import old_generate_arm
-from Arrow.Tool.generation_management.generate_arm_asl import generate_arm_asl
+from Arrow.Tool.generation_management.operand_template import get_instruction_template
 from Arrow.Utils.configuration_management import Configuration, get_config_manager
+from Arrow.Utils.seed_management import rng, numpy_rng
 from Arrow.Externals.db_manager.models import get_instruction_db
+from Arrow.Externals.db_manager.instruction_catalog import get_instruction_catalog
 from Arrow.Tool.register_management.register import Register
 from Arrow.Tool.memory_management.memory_operand import Memory
+from Arrow.Tool.asm_blocks.data_unit import get_last_user_context
+from Arrow.Tool.state_management import get_current_state
 
 from peewee import Expression, fn
 
@@ -54,6 +55,86 @@ def generate(
         Instruction = db_models
         Operand = None
 
+    # Resolve the filter into its valid candidate set. Repeated filters are served from the catalog cache,
+    # and all picks below are in-memory lookups
+    catalog = get_instruction_catalog()
+    cache_key = get_filter_cache_key(Instruction, query, src, dest)
+    candidate_indices = catalog.get_candidates(
+        cache_key, lambda: build_query_filter(Instruction, Operand, query, src, dest))
+
+    if instruction_count > 1 and src is None and dest is None and Configuration.Architecture.arm:
+        # long straight-line runs of random instructions, sample and render them in one batch
+        return generate_batch(catalog, candidate_indices, instruction_count, comment)
+
+    # Generate the instructions based on architecture
+    arch_generate = get_architecture_generate()
+
+    instruction_list = []
+    for _ in range(instruction_count):
+        # candidates are pre-filtered by is_valid, no retries needed. a single pick per instruction, so a given
+        # seed selects other instructions than the former pick-and-retry loop did
+        selected_instruction = catalog.get(rng("generate").choice(candidate_indices))
+        if instruction_debug_prints:
+            print(f"   Selected out of {len(candidate_indices)} valid candidates: {selected_instruction.syntax}")
+
+        gen_instructions = arch_generate(selected_instruction, src, dest, comment=comment)
+        instruction_list.extend(gen_instructions)
+
+    return instruction_list
+
+
+def get_architecture_generate():
+    """The generate function of the running architecture, its module is only imported on first use."""
+    if Configuration.Architecture.x86:
+        from Arrow.Tool.generation_management.generate_x86 import generate_x86
+        return generate_x86
+    elif Configuration.Architecture.riscv:
+        from Arrow.Tool.generation_management.generate_riscv import generate_riscv
+        return generate_riscv
+    elif Configuration.Architecture.arm:
+        from Arrow.Tool.generation_management.generate_arm_asl import generate_arm_asl
+        return generate_arm_asl
+    else:
+        raise ValueError(f"Unknown Architecture requested")
+
+
+def generate_batch(catalog, candidate_indices, instruction_count: int, comment: Optional[str] = None) -> List[GeneratedInstruction]:
+    """
+    Batch mode of generate() for src/dest-free requests (ARM only).
+    The N instruction picks and the operands' random values are drawn in bulk with NumPy, the user context is
+    extracted once, and the instructions are validated (debug mode, single assembler run) and emitted into the
+    code block with a single extend.
+    Instructions with memory operands plant a dynamic init and reserve registers, so they are generated through the
+    regular generate_arm_asl path (still deferring their emission, to keep the batch order).
+    """
+    from Arrow.Tool.generation_management.generate_arm_asl import generate_arm_asl, BatchOperandRandomizer
+
+    current_state = get_current_state()
+    randomizer = BatchOperandRandomizer(current_state.register_manager, draw_count=instruction_count * 4)
+    source_context = get_last_user_context()
+
+    picks = numpy_rng("generate").integers(0, len(candidate_indices), size=instruction_count).tolist()
+    selected_instructions = [catalog.get(candidate_indices[pick]) for pick in picks]
+
+    instruction_list = []
+    for selected_instruction in selected_instructions:
+        if get_instruction_template(selected_instruction).memory_usage:
+            instruction_list.extend(generate_arm_asl(selected_instruction, comment=comment,
+                                                     emit=False, source_context=source_context))
+        else:
+            instruction_list.extend(generate_arm_asl(selected_instruction, comment=comment, randomizer=randomizer,
+                                                     emit=False, source_context=source_context))
+
+    validate_generated_instructions(instruction_list)
+    current_state.current_code_block.asm_units_list.extend(
+        gen_instruction.asm_unit for gen_instruction in instruction_list if gen_instruction._is_valid)
+
+    return instruction_list
+
+
+def build_query_filter(Instruction, Operand, query, src, dest):
+    """Build the peewee query selecting all instructions that match the generate() filters"""
+
     # Start with a base query for instructions
     query_filter = Instruction.select()
 
@@ -92,43 +173,42 @@ def generate(
     if dest is not None:
         query_filter = add_operand_filter(query_filter, dest, role="dest", Instruction=Instruction, Operand=Operand)
 
-    instruction_count_in_db = query_filter.count()
-    if instruction_count_in_db == 0:
-        raise ValueError("No instructions found matching the specified criteria.")
+    return query_filter
 
-    instruction_list = []
-    for _ in range(instruction_count):
-        # Use database OFFSET to get a random instruction (including invalid ones)
-        # Try up to 10 times to find a valid instruction (same retry logic as before)
-        selected_instruction = None
-        for attempt in range(15):
-            random_offset = random.randint(0, instruction_count_in_db - 1)
-            candidate_instruction = query_filter.offset(random_offset).limit(1).first()
-           
-            if candidate_instruction and candidate_instruction.is_valid:
-                selected_instruction = candidate_instruction
-                break
-            elif candidate_instruction:
-                # Log invalid instructions (same as original behavior)
-                if instruction_debug_prints:
-                    print(f"        ⚠️   Skipping instruction!!! instruction {candidate_instruction.syntax} is not parsed correctly yet.")
-       
-        if not selected_instruction:
-            raise ValueError("No valid instructions found matching the specified criteria after multiple attempts.")
-
-        # Generate the instruction based on architecture
-        if Configuration.Architecture.x86:
-            gen_instructions = generate_x86(selected_instruction, src, dest, comment=comment)
-        elif Configuration.Architecture.riscv:
-            gen_instructions = generate_riscv(selected_instruction, src, dest, comment=comment)
-        elif Configuration.Architecture.arm:
-            gen_instructions = generate_arm_asl(selected_instruction, src, dest, comment=comment)
-        else:
-            raise ValueError(f"Unknown Architecture requested")
 
-        instruction_list.extend(gen_instructions)
+def get_filter_cache_key(Instruction, query, src, dest):
+    """
+    Returns a canonical, hashable form of the generate() filters, used as the candidate-set cache key.
+    Expressions are keyed by their compiled SQL and params, operands by the role/type filter they translate into.
+    Returns None if the filters can't be canonicalized (e.g. unhashable query values), disabling the cache for that call.
+    """
+    if not query:
+        query_key = None
+    elif isinstance(query, Expression):
+        sql, params = Instruction._meta.database.get_sql_context().sql(query).query()
+        query_key = (sql, tuple(params))
+    elif isinstance(query, dict):
+        query_key = tuple(sorted((key, value) for key, value in query.items() if hasattr(Instruction, key)))
+    else:
+        raise ValueError("Invalid query format. Expected Expression or dict.")
 
-    return instruction_list
+    key = (Configuration.Architecture.arch_str, query_key,
+           get_operand_filter_key(src, role="src"), get_operand_filter_key(dest, role="dest"))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_operand_filter_key(operand, role):
+    """Canonical form of the filter add_operand_filter() builds for the given operand"""
+    if isinstance(operand, Register):
+        high_predicate = operand.type == "sve_pred" and (int(operand.name[1:]) >= 8)
+        return (role, "register", operand.type, high_predicate)
+    elif isinstance(operand, Memory):
+        return (role, "memory")
+    return None
 
 
 def add_operand_filter(query_filter, operand, role, Instruction, Operand):
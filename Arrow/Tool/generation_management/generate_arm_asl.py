@@ -1,12 +1,11 @@
-import random
-import ast
-import re
+import numpy as np
+from Arrow.Utils.seed_management import rng, numpy_rng
 from typing import Optional, Any, List
-from Arrow.Externals.db_manager.asl_testing.asl_models import Instruction
+from Arrow.Externals.db_manager.instruction_catalog import CatalogRecord
 from Arrow.Tool.asm_libraries.label import Label
 from Arrow.Tool.generation_management.generate import GeneratedInstruction
 from Arrow.Tool.generation_management.utils import map_inputs_to_operands
-from Arrow.Utils.APIs.choice import choice
+from Arrow.Tool.generation_management.operand_template import get_instruction_template
 # from Arrow.Tool.frontend.sources_API import Sources
 from Arrow.Tool.memory_management.memory_operand import Memory
 from Arrow.Tool.state_management import get_current_state
@@ -14,31 +13,33 @@ from Arrow.Utils.configuration_management import get_config_manager
 
 
 def generate_arm_asl(
-        selected_instruction: Instruction,
+        selected_instruction: CatalogRecord,
         src: Any = None,
         dest: Any = None,
         comment: Optional[str] = None,
+        randomizer: Optional["OperandRandomizer"] = None,
+        emit: bool = True,
+        source_context: Optional[tuple] = None,
 ) -> List[GeneratedInstruction]:  # some instances might require dynamic init
 
     current_state = get_current_state()
     RegisterManager = current_state.register_manager
     config_manager = get_config_manager()
 
+    if randomizer is None:
+        randomizer = OperandRandomizer(RegisterManager)
+
     instruction_comment = comment
     instruction_list = []  # some instances might require dynamic init
 
-    # convert the operand from a string into a list of operands
-    if isinstance(selected_instruction.operands, str):
-        selected_instruction.operands = ast.literal_eval(selected_instruction.operands)
-
-    # Sort the operands list by index
-    sorted_operands = sorted(selected_instruction.operands, key=lambda op: op.index)
+    # precompiled (and cached) operand render templates, sorted by operand index
+    instruction_template = get_instruction_template(selected_instruction)
 
     #debug_mode = config_manager.get_value('Debug_mode')
     instruction_debug_prints = config_manager.get_value('Instruction_debug_prints')
     if instruction_debug_prints:
         print(f"   Selected Instruction: {selected_instruction.syntax}")
-        for op in sorted_operands:
+        for op in sorted(selected_instruction.operands, key=lambda op: op.index):
             op_info_str = f"text: {op.text}, Full_text: {op.full_text}, Category: {op.type_category}, Type: {op.type}, Role: {op.role}, Size: {op.size}, Width: {op.width}, extensions: {op.extensions}, is_memory: {op.is_memory}, memory_role: {op.memory_role}, is_optional: {op.is_optional}, is_valid: {op.is_valid}"
             if op.is_operand:
                 print(f"        - operand {op.index} : {op_info_str}")
@@ -46,7 +47,7 @@ def generate_arm_asl(
                 print(f"        - attribute : {op_info_str}")
 
     # set True or False if one of the operands has memory type
-    memory_usage = any(operand.is_memory for operand in selected_instruction.operands)
+    memory_usage = instruction_template.memory_usage
     if memory_usage:
         '''
         For every memory usage, we will plant a dynamic_init instruction to place that memory address in a temp register
@@ -82,8 +83,8 @@ def generate_arm_asl(
 
         dynamic_init_instruction = GeneratedInstruction(mnemonic='ldr', operands=[dynamic_init_memory_address_reg,
                                                                                   f"={memory_operand.memory_block.get_label()}+{memory_operand.memory_block_offset}"],
-                                                        comment=comment)
-        
+                                                        comment=comment, emit=emit, source_context=source_context)
+
 
         instruction_list.append(dynamic_init_instruction)
 
@@ -96,22 +97,12 @@ def generate_arm_asl(
     zdn_register = None
     extensions_index = None
 
-    for op in sorted_operands:
-        if not op.is_operand:
-            continue
-        if not op.is_valid:
+    for operand_template in instruction_template.operands:
+        op = operand_template.operand
+        kind = operand_template.kind
+        if kind == "invalid":
             raise TypeError(f"Invalid operand type {op}, please check the instruction and operands in the database")
 
-        op.full_text = op.full_text.replace(" ","") # remove all inner spaces
-
-        match = re.fullmatch(r"\{(.*)\}", op.text)
-        if match:
-            # code is wrapped with curly braces, most likely optional, removing it.
-            # TODO:: need to refactor this code
-            # if not op.is_optional:
-            #    print(f"zzzzzzzzzzzzzzzzzzzzzzzzzzzzzz Need to understand how come {op.full_text} has curly braces but is not optional")
-            op.full_text = op.full_text.replace("{", "").replace("}", "")
-
         if src_location == op_location:
             if instruction_debug_prints:
                 print(f"   src_location == op_location == {op_location}")
@@ -135,111 +126,79 @@ def generate_arm_asl(
                     print(
                         f"    dest is {dest}, size is {op.size}, dest.as_size(op.size): {dest.as_size(op.size)}  ==> eval_operand: {eval_operand}")
 
-        elif op.is_memory:
-            # TODO:: need to improve that logic and integrate offset allocation and avoid dynamic_init where possible!
-            if op.type_category == "register" and op.memory_role == "base":
-                # For every memory usage, we will plant a dynamic_init instruction to place that memory address in a temp register
-                # this is done to avoid using memories offset due to their formatting requirements and my lack of knowledge.
-                #eval_operand = memory_operand.format_reg_as_label(dynamic_init_memory_address_reg)
-                eval_operand = dynamic_init_memory_address_reg  # just placing the register which should point (by the pre dynamic init) to the wanted address
-            elif op.type_category == "register" and op.memory_role != "base":
-                eval_operand = "not_supported"
-            elif op.type_category == "immediate":
-                #TODO:: at the moment I'm not handling offset, and just setting the base to be the wanted address. need to handle!!
-                eval_operand = 0
-                if memory_operand.reused_memory:
-                    eval_operand = memory_operand.memory_block_offset
-
-        elif op.type_category == "register":
-            if op.type == "reg" or "gpr_" in op.type:
-                if op.type == "gpr_var":
-                    size = random.choice([32, 64])
-                    eval_operand = RegisterManager.get(reg_type="gpr").as_size(size)
-                else:
-                    eval_operand = RegisterManager.get(reg_type="gpr").as_size(op.size)
-            elif "simdfp_scalar" in op.type:
-                eval_operand = RegisterManager.get(reg_type="simd_fp").as_size(op.size)
-            elif "simdfp_vec" in op.type:
-                eval_operand = RegisterManager.get(reg_type="simd_fp").as_size(op.size)
-            elif op.type == "sve_reg":
-                eval_operand = RegisterManager.get(reg_type="sve_reg")
-                if op.syntax == "Zdn":
-                    if zdn_register is None:
-                        # first time we see Zdn, we need to create a new register
-                        zdn_register = eval_operand
-                    else:
-                        # we already have a Zdn register, we need to use the same one
-                        eval_operand = zdn_register
-            elif op.type == "sve_pred":
-                if op.width == 4:
-                    eval_operand = RegisterManager.get(reg_type="sve_pred")
-                elif op.width == 3:
-                    # if width is 3, we need to check if there are any free predicate registers available at the range of p0-p7
-                    eval_operand = RegisterManager.get(reg_type="sve_pred_low")
+        # TODO:: need to improve the memory logic and integrate offset allocation and avoid dynamic_init where possible!
+        elif kind == "memory_base":
+            # For every memory usage, we will plant a dynamic_init instruction to place that memory address in a temp register
+            # this is done to avoid using memories offset due to their formatting requirements and my lack of knowledge.
+            #eval_operand = memory_operand.format_reg_as_label(dynamic_init_memory_address_reg)
+            eval_operand = dynamic_init_memory_address_reg  # just placing the register which should point (by the pre dynamic init) to the wanted address
+        elif kind == "memory_not_supported":
+            eval_operand = "not_supported"
+        elif kind == "memory_offset":
+            #TODO:: at the moment I'm not handling offset, and just setting the base to be the wanted address. need to handle!!
+            eval_operand = 0
+            if memory_operand.reused_memory:
+                eval_operand = memory_operand.memory_block_offset
+
+        elif kind == "gpr":
+            eval_operand = randomizer.register(reg_type="gpr").as_size(operand_template.size)
+        elif kind == "gpr_var":
+            size = [32, 64][randomizer.index(2)]
+            eval_operand = randomizer.register(reg_type="gpr").as_size(size)
+        elif kind == "simd_fp":
+            eval_operand = randomizer.register(reg_type="simd_fp").as_size(operand_template.size)
+        elif kind == "sve_reg":
+            eval_operand = randomizer.register(reg_type="sve_reg")
+            if operand_template.is_zdn:
+                if zdn_register is None:
+                    # first time we see Zdn, we need to create a new register
+                    zdn_register = eval_operand
                 else:
-                    raise ValueError(f"Invalid width for SVE predicate register: {op.width}")
-            else:
-                eval_operand = "UNKNOWN"
-
-        elif op.type_category == "immediate":
-            if op.width is not None:
-                eval_operand = generate_random_immediate_based_in_width(op.width)
-            else:
-                eval_operand = "unknown"
-        elif op.type == "label":
+                    # we already have a Zdn register, we need to use the same one
+                    eval_operand = zdn_register
+        elif kind == "sve_pred" or kind == "sve_pred_low":
+            # sve_pred_low (width of 3) is restricted to free predicate registers at the range of p0-p7
+            eval_operand = randomizer.register(reg_type=kind)
+        elif kind == "sve_pred_invalid_width":
+            raise ValueError(f"Invalid width for SVE predicate register: {operand_template.width}")
+        elif kind == "register_unknown":
+            eval_operand = "UNKNOWN"
+        elif kind == "immediate":
+            eval_operand = randomizer.immediate(operand_template.width)
+        elif kind == "label":
             eval_operand = Label(postfix=f"generate")
-        elif op.type == "condition":
-            random_condition = choice(values=["EQ", "LT", "LE", "GT", "GE"])  # NEQ create invalid condition?
-            eval_operand = random_condition
+        elif kind == "condition":
+            conditions = ["EQ", "LT", "LE", "GT", "GE"]  # NEQ create invalid condition?
+            eval_operand = conditions[randomizer.index(len(conditions))]
         else:
             eval_operand = "unknown"
             # raise ValueError(f"invalid operand type {operand.type} at selected instruction {selected_instruction.mnemonic}")
 
-        #print(f"zzzzzzzzzzzzzzzzzz operand_str: {str(eval_operand)}")
-        # Replace first token (if any) to be the evaluated operand
-        operand_str = re.sub(r"<[^>]+?>", str(eval_operand), op.full_text, count=1)
-        operand_str.strip()
-        #print(f"zzzzzzzzzzzzzzzzzz operand_str: {operand_str}")
-
         # TODO:: need to handle SP cases (like Xn|SP)
         # TODO:: need to handler optional cases (like {something})
 
         # handle extensions
         extension_str = None
-        if op.extensions != "[]":   # check string and not literal as its not a list just yet
-            extensions = ast.literal_eval(op.extensions)
+        extensions = operand_template.extensions
+        if extensions:
             if len(extensions) > 1:
                 if extensions_index is None:
-                    extensions_index = random.randint(0, len(extensions) - 1)
-                #eval_operand = f"{eval_operand}.{extensions[extensions_index]}"
+                    extensions_index = randomizer.index(len(extensions))
                 extension_str = extensions[extensions_index]
-            # elif "SP" in op.extensions:
-            # elif "SP" in op.extensions:
-            #     if "31" in eval_operand:
-            #         # when asm_template contains <Xn|SP> , it means the register can be r0..30 or SP, r31 is not allowed
-            #         # in this logic, I just replace r31 with SP. #TODO:: need to replace with a smarter logic
-            #         eval_operand = RegisterManager.get(reg_type="gpr", reg_name="SP")
             else:
-                #eval_operand = f"{eval_operand}{extensions[0]}"
                 extension_str = extensions[0]
 
-            prev_operand_str = operand_str
+        # Replace first token (if any) with the evaluated operand, and the 2nd token (if any) with the extension
+        operand_str = operand_template.render(eval_operand, extension_str)
 
-            # Replace 2nd token (if any, its first by now) to be the evaluated operand
-            operand_str = re.sub(r"<[^>]+?>", extension_str, operand_str, count=1)
-            #print(f"zzzzzzzzzzzzzzzzzz operand_str: {operand_str}")
-
-            operand_str.strip()
-
-        instruction_debug_prints = config_manager.get_value('Instruction_debug_prints')
         if instruction_debug_prints:
             print(f"        - Operand{op.index} evaluation: {op.text} ==> {operand_str}")
-            
+
         evaluated_operands.append(operand_str)
         op_location += 1
 
     gen_instruction = GeneratedInstruction(mnemonic=selected_instruction.mnemonic, operands=evaluated_operands,
-                                           comment=instruction_comment)
+                                           comment=instruction_comment, emit=emit, source_context=source_context)
 
     if gen_instruction._is_valid == False:
         #TODO:: need to remove that dynamic init before its been added to AsmUnit. this setting is later and doesn't do the job.
@@ -257,4 +216,66 @@ def generate_random_immediate_based_in_width(width: int):
     if width <= 0:
         raise ValueError("Bit width must be greater than 0")
     max_value = (1 << width) - 1  # Compute the maximum value for this bit width
-    return random.randint(0, max_value)
\ No newline at end of file
+    return rng("generate").randint(0, max_value)
+
+class OperandRandomizer:
+    """
+    Source of randomness for operand evaluation in generate_arm_asl.
+    The default implementation draws one value at a time, straight from the RegisterManager and the `random` module.
+    """
+
+    def __init__(self, register_manager):
+        self.register_manager = register_manager
+
+    def register(self, reg_type: str):
+        return self.register_manager.get(reg_type=reg_type)
+
+    def immediate(self, width: int) -> int:
+        return generate_random_immediate_based_in_width(width)
+
+    def index(self, count: int) -> int:
+        return rng("generate").randint(0, count - 1)
+
+
+class BatchOperandRandomizer(OperandRandomizer):
+    """
+    Bulk source of randomness for batch generation.
+    Raw 64-bit values are drawn with NumPy in chunks, and free registers are snapshotted once per type.
+    The snapshot is only valid while no register gets reserved or freed, so it must not be used for instructions
+    that plant a dynamic init (those reserve an address register for the duration of the instruction).
+    """
+
+    def __init__(self, register_manager, draw_count: int):
+        super().__init__(register_manager)
+        self._chunk_size = max(draw_count, 64)
+        self._draws = []
+        self._draw_index = 0
+        self._free_registers = {}
+
+    def _next_draw(self) -> int:
+        if self._draw_index == len(self._draws):
+            self._draws = numpy_rng("generate").integers(0, 2 ** 64, size=self._chunk_size, dtype=np.uint64).tolist()
+            self._draw_index = 0
+        value = self._draws[self._draw_index]
+        self._draw_index += 1
+        return value
+
+    def register(self, reg_type: str):
+        free_registers = self._free_registers.get(reg_type)
+        if free_registers is None:
+            # "sve_pred_low" is the p0-p7 sub-pool of the register manager
+            free_registers = self.register_manager.get_free_registers(reg_type=reg_type)
+            if not free_registers:
+                raise RuntimeError(f"Register manager ran out of free registers")
+            self._free_registers[reg_type] = free_registers
+        return free_registers[self._next_draw() % len(free_registers)]
+
+    def immediate(self, width: int) -> int:
+        if width <= 0:
+            raise ValueError("Bit width must be greater than 0")
+        if width > 64:
+            return generate_random_immediate_based_in_width(width)
+        return self._next_draw() & ((1 << width) - 1)
+
+    def index(self, count: int) -> int:
+        return self._next_draw() % count
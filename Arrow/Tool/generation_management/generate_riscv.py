@@ -1,6 +1,6 @@
-import random
+from Arrow.Utils.seed_management import rng
 from typing import Optional, Any, List
-from Arrow.Externals.db_manager.models import Instruction
+from Arrow.Externals.db_manager.instruction_catalog import CatalogRecord
 from Arrow.Tool.generation_management.generate import GeneratedInstruction
 from Arrow.Tool.generation_management.utils import map_inputs_to_operands
 from Arrow.Tool.state_management import get_state_manager
@@ -8,7 +8,7 @@ from Arrow.Tool.memory_management.memory_operand import Memory
 import ast
 
 def generate_riscv(
-        selected_instruction: Instruction,
+        selected_instruction: CatalogRecord,
         src: Any = None,
         dest: Any = None,
         comment: Optional[str] = None,
@@ -86,7 +86,7 @@ def generate_riscv(
             # TODO:: need to improve that logic and integrate offset allocation and avoid dynamic_init where possible!
             eval_operand = memory_operand.format_reg_as_label(dynamic_init_memory_address_reg)
         elif operand['type'] == "offset_imm":
-            eval_operand = random.randint(0, 100)
+            eval_operand = rng("generate").randint(0, 100)
         else:
             raise ValueError(f"invalid operand type {operand['type']} at selected instruction {selected_instruction.mnemonic}")
 
@@ -145,4 +145,4 @@ def generate_random_imm_with_size(size_description):
         max_val = (2 ** bits) - 1
 
     # Return a random value within the computed range
-    return random.randint(min_val, max_val)
+    return rng("generate").randint(min_val, max_val)
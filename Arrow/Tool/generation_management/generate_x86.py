@@ -1,6 +1,6 @@
-import random
+from Arrow.Utils.seed_management import rng
 from typing import Optional, Any, List
-from Arrow.Externals.db_manager.models import Instruction
+from Arrow.Externals.db_manager.instruction_catalog import CatalogRecord
 from Arrow.Tool.generation_management.generate import GeneratedInstruction
 from Arrow.Tool.generation_management.utils import map_inputs_to_operands
 from Arrow.Tool.state_management import get_state_manager
@@ -9,7 +9,7 @@ from Arrow.Tool.memory_management.memory_operand import Memory
 import ast
 
 def generate_x86(
-        selected_instruction: Instruction,
+        selected_instruction: CatalogRecord,
         src: Any = None,
         dest: Any = None,
         comment: Optional[str] = None,
@@ -38,7 +38,7 @@ def generate_x86(
         elif operand['type'] == "reg":
             eval_operand = current_state.register_manager.get()
         elif operand['type'] == "imm":
-            eval_operand = random.randint(0, 100000)
+            eval_operand = rng("generate").randint(0, 100000)
         elif operand['type'] == "mem":
             eval_operand = Memory(shared=True)
         else:
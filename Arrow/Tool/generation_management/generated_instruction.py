@@ -2,6 +2,7 @@ from Arrow.Tool.memory_management.memory_operand import Memory
 from Arrow.Tool.asm_blocks import AsmUnit
 from Arrow.Utils.configuration_management import Configuration, get_config_manager
 from Arrow.Tool.state_management import get_current_state
+from Arrow.Externals.binary_generation.asm_validator import get_asm_validator
 
 
 class GeneratedInstruction:
@@ -12,7 +13,15 @@ class GeneratedInstruction:
             mnemonic: str,
             operands: list,
             comment: str,
+            emit: bool = True,
+            source_context: tuple = None,
     ):
+        """
+        emit: when False, the instruction is built but neither validated nor appended to the current code block,
+              the caller is responsible to validate (validate_generated_instructions) and append `asm_unit`
+              (used by batch generation to validate and emit in one go)
+        source_context: optional pre-computed user context, forwarded to the AsmUnit
+        """
         current_state = get_current_state()
 
         self.prefix = prefix
@@ -40,35 +49,13 @@ class GeneratedInstruction:
                     operands[i] = hex(operand)
 
         self.asm_unit = AsmUnit(prefix=self.prefix, mnemonic=self.mnemonic, operands=self.operands,
-                                comment=self.comment)
+                                comment=self.comment, source_context=source_context)
 
-        asl_extract = True  # TODO:: remove this after testing!!!!
-        if Configuration.Architecture.arm and asl_extract:
-            config_manager = get_config_manager()
-            debug_mode = config_manager.get_value('Debug_mode')
-            create_binary = config_manager.get_value('Create_binary')
-            if debug_mode and create_binary:
-                success, error = test_asm_instruction(str(self.asm_unit))
-                if success:
-                    instruction_debug_prints = config_manager.get_value('Instruction_debug_prints')
-                    if instruction_debug_prints:
-                        print(f"        ✅  Debug mode: Generated Instruction: {self.asm_unit}")
-                    current_code_block = current_state.current_code_block
-                    current_code_block.asm_units_list.append(self.asm_unit)
-                else:
-                    instruction_debug_prints = config_manager.get_value('Instruction_debug_prints')
-                    if instruction_debug_prints:
-                        print(f"        ❌  Skipping invalid instruction: {self.asm_unit}")
-                        single_line_error = error.replace("\n", " ")
-                        print(f"                {single_line_error}")
-                    self._is_valid = False
-            else:
-                # print(f"    Generated Instruction: {self.asm_unit}")
+        if emit:
+            validate_generated_instructions([self])
+            if self._is_valid:
                 current_code_block = current_state.current_code_block
                 current_code_block.asm_units_list.append(self.asm_unit)
-        else:
-            current_code_block = current_state.current_code_block
-            current_code_block.asm_units_list.append(self.asm_unit)
 
     def __str__(self):
         instr = ""
@@ -80,30 +67,35 @@ class GeneratedInstruction:
         return instr
 
 
-def test_asm_instruction(instruction):
-    import subprocess
-    import tempfile
-    import os
+def validate_generated_instructions(gen_instructions: list) -> None:
+    """
+    Check the given instructions with the assembler (ARM, Debug_mode + Create_binary only), marking the failing ones
+    as invalid. Instructions created with emit=False are not checked on creation, and should be passed here in bulk,
+    so they are validated with a single assembler run.
+    """
+    asl_extract = True  # TODO:: remove this after testing!!!!
+    if not (Configuration.Architecture.arm and asl_extract):
+        return
+    config_manager = get_config_manager()
+    debug_mode = config_manager.get_value('Debug_mode')
+    create_binary = config_manager.get_value('Create_binary')
+    if not (debug_mode and create_binary):
+        return
 
-    assembler = "aarch64-unknown-linux-gnu-as"
-    flags = "-march=armv9-a+cssc+bf16+crypto"
+    results = get_asm_validator().validate([gen_instruction.asm_unit.get_code() for gen_instruction in gen_instructions])
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        asm_path = os.path.join(tmpdir, "test.s")
-        obj_path = os.path.join(tmpdir, "test.o")
+    instruction_debug_prints = config_manager.get_value('Instruction_debug_prints')
+    for gen_instruction, (success, error) in zip(gen_instructions, results):
+        if success:
+            if instruction_debug_prints:
+                print(f"        ✅  Debug mode: Generated Instruction: {gen_instruction.asm_unit}")
+        else:
+            if instruction_debug_prints:
+                print(f"        ❌  Skipping invalid instruction: {gen_instruction.asm_unit}")
+                single_line_error = error.replace("\n", " ")
+                print(f"                {single_line_error}")
+            gen_instruction._is_valid = False
 
-        # Wrap instruction in minimal valid ASM
-        with open(asm_path, "w") as f:
-            f.write(f"\t.text\n\t.global _start\n_start:\n\t{instruction}\n")
 
-        cmd = [assembler] + flags.split() + ["-o", obj_path, asm_path]
-        try:
-            # Create local environment with Arrow tool paths
-            env = os.environ.copy()
-            if 'ARROW_TOOL_PATH' in os.environ:
-                env['PATH'] = os.environ['ARROW_TOOL_PATH']
-                
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, env=env)
-            return True, ""
-        except subprocess.CalledProcessError as e:
-            return False, e.stderr
+def test_asm_instruction(instruction):
+    return get_asm_validator().validate([instruction])[0]
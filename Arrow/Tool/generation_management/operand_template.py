@@ -0,0 +1,117 @@
+import ast
+import re
+from typing import Any, NamedTuple, Optional, Tuple
+
+# Placeholder tokens inside an operand asm template, e.g. <Zd> and <T> in "<Zd>.<T>"
+TOKEN_PATTERN = re.compile(r"<[^>]+?>")
+
+
+class OperandTemplate(NamedTuple):
+    """
+    Immutable, precompiled render template of a single ARM operand.
+
+    The operand text is split into literal chunks around its <...> placeholder tokens. Rendering fills the first
+    token with the evaluated operand and the second one with the selected extension (if any), any other token is
+    kept verbatim. `kind` is the typed slot describing how the operand value is evaluated.
+    """
+    operand: Any                  # the source Operand record, for debug prints and src/dest mapping
+    kind: str                     # gpr, gpr_var, simd_fp, sve_reg, sve_pred, sve_pred_low, immediate, label, condition, memory_base, memory_offset, ...
+    size: Optional[int]
+    width: Optional[int]
+    is_zdn: bool
+    extensions: Tuple[str, ...]
+    literals: Tuple[str, ...]     # len(tokens) + 1 literal chunks
+    tokens: Tuple[str, ...]
+
+    def render(self, value: Any, extension: Optional[str] = None) -> str:
+        values = (str(value),) if extension is None else (str(value), extension)
+        parts = [self.literals[0]]
+        for i, token in enumerate(self.tokens):
+            parts.append(values[i] if i < len(values) else token)
+            parts.append(self.literals[i + 1])
+        return "".join(parts)
+
+
+class InstructionTemplate(NamedTuple):
+    """
+    Precompiled render templates of all operands of an instruction, sorted by operand index.
+    """
+    operands: Tuple[OperandTemplate, ...]
+    memory_usage: bool
+
+
+def get_operand_kind(op) -> str:
+    """Classify an operand into the typed slot used to evaluate its value"""
+    if op.is_memory:
+        if op.type_category == "register" and op.memory_role == "base":
+            return "memory_base"
+        elif op.type_category == "register":
+            return "memory_not_supported"
+        elif op.type_category == "immediate":
+            return "memory_offset"
+        return "unknown"
+    if op.type_category == "register":
+        if op.type == "reg" or "gpr_" in op.type:
+            return "gpr_var" if op.type == "gpr_var" else "gpr"
+        elif "simdfp_scalar" in op.type or "simdfp_vec" in op.type:
+            return "simd_fp"
+        elif op.type == "sve_reg":
+            return "sve_reg"
+        elif op.type == "sve_pred":
+            if op.width == 4:
+                return "sve_pred"
+            elif op.width == 3:
+                # width of 3 can only encode predicate registers at the range of p0-p7
+                return "sve_pred_low"
+            return "sve_pred_invalid_width"
+        return "register_unknown"
+    if op.type_category == "immediate":
+        return "immediate" if op.width is not None else "unknown"
+    if op.type == "label":
+        return "label"
+    if op.type == "condition":
+        return "condition"
+    return "unknown"
+
+
+def compile_operand_template(op) -> OperandTemplate:
+    if not op.is_valid:
+        # invalid operands are never rendered, generate_arm_asl rejects them when reached
+        return OperandTemplate(operand=op, kind="invalid", size=op.size, width=op.width, is_zdn=False,
+                               extensions=(), literals=("",), tokens=())
+
+    text = op.full_text.replace(" ", "")  # remove all inner spaces
+    if re.fullmatch(r"\{(.*)\}", op.text):
+        # code is wrapped with curly braces, most likely optional, removing it.
+        text = text.replace("{", "").replace("}", "")
+
+    extensions = ()
+    if op.extensions != "[]":
+        extensions = tuple(ast.literal_eval(op.extensions))
+
+    return OperandTemplate(
+        operand=op,
+        kind=get_operand_kind(op),
+        size=op.size,
+        width=op.width,
+        is_zdn=(op.syntax == "Zdn"),
+        extensions=extensions,
+        literals=tuple(TOKEN_PATTERN.split(text)),
+        tokens=tuple(TOKEN_PATTERN.findall(text)),
+    )
+
+
+def get_instruction_template(instruction) -> InstructionTemplate:
+    """
+    Return the precompiled template of an instruction, compiling it on first use.
+    The template is cached on the (shared, catalog-owned) instruction record, so all states and cores reuse it.
+    """
+    template = getattr(instruction, "instruction_template", None)
+    if template is None:
+        sorted_operands = sorted(instruction.operands, key=lambda op: op.index)
+        template = InstructionTemplate(
+            operands=tuple(compile_operand_template(op) for op in sorted_operands if op.is_operand),
+            memory_usage=any(op.is_memory for op in instruction.operands),
+        )
+        instruction.instruction_template = template
+    return template
@@ -1,4 +1,4 @@
-import random
+from Arrow.Utils.seed_management import rng
 
 from Arrow.Utils.configuration_management import Configuration, get_config_manager
 from Arrow.Tool.memory_management.memory_operand import Memory
@@ -91,15 +91,15 @@ def map_inputs_to_operands(selected_instruction, src, dest):
     if src is not None:
         if isinstance(src, Memory): src.type = "mem"
         src_locations = find_possible_locations(selected_instruction.operands, role="src", type=src.type)
-        src_location = random.choice(src_locations)
+        src_location = rng("generate").choice(src_locations)
     if dest is not None:
         if isinstance(dest, Memory): dest.type = "mem"
         dest_locations = find_possible_locations(selected_instruction.operands, role="dest", type=dest.type)
-        dest_location = random.choice(dest_locations)
+        dest_location = rng("generate").choice(dest_locations)
     if dest is not None and src is not None:
         # if both src/dest input was provided, need to make sure they dont targeting the same operand
-        random.shuffle(dest_locations)
-        random.shuffle(src_locations)
+        rng("generate").shuffle(dest_locations)
+        rng("generate").shuffle(src_locations)
         src_location = None
         dest_location = None
         # Assign locations without overlap
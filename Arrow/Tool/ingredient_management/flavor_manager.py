@@ -1,6 +1,7 @@
 import random
 from typing import List, Optional, Union
 import Arrow.Tool
+from Arrow.Utils.seed_management import rng
 """
 
 Flavor Management System Overview:
@@ -103,7 +104,7 @@ class FlavorManager:
         """Selects a flavor from registered templates or simple flavors."""
         if not self.flavor_templates_or_flavors:
             return None
-        selected = random.choice(self.flavor_templates_or_flavors)
+        selected = rng("ingredient").choice(self.flavor_templates_or_flavors)
         # If it's a FlavorTemplate, create a flavor using its logic
         if isinstance(selected, FlavorTemplate):
             return selected.create_flavor()
@@ -128,8 +129,8 @@ class Flavor:
                  tags: Optional = None, ingredients: Optional = None):
         self.name = name
         self.description = description if description is not None else "No description"
-        self.weight = weight if weight is not None else random.randint(5, 10)
-        self.count = count if count is not None else random.randint(5, 10)
+        self.weight = weight if weight is not None else rng("ingredient").randint(5, 10)
+        self.count = count if count is not None else rng("ingredient").randint(5, 10)
         self.tags = tags
         self.ingredients = ingredients
 
@@ -1,12 +1,13 @@
 
-import random
+from Arrow.Utils.seed_management import rng
 from typing import Optional, Dict, List, Union
 from Arrow.Utils.logger_management import get_logger
 from Arrow.Utils.configuration_management import Configuration
 from Arrow.Tool.state_management import get_state_manager
 from Arrow.Tool.state_management.switch_state import switch_code
 from Arrow.Tool.asm_libraries.asm_logger import AsmLogger
-from Arrow.Utils.APIs.choice import choice
+from Arrow.Utils.APIs.weighted_sampler import WeightedSampler, normalize_tags, get_tags_cache_key, get_tag_weights
+from Arrow.Tool.scenario_management.content_manifest import LazyContent
 
 
 
@@ -48,16 +49,33 @@ def to_generator(fn):
 class IngredientManager:
     def __init__(self):
         self._ingredients_pool = []
+        self._ingredients_by_name = {}  # class name -> position in _ingredients_pool
         self._ingredients_instances_pool =  {}    # Cache to store instances of ingredients
+        self._samplers = {}  # tag query -> WeightedSampler of the random ingredients, invalidated when the pool changes
 
     def __str__(self):
         return f"zohar: {self._ingredients_pool}"
 
+    def list_ingredients(self):
+        """Return a list of all ingredients for debugging or reporting purposes."""
+        return self._ingredients_pool
+
     def add_ingredient(self, ingredient_class):
-        """Register an ingredient into the pool."""
+        """
+        Register an ingredient into the pool.
+        An ingredient whose content manifest placeholder (LazyContent) is in the pool takes the placeholder's place.
+        """
 
         # Check for duplicate class names
-        if any(existing_ingredient.__name__ == ingredient_class.__name__ for existing_ingredient in self._ingredients_pool):
+        position = self._ingredients_by_name.get(ingredient_class.__name__)
+        if position is not None:
+            existing_ingredient = self._ingredients_pool[position]
+            if isinstance(existing_ingredient, LazyContent) and existing_ingredient.resolved is None \
+                    and not isinstance(ingredient_class, LazyContent):
+                # the placeholder's module was imported, same metadata so the cached samplers stay valid
+                existing_ingredient.resolved = ingredient_class
+                self._ingredients_pool[position] = ingredient_class
+                return
             raise ValueError(
                 f"An ingredient class with the name '{ingredient_class.__name__}' already exists in the pool. "
                 f"Conflicting classes : {ingredient_class}."
@@ -65,7 +83,36 @@ class IngredientManager:
 
         logger = get_logger()
         logger.debug(f"Add new ingredient {ingredient_class}")
+        self._ingredients_by_name[ingredient_class.__name__] = len(self._ingredients_pool)
         self._ingredients_pool.append(ingredient_class)
+        self._samplers.clear()
+
+    def _get_sampler(self, tags) -> WeightedSampler:
+        """
+        Return the weighted sampler of the random ingredients for a tag query, building it on first use.
+        Samplers are cached per tag query until an ingredient is added to the pool.
+        """
+        tags = normalize_tags(tags)
+        cache_key = get_tags_cache_key(tags)
+        sampler = self._samplers.get(cache_key) if cache_key is not None else None
+        if sampler is not None:
+            return sampler
+
+        # Filter ingredients that have random=True
+        random_ingredients = [s for s in self._ingredients_pool if s.random]
+        if not random_ingredients:
+            raise ValueError("No random ingredient available.")
+
+        weighted_objects_dict = get_tag_weights(random_ingredients, tags)
+
+        # Create a mapping of ingredient by tag, and ensure ingredients without tags are part of REST
+        if not weighted_objects_dict:
+            raise RuntimeError("No valid tags found with associated ingredients.")
+
+        sampler = WeightedSampler(weighted_objects_dict, subsystem="ingredient")
+        if cache_key is not None:
+            self._samplers[cache_key] = sampler
+        return sampler
 
     def get_random_ingredients(self, count:int = 1, tags: Optional[Union[Dict[Configuration.Tag, int],List[Configuration.Tag]]] = None, _precondition_retries: int = 10): #  -> List[Ingredient]:
         """
@@ -86,87 +133,32 @@ class IngredientManager:
         """
         logger = get_logger()
 
-        # Filter ingredients that have random=True
-        random_ingredients = [s for s in self._ingredients_pool if s.random]
-        if not random_ingredients:
-            raise ValueError("No random ingredient available.")
-
-        if tags is None:
-            # If no tags provided, default to 100% REST
-            tags = {Configuration.Tag.REST: 100}
-        elif (isinstance(tags, list)):
-            # If tags is a list, convert to dict with uniform weights
-            uniform_weight = 100 / len(tags) if tags else 0  # Avoid division by zero
-            tags = {tag: uniform_weight for tag in tags}
-        elif isinstance(tags, dict):
-            # list is of the correct instance, do nothing
-            pass
-        else:
-            # list is at an invalid type
-            raise TypeError(f"Expected 'tags' to be a dictionary or List, but got {type(tags).__name__}")
-
-        '''
-        Calculate Combined Weights: 
-        For each object, calculate a weight based on both its priority and the requested tag distribution. 
-        This combined weight can be the product of the object's priority and the distribution weight for each tag it has.
-        Construct a Weighted List: 
-        Create a list where each object appears with its combined weight. 
-        This list will include all objects with weights that reflect both the priority and the tag distribution.
-        Weighted Sampling: 
-        Use a single weighted random selection based on these combined weights to choose the required number of objects.
-        '''
-
-        # Step 1: Calculate combined weights for each object
-        weighted_objects_dict = {}
-        total_weight = 0
-        for ingredient in random_ingredients:
-            # calculate based on tags sum
-            tag_weights = sum(tags.get(tag, 0) for tag in ingredient.tags)
-            combined_weight = Configuration.PRIORITY_WEIGHTS[ingredient.priority] * tag_weights
-
-            # Only add to the list if combined_weight > 0
-            if combined_weight > 0:
-                # print(f" --- ingredient {ingredient}, priority = {ingredient.priority}, tags = {ingredient.tags}")
-                # print(f"               combined_weight {combined_weight} = priority_weight({PRIORITY_WEIGHTS[ingredient.priority]}) * tag_weight({tag_weights})")
-                total_weight += combined_weight
-                weighted_objects_dict[ingredient] = combined_weight
-
-        # Step 2: handle "direct" ingredients, calculate their weight and add to dict
-
-        for ingredient in random_ingredients:
-            if str(ingredient) in tags.keys():
-                # calculate relative weight
-                direct_ingredient_portion = tags[str(ingredient)] / sum(tags.values())
-                all_other_portion = 1 - direct_ingredient_portion
-                overall_weight = total_weight / all_other_portion
-                weighted_objects_dict[ingredient] = overall_weight * direct_ingredient_portion
-
-        # Step 3: use `Tool.choices` to randomize from weighted_objects_dict
-
-        # Create a mapping of ingredient by tag, and ensure ingredients without tags are part of REST
-        if not weighted_objects_dict:
-            raise RuntimeError("No valid tags found with associated ingredients.")
+        sampler = self._get_sampler(tags)
 
+        # candidates are drawn in batches, unless a callable precondition (that may consume random numbers itself)
+        # has to run between the draws to keep the random stream of a seed unchanged
+        batch_draws = not any(callable(getattr(ingredient, 'precondition', None)) for ingredient in sampler.items)
 
         selected_ingredients = []
         attempts = 0
         while len(selected_ingredients) < count and attempts < _precondition_retries:
-            attempts += 1
-
-        #for _ in range(_precondition_retries):
-            candidate = choice(values=weighted_objects_dict)
-
-            # Check precondition, if it exists and not None (yet allow False)
-            if hasattr(candidate, 'precondition') and not candidate.precondition is None:
-                if callable(candidate.precondition):
-                    if candidate.precondition():  # Call precondition if it exists
-                        selected_ingredients.append(candidate) # add the Selected ingredient
-                else: # bool precondition
-                    if candidate.precondition:  # check if precondition is true
-                        selected_ingredients.append(candidate) # add the Selected ingredient
-            else:
-                # If there is no precondition, treat it as valid
-                selected_ingredients.append(candidate)
+            draw_count = min(count - len(selected_ingredients), _precondition_retries - attempts) if batch_draws else 1
+            attempts += draw_count
+
+            for candidate in sampler.sample(draw_count):
+                if isinstance(candidate, LazyContent):
+                    candidate = candidate.resolve()  # first selection of a content manifest ingredient, import it
+                # Check precondition, if it exists and not None (yet allow False)
+                if hasattr(candidate, 'precondition') and not candidate.precondition is None:
+                    if callable(candidate.precondition):
+                        if candidate.precondition():  # Call precondition if it exists
+                            selected_ingredients.append(candidate) # add the Selected ingredient
+                    else: # bool precondition
+                        if candidate.precondition:  # check if precondition is true
+                            selected_ingredients.append(candidate) # add the Selected ingredient
+                else:
+                    # If there is no precondition, treat it as valid
+                    selected_ingredients.append(candidate)
 
         if len(selected_ingredients) < count:
             raise RuntimeError(f"Failed to retrieve {count} elements after {_precondition_retries} retries.")
@@ -219,7 +211,7 @@ class IngredientManager:
         first_call = True
         # Interleave execution between yields
         while init_stages:
-            random.shuffle(init_stages)  # shuffle order of selected ingredients
+            rng("ingredient").shuffle(init_stages)  # shuffle order of selected ingredients
             for staged_tuple in init_stages.copy():
                 ing = staged_tuple[0]
                 stage = staged_tuple[1]
@@ -255,7 +247,7 @@ class IngredientManager:
         first_call = True
         # Interleave execution between yields
         while stages:
-            random.shuffle(stages) # shuffle order of selected ingredients
+            rng("ingredient").shuffle(stages) # shuffle order of selected ingredients
             for staged_tuple in stages.copy():
                 ing = staged_tuple[0]
                 stage = staged_tuple[1]
@@ -290,7 +282,7 @@ class IngredientManager:
         first_call = True
         # Interleave execution between yields
         while stages:
-            random.shuffle(stages)  # shuffle order of selected ingredients
+            rng("ingredient").shuffle(stages)  # shuffle order of selected ingredients
             for staged_tuple in stages.copy():
                 ing = staged_tuple[0]
                 stage = staged_tuple[1]
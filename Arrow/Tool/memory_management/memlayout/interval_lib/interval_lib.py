@@ -1,4 +1,5 @@
-import random
+from Arrow.Utils.seed_management import rng
+from bisect import bisect_left, bisect_right, insort
 from typing import Dict, Any, Optional, List, Tuple, Union, Callable
 from .interval import Interval
 
@@ -13,6 +14,10 @@ It maintains a single list of intervals and provides operations to:
 - Query by metadata
 
 The caller is responsible for managing allocation states (unmapped/mapped/allocated).
+
+Intervals are kept sorted by start address, with a parallel key list for bisect lookups, so point/overlap
+queries are O(log n). A size-ordered index lets find_region visit only the intervals large enough for the request,
+without any sort.
 '''
 
 class IntervalLib:
@@ -21,6 +26,13 @@ class IntervalLib:
     
     Maintains a single list of intervals and provides operations to manipulate them.
     Does not track allocation state - that's the caller's responsibility.
+
+    Internal indexes (kept in sync by _insert/_delete):
+    - intervals: sorted by (start, seq), seq being an insertion counter that orders intervals sharing a start address
+    - _keys:     parallel (start, seq) list, for bisect
+    - _by_size:  (size, start, seq, interval) sorted list, the size-indexed free-list used by find_region
+                 ((size, start, seq) is unique, so entries never compare their intervals)
+    - _disjoint: False once two intervals overlap (e.g. the same PA mapped twice), queries then widen their window
     """
     
     def __init__(self, start_address: int = None, total_size: int = None, 
@@ -33,6 +45,10 @@ class IntervalLib:
         :param default_metadata: Default metadata for new intervals
         """
         self.intervals: List[Interval] = []
+        self._keys: List[Tuple[int, int]] = []
+        self._by_size: List[Tuple[int, int, int, Interval]] = []
+        self._next_seq = 0
+        self._disjoint = True
         self.default_metadata = default_metadata or {}
         
         # Initialize with a single interval if parameters provided
@@ -57,28 +73,19 @@ class IntervalLib:
             final_metadata.update(metadata)
             
         new_interval = Interval(start, size, final_metadata)
-        
-        # Try to merge with existing intervals
-        merged_intervals = [new_interval]
-        remaining_intervals = []
-        
-        for interval in self.intervals:
-            # Check if intervals can be merged
-            merged_any = False
-            for i, merged_interval in enumerate(merged_intervals):
-                if merged_interval.can_merge_with(interval):
-                    merged_intervals[i] = merged_interval.merge_with(interval)
-                    merged_any = True
-                    break
-            
-            if not merged_any:
-                remaining_intervals.append(interval)
-        
-        # Update intervals
-        self.intervals = remaining_intervals + merged_intervals
-        
-        # Further merge any adjacent intervals
-        self._merge_adjacent_intervals()
+        index = self._insert(new_interval, self._new_seq())
+
+        # Merge with adjacent intervals of compatible metadata, on both sides
+        while index > 0 and self.intervals[index - 1].can_merge_with(self.intervals[index]):
+            merged = self.intervals[index - 1].merge_with(self.intervals[index])
+            self._delete(index)
+            self._delete(index - 1)
+            index = self._insert(merged, self._new_seq())
+        while index + 1 < len(self.intervals) and self.intervals[index].can_merge_with(self.intervals[index + 1]):
+            merged = self.intervals[index].merge_with(self.intervals[index + 1])
+            self._delete(index + 1)
+            self._delete(index)
+            index = self._insert(merged, self._new_seq())
         return True
 
     def remove_region(self, start: int, size: int) -> bool:
@@ -93,45 +100,43 @@ class IntervalLib:
         if size <= 0:
             return False
             
-        modified = False
-        new_intervals = []
-        
-        for interval in self.intervals:
-            # No overlap case - keep the interval as is
-            if not interval.overlaps(start, size):
-                new_intervals.append(interval)
-                continue
-                
-            modified = True
-            
+        overlapping = [i for i in self._candidate_range(start, size) if self.intervals[i].overlaps(start, size)]
+        if not overlapping:
+            return False
+
+        replaced = []  # (seq, fragments) of every overlapping interval
+        for i in reversed(overlapping):
+            interval = self.intervals[i]
+            seq = self._keys[i][1]
+            self._delete(i)
+
+            fragments = []
             # Check if we need to create fragments
             if interval.contains(start, size):
                 # Split the interval
                 before, _, after = interval.split_at(start, size)
-                if before:
-                    new_intervals.append(before)
-                if after:
-                    new_intervals.append(after)
+                fragments = [fragment for fragment in (before, after) if fragment]
             elif start <= interval.start and start + size >= interval.end:
                 # Remove entire interval (it's fully contained in the region to remove)
-                pass  # Don't add it to new_intervals
+                pass
             elif start <= interval.start:
                 # Partial overlap at the beginning
                 remaining_start = start + size
                 remaining_size = interval.end - remaining_start
                 if remaining_size > 0:
-                    remaining = Interval(remaining_start, remaining_size, interval.metadata.copy())
-                    new_intervals.append(remaining)
+                    fragments.append(Interval(remaining_start, remaining_size, interval.metadata.copy()))
             else:
                 # Partial overlap at the end
                 remaining_size = start - interval.start
                 if remaining_size > 0:
-                    remaining = Interval(interval.start, remaining_size, interval.metadata.copy())
-                    new_intervals.append(remaining)
-        
-        # Update intervals list
-        self.intervals = new_intervals
-        return modified
+                    fragments.append(Interval(interval.start, remaining_size, interval.metadata.copy()))
+            replaced.append((seq, fragments))
+
+        # fragments keep the ordering rank of the interval they were cut from
+        for seq, fragments in replaced:
+            for fragment in fragments:
+                self._insert(fragment, seq)
+        return True
 
     def find_region(self, size: int, alignment_bits: int = None, 
                    criteria: Dict[str, Any] = None, 
@@ -158,7 +163,7 @@ class IntervalLib:
             return None
             
         # Select an interval - randomized
-        chosen_idx = random.randrange(0, len(suitable_intervals)) if len(suitable_intervals) > 1 else 0
+        chosen_idx = rng("layout").randrange(0, len(suitable_intervals)) if len(suitable_intervals) > 1 else 0
         interval, first_aligned, last_aligned = suitable_intervals[chosen_idx]
         
         # Determine the position within the interval - always randomized
@@ -166,12 +171,12 @@ class IntervalLib:
             # Count number of possible positions
             count = ((last_aligned - first_aligned) // alignment) + 1
             # Choose a random position
-            random_offset = random.randint(0, count - 1) * alignment
+            random_offset = rng("layout").randint(0, count - 1) * alignment
             position_start = first_aligned + random_offset
         elif alignment <= 1:
             # Randomize the position within the selected interval
             max_start = interval.start + interval.size - size
-            position_start = random.randint(interval.start, max_start)
+            position_start = rng("layout").randint(interval.start, max_start)
         else:
             # Just use first aligned position if there's only one option
             position_start = first_aligned
@@ -191,27 +196,25 @@ class IntervalLib:
             return None
         
         # Find the interval that contains this region
-        containing_interval = None
-        for interval in self.intervals:
-            if interval.contains(start, size):
-                containing_interval = interval
-                break
-        
-        if not containing_interval:
+        containing_index = self._find_containing(start, size)
+        if containing_index is None:
             return None
-        
+
+        containing_interval = self.intervals[containing_index]
+        seq = self._keys[containing_index][1]
+
         # Split the interval
         before, split_interval, after = containing_interval.split_at(start, size)
-        
+
         # Remove the original interval
-        self.intervals.remove(containing_interval)
-        
+        self._delete(containing_index)
+
         # Add back the fragments
         if before:
-            self.intervals.append(before)
+            self._insert(before, seq)
         if after:
-            self.intervals.append(after)
-        
+            self._insert(after, seq)
+
         return split_interval
 
     def contains_region(self, start: int, size: int, criteria: Dict[str, Any] = None) -> bool:
@@ -226,17 +229,14 @@ class IntervalLib:
         if size <= 0:
             return True
         
-        # Check each interval
-        for interval in self.intervals:
-            # Check criteria compatibility
-            if criteria and not interval.matches_criteria(criteria):
-                continue
-            
-            # If the region is fully contained in this interval, it's available
-            if interval.contains(start, size):
-                return True
-                
-        return False
+        return self._find_containing(start, size, criteria) is not None
+
+    def is_region_available(self, start: int, size: int, criteria: Dict[str, Any] = None) -> bool:
+        """
+        Check if a specific region is fully available (contained) within the intervals.
+        Alias of contains_region, used by the page table availability checks.
+        """
+        return self.contains_region(start, size, criteria)
 
     def get_intervals(self, criteria: Dict[str, Any] = None, 
                      custom_filter: Callable[[Interval], bool] = None) -> List[Interval]:
@@ -307,6 +307,9 @@ class IntervalLib:
     def clear(self):
         """Clear all intervals."""
         self.intervals.clear()
+        self._keys.clear()
+        self._by_size.clear()
+        self._disjoint = True
 
     def is_empty(self) -> bool:
         """Check if there are no intervals."""
@@ -354,8 +357,11 @@ class IntervalLib:
             return []
             
         suitable_intervals = []
-        
-        for interval in self.intervals:
+
+        # Only the intervals large enough are visited, in size order, straight from the size index
+        for entry_index in range(bisect_left(self._by_size, (size,)), len(self._by_size)):
+            interval = self._by_size[entry_index][3]
+
             # Check criteria compatibility
             if criteria and not interval.matches_criteria(criteria):
                 continue
@@ -383,29 +389,54 @@ class IntervalLib:
                     
         return suitable_intervals
 
-    def _merge_adjacent_intervals(self):
-        """Helper method to merge any adjacent intervals with compatible metadata."""
-        if not self.intervals or len(self.intervals) < 2:
-            return
-            
-        # Sort intervals by start address for easier merging
-        self.intervals.sort(key=lambda interval: interval.start)
-        
-        # Merge adjacent intervals
-        i = 0
-        while i < len(self.intervals) - 1:
-            current = self.intervals[i]
-            next_interval = self.intervals[i + 1]
-            
-            # If intervals can be merged
-            if current.can_merge_with(next_interval):
-                # Merge them
-                merged = current.merge_with(next_interval)
-                self.intervals[i] = merged
-                # Remove the next interval
-                del self.intervals[i + 1]
-            else:
-                i += 1
+    def _new_seq(self) -> int:
+        seq = self._next_seq
+        self._next_seq += 1
+        return seq
+
+    def _insert(self, interval: Interval, seq: int) -> int:
+        """Insert an interval into all indexes, returning its position in the sorted list."""
+        key = (interval.start, seq)
+        index = bisect_left(self._keys, key)
+        if self._disjoint:
+            # the list is disjoint and sorted, so the new interval can only overlap its direct neighbours
+            if (index > 0 and self.intervals[index - 1].end > interval.start) or \
+                    (index < len(self.intervals) and self.intervals[index].start < interval.end):
+                self._disjoint = False
+        self.intervals.insert(index, interval)
+        self._keys.insert(index, key)
+        insort(self._by_size, (interval.size, interval.start, seq, interval))
+        return index
+
+    def _delete(self, index: int) -> Interval:
+        """Remove the interval at the given position from all indexes."""
+        interval = self.intervals.pop(index)
+        start, seq = self._keys.pop(index)
+        del self._by_size[bisect_left(self._by_size, (interval.size, start, seq))]
+        return interval
+
+    def _candidate_range(self, start: int, size: int) -> range:
+        """Positions of the intervals that may overlap or contain [start, start + size)."""
+        hi = bisect_left(self._keys, (start + size,))
+        if not self.intervals:
+            return range(0)
+        if self._disjoint:
+            # only the interval starting right before `start` may reach into the region
+            lo = max(0, bisect_left(self._keys, (start,)) - 1)
+        else:
+            # an overlapping interval can't start earlier than the largest interval size before `start`
+            lo = bisect_left(self._keys, (start - self._by_size[-1][0] + 1,))
+        return range(lo, hi)
+
+    def _find_containing(self, start: int, size: int, criteria: Dict[str, Any] = None) -> Optional[int]:
+        """Position of the first interval (matching criteria) that fully contains the region, or None."""
+        for i in self._candidate_range(start, max(size, 1)):
+            interval = self.intervals[i]
+            if criteria and not interval.matches_criteria(criteria):
+                continue
+            if interval.contains(start, size):
+                return i
+        return None
 
     def find_and_remove(self, size: int, alignment_bits: int = None, 
                        metadata_filter: Callable[[Dict[str, Any]], bool] = None) -> Tuple[int, int]:
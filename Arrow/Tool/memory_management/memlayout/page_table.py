@@ -1,4 +1,4 @@
-import random
+from Arrow.Utils.seed_management import rng
 from typing import List, Dict, Optional, Tuple
 
 from Arrow.Tool.memory_management.memory_logger import get_memory_logger
@@ -51,7 +51,7 @@ class PageTable:
             execution_context: Execution context (EL3, EL1_NS, EL1_S, EL2_NS, EL2_S, etc.)
         """
         logger = get_memory_logger()
-        logger.info(f"============ setting up PageTable: {page_table_name} for {core_id}")
+        logger.info("============ setting up PageTable: %s for %s", page_table_name, core_id)
 
         self.page_table_name = page_table_name
         self.core_id = core_id
@@ -109,14 +109,14 @@ class PageTable:
         Returns: (va_start, pa_start, size) - where va_start == pa_start
         """
         logger = get_memory_logger()
-        logger.info(f"Searching for unmapped region where VA=PA is possible, size: {size_bytes}, alignment: {alignment_bits}")
+        logger.info("Searching for unmapped region where VA=PA is possible, size: %s, alignment: %s", size_bytes, alignment_bits)
         
         # Get the unmapped VA and PA intervals
         #va_intervals = memory_space_manager.state_unmapped_va_intervals[state_name].free_intervals
         va_intervals = self.unmapped_va_intervals.get_intervals()
         pa_intervals = page_table_manager.unmapped_pa_intervals.get_intervals()
         
-        logger.info(f"Found {len(va_intervals)} unmapped VA regions and {len(pa_intervals)} unmapped PA regions")
+        logger.info("Found %s unmapped VA regions and %s unmapped PA regions", len(va_intervals), len(pa_intervals))
         
         # Find overlapping regions where VA can equal PA
         matching_regions = []
@@ -140,7 +140,7 @@ class PageTable:
                         matching_regions.append((overlap_start, overlap_size))
         
         if not matching_regions:
-            logger.error(f"Could not find any unmapped region where VA=PA is possible for size {size_bytes}")
+            logger.error("Could not find any unmapped region where VA=PA is possible for size %s", size_bytes)
             raise ValueError(f"Could not find any unmapped region where VA=PA is possible for size {size_bytes}")
         
         # Apply alignment and find suitable intervals (similar to find_region logic)
@@ -162,12 +162,12 @@ class PageTable:
                 suitable_intervals.append(((region_start, region_size), region_start, region_start + region_size - size_bytes))
                 
         if not suitable_intervals:
-            logger.error(f"Could not find any aligned unmapped region where VA=PA is possible for size {size_bytes}")
+            logger.error("Could not find any aligned unmapped region where VA=PA is possible for size %s", size_bytes)
             raise ValueError(f"Could not find any aligned unmapped region where VA=PA is possible for size {size_bytes}")
         
         # Randomize interval selection (similar to find_region)
         if len(suitable_intervals) > 1:
-            chosen_idx = random.randrange(0, len(suitable_intervals))
+            chosen_idx = rng("layout").randrange(0, len(suitable_intervals))
         else:
             chosen_idx = 0
             
@@ -181,7 +181,7 @@ class PageTable:
                 # Count number of possible aligned positions
                 count = ((last_aligned - first_aligned) // alignment) + 1
                 # Choose a random position
-                random_offset = random.randint(0, count - 1) * alignment
+                random_offset = rng("layout").randint(0, count - 1) * alignment
                 va_start = first_aligned + random_offset
             else:
                 # Only one aligned position possible
@@ -189,26 +189,26 @@ class PageTable:
         else:
             # No alignment, randomize within the entire suitable range
             max_start = region_start + region_size - size_bytes
-            va_start = random.randint(region_start, max_start)
+            va_start = rng("layout").randint(region_start, max_start)
         
         pa_start = va_start  # VA=PA constraint
-        logger.info(f"Selected VA=PA unmapped region at address 0x{va_start:x} (VA=PA), size: {size_bytes}")
+        logger.info("Selected VA=PA unmapped region at address 0x%x (VA=PA), size: %s", va_start, size_bytes)
         
         return va_start, pa_start, size_bytes
 
     def allocate_page(self, size:Configuration.Page_sizes=None, alignment_bits:int=None, page_type:Configuration.Page_types=None, permissions:int=None, cacheable:str=None, shareable:str=None, custom_attributes:dict=None, sequential_page_count:int=1, VA_eq_PA:bool=False, force_address:int=None):
         logger = get_memory_logger()
         logger.info("")
-        logger.info(f"======================== PageTableManager - allocate_page for '{self.page_table_name}' PageTable")
-        logger.info(f"==== size: {size}, alignment_bits: {alignment_bits}, page_type: {page_type}, permissions: {permissions}, cacheable: {cacheable}, shareable: {shareable}, custom_attributes: {custom_attributes}, sequential_page_count: {sequential_page_count}, VA_eq_PA: {VA_eq_PA}")
+        logger.info("======================== PageTableManager - allocate_page for '%s' PageTable", self.page_table_name)
+        logger.info("==== size: %s, alignment_bits: %s, page_type: %s, permissions: %s, cacheable: %s, shareable: %s, custom_attributes: %s, sequential_page_count: %s, VA_eq_PA: %s", size, alignment_bits, page_type, permissions, cacheable, shareable, custom_attributes, sequential_page_count, VA_eq_PA)
 
         if force_address is not None:
-            logger.info(f"==== allocate_page - force_address: {force_address}")
+            logger.info("==== allocate_page - force_address: %s", force_address)
             if not VA_eq_PA:
                 raise ValueError("force_address is only supported when VA_eq_PA is True")
 
         if size is None:
-            size = random.choice([Configuration.Page_sizes.SIZE_4K, Configuration.Page_sizes.SIZE_2M])#, Configuration.Page_sizes.SIZE_1G])
+            size = rng("layout").choice([Configuration.Page_sizes.SIZE_4K, Configuration.Page_sizes.SIZE_2M])#, Configuration.Page_sizes.SIZE_1G])
         else:
             if size not in [Configuration.Page_sizes.SIZE_4K, Configuration.Page_sizes.SIZE_2M]:#, Configuration.Page_sizes.SIZE_1G]:
                 raise ValueError(f"Size must be 4KB or 2MB. {size} is not valid. 1GB is still not supported.")
@@ -268,7 +268,7 @@ class PageTable:
         # Step 1: Find and allocate regions from unmapped space
         try:
             if force_address:
-                logger.info(f"Allocating unmapped memory with force_address VA=PA={hex(force_address)}, size: {hex(full_size_bytes)}")
+                logger.info("Allocating unmapped memory with force_address VA=PA=%#x, size: %#x", force_address, full_size_bytes)
                 va_start = force_address
                 pa_start = force_address
                 size = full_size_bytes
@@ -279,28 +279,28 @@ class PageTable:
                 
                 # Log the results of removal attempts
                 if not va_removed:
-                    logger.warning(f"VA region 0x{va_start:x}-0x{va_start + size - 1:x} was not found in unmapped VA intervals - may already be mapped or have overlaps")
+                    logger.warning("VA region 0x%x-0x%x was not found in unmapped VA intervals - may already be mapped or have overlaps", va_start, va_start + size - 1)
                 else:
-                    logger.info(f"Successfully removed VA region 0x{va_start:x}-0x{va_start + size - 1:x} from unmapped intervals")
+                    logger.info("Successfully removed VA region 0x%x-0x%x from unmapped intervals", va_start, va_start + size - 1)
                     
                 if not pa_removed:
-                    logger.warning(f"PA region 0x{pa_start:x}-0x{pa_start + size - 1:x} was not found in unmapped PA intervals - may already be mapped or have overlaps")
+                    logger.warning("PA region 0x%x-0x%x was not found in unmapped PA intervals - may already be mapped or have overlaps", pa_start, pa_start + size - 1)
                 else:
-                    logger.info(f"Successfully removed PA region 0x{pa_start:x}-0x{pa_start + size - 1:x} from unmapped intervals")
+                    logger.info("Successfully removed PA region 0x%x-0x%x from unmapped intervals", pa_start, pa_start + size - 1)
                 
                 # Check if we should fail when regions can't be removed
                 if not va_removed or not pa_removed:
-                    logger.error(f"Force address allocation failed - requested regions are not available in unmapped space")
+                    logger.error("Force address allocation failed - requested regions are not available in unmapped space")
                     raise ValueError(f"Cannot allocate at forced address 0x{force_address:x} - region is not available in unmapped space (VA removed: {va_removed}, PA removed: {pa_removed})")
                 
                 # Map the VA to PA with equal addresses
                 page_table_manager.map_va_to_pa(self, va_start, pa_start, size, page_type)
                 
                 va_size = size
-                logger.info(f"Successfully allocated and mapped force address memory at 0x{va_start:x}, size: {hex(size)}")
+                logger.info("Successfully allocated and mapped force address memory at 0x%x, size: %#x", va_start, size)
                 
             elif VA_eq_PA:
-                logger.info(f"Allocating unmapped memory with VA=PA constraint, size: {full_size_bytes}, alignment: {alignment_bits}")
+                logger.info("Allocating unmapped memory with VA=PA constraint, size: %s, alignment: %s", full_size_bytes, alignment_bits)
                 
                 # Find a region that is available at the same address in both VA and PA unmapped spaces
                 va_start, pa_start, size = self._find_va_eq_pa_unmapped_region(
@@ -320,7 +320,7 @@ class PageTable:
                 page_table_manager.map_va_to_pa(self, va_start, pa_start, size, page_type)
                 
                 va_size = size
-                logger.info(f"Successfully allocated and mapped VA=PA memory at 0x{va_start:x}, size: {hex(size)}")
+                logger.info("Successfully allocated and mapped VA=PA memory at 0x%x, size: %#x", va_start, size)
                 
             else:
                 # Original implementation for non-VA_eq_PA case
@@ -336,7 +336,7 @@ class PageTable:
                 page_table_manager.map_va_to_pa(self, va_start, pa_start, va_size, page_type)
                 
         except (ValueError, MemoryError) as e:
-            logger.error(f"Failed to allocate page memory: {e}")
+            logger.error("Failed to allocate page memory: %s", e)
             raise ValueError(f"Could not allocate memory regions of size {full_size_bytes} with alignment {alignment_bits}")
         
         # Create the page objects for each page in the sequence
@@ -359,7 +359,7 @@ class PageTable:
             self.page_table_entries_by_type[page.page_type].append(page)
             result.append(page)
             
-            logger.info(f"Created page: {page}")
+            logger.info("Created page: %s", page)
             
         # Return result based on sequential_page_count
         if sequential_page_count == 1:
@@ -389,7 +389,7 @@ class PageTable:
         shareable = Page.SHARE_NONE
         custom_attributes = {}
 
-        logger.info(f"==== size: {size}, alignment_bits: {alignment_bits}, page_type: {page_type}, permissions: {permissions}, cacheable: {cacheable}, shareable: {shareable}, custom_attributes: {custom_attributes}")
+        logger.info("==== size: %s, alignment_bits: %s, page_type: %s, permissions: %s, cacheable: %s, shareable: %s, custom_attributes: %s", size, alignment_bits, page_type, permissions, cacheable, shareable, custom_attributes)
 
         size_bytes = size.value
 
@@ -409,7 +409,7 @@ class PageTable:
             all_page_tables = page_table_manager.get_all_page_tables()
             
             for page_table in all_page_tables:
-                logger.info(f"core_page_tables for {page_table.core_id}: {page_table.page_table_name}")
+                logger.info("core_page_tables for %s: %s", page_table.core_id, page_table.page_table_name)
 
                 va_start, va_size = page_table.unmapped_va_intervals.find_and_remove(size_bytes, alignment_bits)
                 
@@ -436,11 +436,11 @@ class PageTable:
                 page_table.page_table_entries_by_type[page.page_type].append(page)
                 
                 
-                logger.info(f"Created Cross-Core page {page_table.core_id}:{page_table.page_table_name} - {page}")
+                logger.info("Created Cross-Core page %s:%s - %s", page_table.core_id, page_table.page_table_name, page)
 
 
         except (ValueError, MemoryError) as e:
-            logger.error(f"Failed to allocate page memory: {e}")
+            logger.error("Failed to allocate page memory: %s", e)
             raise ValueError(f"Could not allocate memory regions of size {size} with alignment {alignment_bits}")
         
     
@@ -471,10 +471,10 @@ class PageTable:
         if page_size is None or page_size <= 0:
             raise ValueError(f"page_size must be positive, got: {page_size}")
             
-        logger.info(f"Allocating memory of size {hex(size)} for page_table '{self.page_table_name}' with page_type {page_type}, alignment_bits={alignment_bits}, VA_eq_PA={VA_eq_PA}, force_address={hex(force_address) if force_address else None}")
+        logger.info("Allocating memory of size %#x for page_table '%s' with page_type %s, alignment_bits=%s, VA_eq_PA=%s, force_address=%s", size, self.page_table_name, page_type, alignment_bits, VA_eq_PA, hex(force_address) if force_address else None)
         
         if force_address is not None:
-            logger.info(f"==== allocate_segment - force_address: {hex(force_address)}")
+            logger.info("==== allocate_segment - force_address: %#x", force_address)
             if not VA_eq_PA:
                 raise ValueError("force_address is only supported when VA_eq_PA is True")
         
@@ -489,7 +489,7 @@ class PageTable:
             if alignment_bits is not None:
                 alignment = 1 << alignment_bits
                 if va_start % alignment != 0:
-                    logger.error(f"Forced address 0x{va_start:x} is not aligned to {alignment_bits} bits!")
+                    logger.error("Forced address 0x%x is not aligned to %s bits!", va_start, alignment_bits)
                     raise ValueError(f"Forced address 0x{va_start:x} is not aligned to {alignment_bits} bits (required alignment: {alignment})")
             
             # Find overlapping pages (we still need this for the allocation object)
@@ -502,7 +502,7 @@ class PageTable:
                     overlapping_pages.append(page)
             
             overlapping_pages.sort(key=lambda p: p.va)
-            logger.info(f"Found {len(overlapping_pages)} pages for forced address allocation")
+            logger.info("Found %s pages for forced address allocation", len(overlapping_pages))
             
         elif VA_eq_PA:
             va_start, pa_start, overlapping_pages = self._find_va_eq_pa_addresses(size, page_type, alignment_bits, page_size)
@@ -515,7 +515,7 @@ class PageTable:
                     break  # Success, exit retry loop
                 except ValueError as e:
                     if "PA conflict in cross-core page" in str(e) and attempt < max_retries - 1:
-                        logger.info(f"Retry attempt {attempt + 1}/{max_retries} due to cross-core PA conflict")
+                        logger.info("Retry attempt %s/%s due to cross-core PA conflict", attempt + 1, max_retries)
                         continue  # Try again with a different VA
                     else:
                         raise  # Re-raise the error if we've exhausted retries or it's a different error
@@ -535,7 +535,7 @@ class PageTable:
             for page in overlapping_pages:
                 if hasattr(page, 'is_cross_core') and page.is_cross_core:
                     is_cross_core_allocation = True
-                    logger.info(f"Detected allocation within cross-core page: {page}")
+                    logger.info("Detected allocation within cross-core page: %s", page)
                     break
         
         if is_cross_core_allocation:
@@ -553,26 +553,27 @@ class PageTable:
                     if alloc.metadata and alloc.metadata.get('cross_core', False):
                         pa_has_conflict = True
                         conflicting_allocations.append(alloc)
-                        logger.warning(f"PA region {hex(pa_start)}-{hex(pa_start+size-1)} overlaps with cross-core allocation: PA={hex(alloc.start)}-{hex(alloc.start+alloc.size-1)}, metadata={alloc.metadata}")
+                        logger.warning("PA region %#x-%#x overlaps with cross-core allocation: PA=%#x-%#x, metadata=%s", pa_start, pa_start+size-1, alloc.start, alloc.start+alloc.size-1, alloc.metadata)
             
             if pa_has_conflict:
                 # This is a genuine cross-core conflict - reject it
-                logger.error(f"PA region {hex(pa_start)}-{hex(pa_start+size-1)} conflicts with {len(conflicting_allocations)} existing cross-core allocations!")
+                logger.error("PA region %#x-%#x conflicts with %s existing cross-core allocations!", pa_start, pa_start+size-1, len(conflicting_allocations))
                 for alloc in conflicting_allocations:
-                    logger.error(f"  Conflict with: PA={hex(alloc.start)}-{hex(alloc.start+alloc.size-1)}, metadata={alloc.metadata}")
+                    logger.error("  Conflict with: PA=%#x-%#x, metadata=%s", alloc.start, alloc.start+alloc.size-1, alloc.metadata)
                 raise ValueError(f"Cannot allocate PA region {hex(pa_start)}-{hex(pa_start+size-1)} - conflicts with existing cross-core allocations (this prevents memory overlap)")
             else:
                 # No cross-core conflicts detected, proceed with allocation
                 page_table_manager.allocated_pa_intervals.add_region(pa_start, size, metadata={"page_type": page_type, "page_table": self.page_table_name, "cross_core_aware": True})
                 pa_removed = page_table_manager.non_allocated_pa_intervals.remove_region(pa_start, size)
-                logger.info(f"Successfully allocated PA region in cross-core page (no conflicts): PA={hex(pa_start)}-{hex(pa_start+size-1)}")
-                logger.info(f"PA removed from non_allocated: {pa_removed}")
+                logger.info("Successfully allocated PA region in cross-core page (no conflicts): PA=%#x-%#x", pa_start, pa_start+size-1)
+                logger.info("PA removed from non_allocated: %s", pa_removed)
                 
                 # Debug: Log current state of allocated PA intervals
-                all_pa_allocations = page_table_manager.allocated_pa_intervals.get_intervals()
-                logger.info(f"Current PA allocations after this allocation: {len(all_pa_allocations)} regions")
-                for i, alloc in enumerate(all_pa_allocations):
-                    logger.info(f"  PA allocation {i}: {hex(alloc.start)}-{hex(alloc.start+alloc.size-1)}, metadata={alloc.metadata}")
+                if logger.is_enabled_for("info"):
+                    all_pa_allocations = page_table_manager.allocated_pa_intervals.get_intervals()
+                    logger.info("Current PA allocations after this allocation: %s regions", len(all_pa_allocations))
+                    for i, alloc in enumerate(all_pa_allocations):
+                        logger.info("  PA allocation %s: %#x-%#x, metadata=%s", i, alloc.start, alloc.start+alloc.size-1, alloc.metadata)
             
             pa_removed = True  # We handled it above
         else:
@@ -582,11 +583,11 @@ class PageTable:
         
         # Check if removal failed (region not available) - this catches overlaps
         if not va_removed:
-            logger.error(f"VA region 0x{va_start:x}-0x{va_start + size - 1:x} is not available in non-allocated intervals")
+            logger.error("VA region 0x%x-0x%x is not available in non-allocated intervals", va_start, va_start + size - 1)
             raise ValueError(f"Cannot allocate at address 0x{va_start:x} - VA region is not available in non-allocated space")
         
         if not pa_removed:
-            logger.error(f"PA region 0x{pa_start:x}-0x{pa_start + size - 1:x} is not available in non-allocated intervals")
+            logger.error("PA region 0x%x-0x%x is not available in non-allocated intervals", pa_start, pa_start + size - 1)
             raise ValueError(f"Cannot allocate at address 0x{pa_start:x} - PA region is not available in non-allocated space")
                 
         # Create page mappings list for cross-page allocations
@@ -613,9 +614,9 @@ class PageTable:
         
         # Debug information
         if VA_eq_PA:
-            logger.info(f"Created VA=PA allocation: VA=PA=0x{va_start:x}, size={size}")
+            logger.info("Created VA=PA allocation: VA=PA=0x%x, size=%s", va_start, size)
         else:
-            logger.info(f"Created allocation: VA=0x{va_start:x}, PA=0x{pa_start:x}, size={size}")
+            logger.info("Created allocation: VA=0x%x, PA=0x%x, size=%s", va_start, pa_start, size)
         
         self.allocations.append(allocation)
         return allocation
@@ -703,9 +704,9 @@ class PageTable:
         for page in pages:
             if page.va == page.pa:
                 va_eq_pa_pages.append(page)
-        logger.info(f"Found {len(va_eq_pa_pages)} pages that satisfy VA=PA")
-        selected_page = random.choice(va_eq_pa_pages)
-        logger.info(f"Selected page: {selected_page}")
+        logger.info("Found %s pages that satisfy VA=PA", len(va_eq_pa_pages))
+        selected_page = rng("layout").choice(va_eq_pa_pages)
+        logger.info("Selected page: %s", selected_page)
         
         # Get the available regions for both VA and PA
         all_va_intervals = self.non_allocated_va_intervals.get_intervals(criteria={"page_type": page_type})
@@ -728,19 +729,19 @@ class PageTable:
                     from Arrow.Tool.memory_management.memlayout.interval_lib.interval_lib import Interval
                     intersection_interval = Interval(intersection_start, intersection_size, interval.metadata)
                     suitable_intervals.append(intersection_interval)
-                    logger.info(f"Found suitable intersection: 0x{intersection_start:x}-0x{intersection_end:x} (size: 0x{intersection_size:x}) from interval 0x{interval.start:x}-0x{interval.start + interval.size - 1:x}")
+                    logger.info("Found suitable intersection: 0x%x-0x%x (size: 0x%x) from interval 0x%x-0x%x", intersection_start, intersection_end, intersection_size, interval.start, interval.start + interval.size - 1)
                 else:
-                    logger.info(f"Intersection too small: 0x{intersection_start:x}-0x{intersection_end:x} (size: 0x{intersection_size:x}) < required 0x{size:x}")
+                    logger.info("Intersection too small: 0x%x-0x%x (size: 0x%x) < required 0x%x", intersection_start, intersection_end, intersection_size, size)
             # else:
             #     memory_log(f"No overlap: interval 0x{interval.start:x}-0x{interval.start + interval.size - 1:x} with page 0x{selected_page.va:x}-0x{selected_page.end_va:x}")
         
         if len(suitable_intervals) == 0:
-            logger.error(f"No available {page_type} regions inside VA=PA page that fit size {size}")
+            logger.error("No available %s regions inside VA=PA page that fit size %s", page_type, size)
             raise ValueError(f"No available {page_type} regions inside VA=PA page that fit size {size}")
         
         # Select one suitable interval (could be random or first)
-        selected_interval = random.choice(suitable_intervals)
-        logger.info(f"Selected interval inside VA=PA page: {hex(selected_interval.start)}-{hex(selected_interval.start + selected_interval.size - 1)}, size: 0x{selected_interval.size:x}")
+        selected_interval = rng("layout").choice(suitable_intervals)
+        logger.info("Selected interval inside VA=PA page: %#x-%#x, size: 0x%x", selected_interval.start, selected_interval.start + selected_interval.size - 1, selected_interval.size)
         
         # Apply alignment and find position within the selected interval
         if alignment_bits is not None:
@@ -750,7 +751,7 @@ class PageTable:
             
             # Check if the aligned allocation fits within the interval
             if aligned_start + size > selected_interval.start + selected_interval.size:
-                logger.error(f"Aligned allocation doesn't fit in interval")
+                logger.error("Aligned allocation doesn't fit in interval")
                 raise ValueError(f"Cannot fit aligned allocation of size {size} with alignment {alignment_bits} bits in selected interval")
             
             # Randomize position within the aligned possibilities
@@ -758,19 +759,19 @@ class PageTable:
             if max_aligned_offset > 0:
                 # Calculate how many aligned positions are possible
                 num_positions = (max_aligned_offset // alignment) + 1
-                random_position = random.randrange(num_positions)
+                random_position = rng("layout").randrange(num_positions)
                 random_offset = random_position * alignment
                 aligned_start += random_offset
-                logger.info(f"Randomized aligned position: offset 0x{random_offset:x} from first aligned address")
+                logger.info("Randomized aligned position: offset 0x%x from first aligned address", random_offset)
             
             va_start = pa_start = aligned_start
         else:
             # No alignment required, randomize position within interval
             max_offset = selected_interval.size - size
             if max_offset > 0:
-                random_offset = random.randrange(max_offset + 1)
+                random_offset = rng("layout").randrange(max_offset + 1)
                 va_start = pa_start = selected_interval.start + random_offset
-                logger.info(f"Randomized position: offset 0x{random_offset:x} from interval start")
+                logger.info("Randomized position: offset 0x%x from interval start", random_offset)
             else:
                 va_start = pa_start = selected_interval.start
         
@@ -779,7 +780,7 @@ class PageTable:
         # print(f"va_start: {hex(va_start)}, va_end: {hex(va_end)}")
         # print(f"pa_start: {hex(pa_start)}")
 
-        logger.info(f"Final allocation: VA=PA=0x{va_start:x}-0x{va_end:x}, size=0x{size:x}")
+        logger.info("Final allocation: VA=PA=0x%x-0x%x, size=0x%x", va_start, va_end, size)
         
         # Since we selected our allocation from within the selected_page boundaries,
         # the only overlapping page is the one we started with
@@ -797,9 +798,10 @@ class PageTable:
         logger = get_memory_logger()
 
         intervals = self.non_allocated_va_intervals.get_intervals(criteria={"page_type": page_type})
-        logger.info(f"Looking for {page_type.value} region of size {size}. Available {len(intervals)} regions:")
-        for i, interval in enumerate(intervals):
-            logger.info(f"  {page_type.value} region {i}: VA:0x{interval.start:x}-0x{interval.end:x}, size:0x{interval.size:x}")
+        logger.info("Looking for %s region of size %s. Available %s regions:", page_type.value, size, len(intervals))
+        if logger.is_enabled_for("info"):
+            for i, interval in enumerate(intervals):
+                logger.info("  %s region %s: VA:0x%x-0x%x, size:0x%x", page_type.value, i, interval.start, interval.end, interval.size)
             
         # Find available non-allocated VA region from the relevent pool only, with alignment
         va_avail = self.non_allocated_va_intervals.find_region(size, alignment_bits, criteria={"page_type": page_type})
@@ -807,13 +809,13 @@ class PageTable:
             raise ValueError(f"No available non-allocated {page_type.value} VA region of size {size} with alignment {alignment_bits} for {self.page_table_name}")
         
         va_start, _ = va_avail
-        logger.info(f"Found suitable VA region starting at {hex(va_start)}")
+        logger.info("Found suitable VA region starting at %#x", va_start)
         
         # Check that the region is properly aligned
         if alignment_bits is not None:
             alignment = 1 << alignment_bits
             if va_start % alignment != 0:
-                logger.error(f"VA address 0x{va_start:x} is not aligned to {alignment_bits} bits!")
+                logger.error("VA address 0x%x is not aligned to %s bits!", va_start, alignment_bits)
                 raise ValueError(f"Failed to allocate properly aligned memory. VA:0x{va_start:x} is not aligned to {alignment_bits} bits!")
         
         # Find the physical address that corresponds to the VA we just found
@@ -835,7 +837,7 @@ class PageTable:
         overlapping_pages.sort(key=lambda p: p.va)
         
         if overlapping_pages:
-            logger.info(f"Found {len(overlapping_pages)} pages overlapping with segment VA:{hex(va_start)}-{hex(va_end)}")
+            logger.info("Found %s pages overlapping with segment VA:%#x-%#x", len(overlapping_pages), va_start, va_end)
             
             # Check if pages are sequential without gaps
             is_sequential = True
@@ -848,7 +850,7 @@ class PageTable:
                 
                 # Check for a gap between pages
                 if prev_page.end_va + 1 != curr_page.va:
-                    logger.info(f"Gap detected between pages: {prev_page} and {curr_page}")
+                    logger.info("Gap detected between pages: %s and %s", prev_page, curr_page)
                     is_sequential = False
                     break
                 
@@ -858,7 +860,7 @@ class PageTable:
             
             # Verify the pages fully cover our segment
             if covered_range_start <= va_start and covered_range_end >= va_end and is_sequential:
-                logger.info(f"Pages provide complete sequential coverage for the segment")
+                logger.info("Pages provide complete sequential coverage for the segment")
                 
                 # Calculate the physical address for the start of our segment
                 # Find which page contains our VA start
@@ -873,7 +875,7 @@ class PageTable:
                     offset = va_start - containing_page.va
                     # Apply the same offset to get the correct PA
                     pa_start = containing_page.pa + offset
-                    logger.info(f"Found corresponding PA for VA:0x{va_start:x} -> PA:0x{pa_start:x} in page {containing_page}")
+                    logger.info("Found corresponding PA for VA:0x%x -> PA:0x%x in page %s", va_start, pa_start, containing_page)
                     
                     # For cross-core pages, check if this PA is actually available
                     # before proceeding. Multiple cores might calculate overlapping PAs.
@@ -883,18 +885,18 @@ class PageTable:
                         
                         # Check if this PA region would conflict with existing allocations
                         existing_allocations = page_table_manager.allocated_pa_intervals.get_intervals()
-                        logger.info(f"Cross-core PA check: examining {len(existing_allocations)} existing PA allocations for conflicts with {hex(pa_start)}-{hex(pa_start+size-1)}")
+                        logger.info("Cross-core PA check: examining %s existing PA allocations for conflicts with %#x-%#x", len(existing_allocations), pa_start, pa_start+size-1)
                         pa_conflict = False
                         for alloc in existing_allocations:
-                            logger.info(f"  Checking against PA allocation: {hex(alloc.start)}-{hex(alloc.start+alloc.size-1)}, metadata={alloc.metadata}")
+                            logger.info("  Checking against PA allocation: %#x-%#x, metadata=%s", alloc.start, alloc.start+alloc.size-1, alloc.metadata)
                             if (pa_start < alloc.start + alloc.size) and (pa_start + size > alloc.start):
                                 pa_conflict = True
-                                logger.warning(f"Cross-core PA conflict detected: calculated PA {hex(pa_start)}-{hex(pa_start+size-1)} conflicts with existing allocation {hex(alloc.start)}-{hex(alloc.start+alloc.size-1)}")
+                                logger.warning("Cross-core PA conflict detected: calculated PA %#x-%#x conflicts with existing allocation %#x-%#x", pa_start, pa_start+size-1, alloc.start, alloc.start+alloc.size-1)
                                 break
                         
                         if pa_conflict:
                             # This VA would produce a conflicting PA, need to find a different VA
-                            logger.info(f"Rejecting VA {hex(va_start)} due to PA conflict in cross-core page, searching for alternative...")
+                            logger.info("Rejecting VA %#x due to PA conflict in cross-core page, searching for alternative...", va_start)
                             # This will cause the function to try again with a different VA
                             # We'll let the calling function handle the retry logic
                             raise ValueError(f"PA conflict in cross-core page: calculated PA {hex(pa_start)}-{hex(pa_start+size-1)} conflicts with existing allocation")
@@ -903,7 +905,7 @@ class PageTable:
                     if alignment_bits is not None:
                         alignment = 1 << alignment_bits
                         if pa_start % alignment != 0:
-                            logger.error(f"PA address 0x{pa_start:x} is not aligned to {alignment_bits} bits!")
+                            logger.error("PA address 0x%x is not aligned to %s bits!", pa_start, alignment_bits)
                             raise ValueError(f"Failed to allocate properly aligned memory. PA:0x{pa_start:x} is not aligned to {alignment_bits} bits!")
                     
                     # Verify physical addresses are sequential by checking each page boundary
@@ -917,25 +919,23 @@ class PageTable:
                             
                             # Check if next page's PA follows sequentially
                             if pa_at_boundary + 1 != next_page.pa:
-                                logger.warning(f"Physical memory is not sequential between pages: "
-                                                f"PA 0x{pa_at_boundary:x} -> 0x{next_page.pa:x}")
+                                logger.warning("Physical memory is not sequential between pages: PA 0x%x -> 0x%x", pa_at_boundary, next_page.pa)
                                 # We'll continue anyway since VA is what matters for allocation
                 else:
-                    logger.error(f"Failed to find the specific page containing VA start 0x{va_start:x}")
+                    logger.error("Failed to find the specific page containing VA start 0x%x", va_start)
                     raise ValueError(f"Internal error: couldn't identify page containing VA start")
             else:
                 if not is_sequential:
-                    logger.error(f"Pages are not sequential, cannot allocate segment")
+                    logger.error("Pages are not sequential, cannot allocate segment")
                 else:
-                    logger.error(f"Pages don't fully cover segment VA:0x{va_start:x}-0x{va_end:x}, "
-                                f"covered: 0x{covered_range_start:x}-0x{covered_range_end:x}")
+                    logger.error("Pages don't fully cover segment VA:0x%x-0x%x, covered: 0x%x-0x%x", va_start, va_end, covered_range_start, covered_range_end)
                 # Fall back to the error case below
                 overlapping_pages = []
                 
         if not overlapping_pages:
             # If we can't find the page entries (shouldn't happen with proper page management)
             # fall back to the original logic as a last resort
-            logger.error(f"CRITICAL ERROR: Cannot find pages covering VA:0x{va_start:x}-0x{va_end:x}. Page table may be inconsistent!")
+            logger.error("CRITICAL ERROR: Cannot find pages covering VA:0x%x-0x%x. Page table may be inconsistent!", va_start, va_end)
             raise ValueError(f"CRITICAL ERROR: Cannot find pages covering VA:0x{va_start:x}-0x{va_end:x}. Page table may be inconsistent!")
             if is_code:
                 pa_avail = self.non_allocated_pa_code_intervals.find_region(size, alignment_bits)
@@ -946,9 +946,9 @@ class PageTable:
                 if not pa_avail:
                     raise ValueError(f"No available non-allocated DATA PA region of size {size} with alignment {alignment_bits}")
             pa_start, _ = pa_avail
-            logger.warning(f"Using fallback PA allocation: 0x{pa_start:x}. THIS IS LIKELY INCORRECT!")
+            logger.warning("Using fallback PA allocation: 0x%x. THIS IS LIKELY INCORRECT!", pa_start)
             
-        logger.info(f"Using PA region starting at 0x{pa_start:x}")
+        logger.info("Using PA region starting at 0x%x", pa_start)
         
         return va_start, pa_start, overlapping_pages
 
@@ -957,11 +957,11 @@ class PageTable:
         """Print a comprehensive summary of this MMU's state."""
         logger = get_memory_logger()
         logger.info("")
-        logger.info(f"==== PageTableManager - print_summary for {self.page_table_name}")
+        logger.info("==== PageTableManager - print_summary for %s", self.page_table_name)
         stats = self.get_memory_stats()
-        logger.info(f"  Core: {stats['core_id']}")
-        logger.info(f"  Execution Context: {stats['execution_context']}")
-        logger.info(f"  Pages ({stats['pages']['total']} total, {stats['pages']['code']} code, {stats['pages']['data']} data):")
+        logger.info("  Core: %s", stats['core_id'])
+        logger.info("  Execution Context: %s", stats['execution_context'])
+        logger.info("  Pages (%s total, %s code, %s data):", stats['pages']['total'], stats['pages']['code'], stats['pages']['data'])
         
         for page in self.page_table_entries:
-            logger.info(f"      Page: {page}")
\ No newline at end of file
+            logger.info("      Page: %s", page)
\ No newline at end of file
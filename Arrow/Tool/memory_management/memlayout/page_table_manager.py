@@ -79,7 +79,7 @@ class PageTableManager:
             raise ValueError(f"PageTable {page_table_name} already exists")
 
         logger = get_memory_logger()
-        logger.info(f"===== Creating PageTable: {page_table_name} for core: {core_id} with execution_context: {execution_context}")
+        logger.info("===== Creating PageTable: %s for core: %s with execution_context: %s", page_table_name, core_id, execution_context)
 
         page_table = PageTable(page_table_name, core_id, execution_context)
         self.page_tables[page_table_name] = page_table
@@ -130,7 +130,7 @@ class PageTableManager:
             return False
         else:
             # Default to data for unknown types
-            logger.warning(f"Unknown page type {page_type}, treating as data")
+            logger.warning("Unknown page type %s, treating as data", page_type)
             return False
     
     # New operations for memory mapping and allocation
@@ -150,7 +150,7 @@ class PageTableManager:
         # # Ensure the state is initialized
         # self._initialize_state(state_name)
         logger = get_memory_logger()
-        logger.info(f"Mapping VA:0x{va_addr:x} to PA:0x{pa_addr:x}, size:0x{size:x}, type:{page_type}")
+        logger.info("Mapping VA:0x%x to PA:0x%x, size:0x%x, type:%s", va_addr, pa_addr, size, page_type)
         
         # Update unmapped/mapped PA intervals
         self.unmapped_pa_intervals.remove_region(pa_addr, size)
@@ -1,8 +1,9 @@
-import random
-from typing import List, Dict
+from Arrow.Utils.seed_management import rng
+from typing import List, Dict, Optional, Tuple
 
 from Arrow.Tool.memory_management.memory_logger import get_memory_logger
 from Arrow.Tool.memory_management.memlayout.segment import MemorySegment, CodeSegment, DataSegment
+from Arrow.Tool.memory_management.memlayout.shared_block_index import SharedBlockIndex
 from Arrow.Utils.configuration_management import Configuration
 
 class SegmentManager:
@@ -11,12 +12,16 @@ class SegmentManager:
         Memory manager class to manage a pool of memory segments.
         """
         logger = get_memory_logger()
-        logger.info(f"============ initializing SegmentManager for {page_table.execution_context.value} context")
+        logger.info("============ initializing SegmentManager for %s context", page_table.execution_context.value)
 
 
         self.page_table = page_table
         self.memory_segments: List[MemorySegment] = []
         self.pool_type_mapping: Dict[Configuration.Memory_types, List[MemorySegment]] = {}  # To map pool types to blocks
+        self._segments_by_name: Dict[str, MemorySegment] = {}
+        # (pool types, non_exclusive_only, cross_core) -> segments, cleared whenever a segment is added
+        self._segment_views: Dict[tuple, Tuple[MemorySegment, ...]] = {}
+        self.shared_block_index = SharedBlockIndex(self)  # DATA_SHARED MemoryBlocks by size and alignment, for reuse
 
 
     def allocate_memory_segment(self, name: str, byte_size:int, memory_type:Configuration.Memory_types, alignment_bits:int=None, VA_eq_PA:bool=False, force_address:int=None, exclusive_segment:bool=True)->MemorySegment:
@@ -32,15 +37,14 @@ class SegmentManager:
         """
         logger = get_memory_logger()
         logger.info("")
-        logger.info(f"==================== allocate_memory_segment: {name}, size: {byte_size}, type: {memory_type}")
+        logger.info("==================== allocate_memory_segment: %s, size: %s, type: %s", name, byte_size, memory_type)
         if force_address:
-            logger.info(f"==================== allocate_memory_segment: using force_address: {hex(force_address)} for allocation")
+            logger.info("==================== allocate_memory_segment: using force_address: %#x for allocation", force_address)
             if not VA_eq_PA or memory_type != Configuration.Memory_types.BSP_BOOT_CODE:
                 raise ValueError("force_address is only supported when VA_eq_PA is True and memory_type is BSP_BOOT_CODE")
 
-        for segment in self.memory_segments:
-            if segment.name == name:
-                raise ValueError(f"Memory segment with name '{name}' already exists.")
+        if name in self._segments_by_name:
+            raise ValueError(f"Memory segment with name '{name}' already exists.")
 
         # Determine the page type based on memory type
         if memory_type in [Configuration.Memory_types.DATA_SHARED, Configuration.Memory_types.DATA_PRESERVE, Configuration.Memory_types.STACK]:
@@ -65,14 +69,14 @@ class SegmentManager:
             pool_name = "DATA"
 
         if len(pool) == 0:
-            logger.error(f"No available {pool_name} regions before allocation")
+            logger.error("No available %s regions before allocation", pool_name)
             raise ValueError(f"No available {pool_name} regions before allocation")
         
         try:
             if force_address:
-                logger.info(f"Requesting allocation with force_address constraint at {hex(force_address)}")
+                logger.info("Requesting allocation with force_address constraint at %#x", force_address)
             elif VA_eq_PA:
-                logger.info(f"Requesting allocation with VA=PA constraint")
+                logger.info("Requesting allocation with VA=PA constraint")
             
             allocation = self.page_table.allocate_segment(size=byte_size, page_type=page_type, alignment_bits=alignment_bits, VA_eq_PA=VA_eq_PA, force_address=force_address)
             segment_start = allocation.va_start
@@ -82,20 +86,20 @@ class SegmentManager:
             # Log detailed information about the allocation, including covered pages
             if hasattr(allocation, 'covered_pages') and allocation.covered_pages:
                 num_pages = len(allocation.covered_pages)
-                logger.info(f"Allocated memory segment at VA:{hex(segment_start)}:{hex(segment_start+segment_size-1)}, PA:{hex(segment_pa_start)}:{hex(segment_pa_start+segment_size-1)}, size:0x{segment_size:x}, type:{page_type}, " 
-                           f"spanning {num_pages} {'page' if num_pages == 1 else 'pages'}")
+                logger.info("Allocated memory segment at VA:%#x:%#x, PA:%#x:%#x, size:0x%x, type:%s, spanning %s %s",
+                            segment_start, segment_start+segment_size-1, segment_pa_start, segment_pa_start+segment_size-1, segment_size, page_type, num_pages, 'page' if num_pages == 1 else 'pages')
                 
                 # If VA_eq_PA, verify that the allocation satisfies this constraint
                 if VA_eq_PA:
                     for page in allocation.covered_pages:
-                        logger.info(f"  Page: VA:{hex(page.va)}:{hex(page.va+page.size-1)}, PA:{hex(page.pa)}:{hex(page.pa+page.size-1)}")
+                        logger.info("  Page: VA:%#x:%#x, PA:%#x:%#x", page.va, page.va+page.size-1, page.pa, page.pa+page.size-1)
                         if page.va != page.pa:
-                            logger.error(f"Page does not satisfy VA=PA constraint (VA:0x{page.va:x} ≠ PA:0x{page.pa:x})")
+                            logger.error("Page does not satisfy VA=PA constraint (VA:0x%x ≠ PA:0x%x)", page.va, page.pa)
                             raise ValueError(f"Page does not satisfy VA=PA constraint (VA:0x{page.va:x} ≠ PA:0x{page.pa:x})")
             else:
-                logger.info(f"Allocated memory segment at VA:{hex(segment_start)}:{hex(segment_start+segment_size-1)}, PA:{hex(segment_pa_start)}:{hex(segment_pa_start+segment_size-1)}, size:0x{segment_size:x}, type:{page_type}")
+                logger.info("Allocated memory segment at VA:%#x:%#x, PA:%#x:%#x, size:0x%x, type:%s", segment_start, segment_start+segment_size-1, segment_pa_start, segment_pa_start+segment_size-1, segment_size, page_type)
         except ValueError as e:
-            logger.error(f"Failed to allocate memory: {e}")
+            logger.error("Failed to allocate memory: %s", e)
             raise ValueError(f"Could not allocate memory segment '{name}' of size {byte_size} with type {page_type}. "
                              f"Make sure you have pre-allocated pages of the correct type.")
         ##########################################################################################
@@ -114,14 +118,21 @@ class SegmentManager:
         if hasattr(allocation, 'covered_pages'):
             memory_segment.covered_pages = allocation.covered_pages
         
+        self._register_segment(memory_segment)
+
+        return memory_segment
+
+    def _register_segment(self, memory_segment: MemorySegment) -> None:
+        """Add a new segment to the segment list and to the query indexes."""
         self.memory_segments.append(memory_segment)
 
         # Map the segment to the pool type
-        if memory_type not in self.pool_type_mapping:
-            self.pool_type_mapping[memory_type] = []
-        self.pool_type_mapping[memory_type].append(memory_segment)
+        if memory_segment.memory_type not in self.pool_type_mapping:
+            self.pool_type_mapping[memory_segment.memory_type] = []
+        self.pool_type_mapping[memory_segment.memory_type].append(memory_segment)
 
-        return memory_segment
+        self._segments_by_name.setdefault(memory_segment.name, memory_segment)
+        self._segment_views.clear()
 
 
     @staticmethod
@@ -141,9 +152,9 @@ class SegmentManager:
         
         # First, find a suitable cross-core page with shared physical memory
         # NOTE: Different cores may map this physical memory to different virtual addresses
-        random_page_table = random.choice(page_table_manager.get_all_page_tables())
+        random_page_table = rng("layout").choice(page_table_manager.get_all_page_tables())
         memory_logger.info("")
-        memory_logger.info(f"==================== {random_page_table.page_table_name} - Finding suitable cross-core memory interval")
+        memory_logger.info("==================== %s - Finding suitable cross-core memory interval", random_page_table.page_table_name)
               
         # Find all cross-core data pages in the first state
         all_pages = random_page_table.get_pages_by_type(Configuration.Page_types.TYPE_DATA)
@@ -153,12 +164,12 @@ class SegmentManager:
                 cross_core_pages.append(page)
                 
         if len(cross_core_pages) == 0:
-            memory_logger.error(f"No cross-core page found in state {random_page_table.page_table_name}", level="error")
+            memory_logger.error("No cross-core page found in state %s", random_page_table.page_table_name, level="error")
             raise ValueError(f"No cross-core page found in state {random_page_table.page_table_name}")
         
         # Select a cross-core page
-        cross_core_page = random.choice(cross_core_pages)
-        memory_logger.info(f"Selected cross-core page: VA={hex(cross_core_page.va)}:{hex(cross_core_page.va+cross_core_page.size-1)}, PA={hex(cross_core_page.pa)}:{hex(cross_core_page.pa+cross_core_page.size-1)}")
+        cross_core_page = rng("layout").choice(cross_core_pages)
+        memory_logger.info("Selected cross-core page: VA=%#x:%#x, PA=%#x:%#x", cross_core_page.va, cross_core_page.va+cross_core_page.size-1, cross_core_page.pa, cross_core_page.pa+cross_core_page.size-1)
         
         # Find available (unallocated) intervals within this page
         
@@ -180,16 +191,16 @@ class SegmentManager:
                 # Only include if the interval is big enough
                 if contained_size >= byte_size:
                     contained_intervals.append((contained_start, contained_size))
-                    memory_logger.info(f"Found suitable interval: VA:{hex(contained_start)}-{hex(contained_end)}, size:0x{contained_size:x}")
+                    memory_logger.info("Found suitable interval: VA:%#x-%#x, size:0x%x", contained_start, contained_end, contained_size)
         
         if len(contained_intervals) == 0:
-            memory_logger.error(f"No suitable unallocated interval found in cross-core page in state {random_page_table.page_table_name}", level="error")
+            memory_logger.error("No suitable unallocated interval found in cross-core page in state %s", random_page_table.page_table_name, level="error")
             raise ValueError(f"No suitable unallocated interval found in cross-core page in state {random_page_table.page_table_name}")
         
         # Choose a random interval from available unallocated intervals
-        selected_interval = random.choice(contained_intervals)
+        selected_interval = rng("layout").choice(contained_intervals)
         interval_start, interval_size = selected_interval
-        memory_logger.info(f"Selected unallocated interval: VA:{hex(interval_start)}-{hex(interval_start+interval_size-1)}, size:0x{interval_size:x}")
+        memory_logger.info("Selected unallocated interval: VA:%#x-%#x, size:0x%x", interval_start, interval_start+interval_size-1, interval_size)
         
         # Now randomly select a position within this interval, respecting alignment
         alignment_bits = 4  # 16-byte alignment
@@ -203,13 +214,13 @@ class SegmentManager:
         
         # Check if there's room after alignment
         if min_start > max_start:
-            memory_logger.error(f"No valid aligned position found in the selected interval", level="error")
+            memory_logger.error("No valid aligned position found in the selected interval", level="error")
             raise ValueError(f"No valid aligned position found in the selected interval")
         
         # Choose a random aligned position
         available_positions = ((max_start - min_start) // alignment) + 1
         if available_positions > 1:
-            random_position = random.randrange(available_positions)
+            random_position = rng("layout").randrange(available_positions)
             chosen_va_start = min_start + (random_position * alignment)
         else:
             chosen_va_start = min_start
@@ -224,23 +235,23 @@ class SegmentManager:
         shared_interval_offset_from_page_start = chosen_va_start - cross_core_page.va
         shared_interval_size = byte_size
 
-        memory_logger.info(f"Chosen position in interval: VA:{hex(chosen_va_start)}:{hex(chosen_va_start+byte_size-1)}, size:{hex(byte_size)}, offset from page start: 0x{page_offset:x}")
-        memory_logger.info(f"This corresponds to PA:{hex(shared_pa+page_offset)}:{hex(shared_pa+page_offset+byte_size-1)}")
+        memory_logger.info("Chosen position in interval: VA:%#x:%#x, size:%#x, offset from page start: 0x%x", chosen_va_start, chosen_va_start+byte_size-1, byte_size, page_offset)
+        memory_logger.info("This corresponds to PA:%#x:%#x", shared_pa+page_offset, shared_pa+page_offset+byte_size-1)
         
         # Pre-allocate the exact PA region to prevent overlaps across cores
         # This ensures that when each core allocates within the shared page, they coordinate PA usage
         page_table_manager.allocated_pa_intervals.add_region(shared_pa_start, byte_size, metadata={"page_type": Configuration.Page_types.TYPE_DATA, "cross_core": True, "page_table_name": "SHARED"})
         page_table_manager.non_allocated_pa_intervals.remove_region(shared_pa_start, byte_size)
         
-        memory_logger.info(f"Pre-allocated shared PA region: {hex(shared_pa_start)}-{hex(shared_pa_start+byte_size-1)} to prevent overlaps")
+        memory_logger.info("Pre-allocated shared PA region: %#x-%#x to prevent overlaps", shared_pa_start, shared_pa_start+byte_size-1)
 
         # Now allocate in each state using the corresponding VA mapping
         created_segments = []
 
         all_page_tables = page_table_manager.get_all_page_tables()
         for page_table in all_page_tables:
-            memory_logger.info(f"")
-            memory_logger.info(f"==================== {page_table.page_table_name} - Allocating cross-core memory segment with PA:{hex(shared_pa+page_offset)}")
+            memory_logger.info("")
+            memory_logger.info("==================== %s - Allocating cross-core memory segment with PA:%#x", page_table.page_table_name, shared_pa+page_offset)
             
             segment_manager = page_table.segment_manager
             
@@ -254,16 +265,16 @@ class SegmentManager:
                     matching_cross_core_page = page
                     break           
             if not matching_cross_core_page:
-                memory_logger.error(f"No matching cross-core page found in state {page_table.page_table_name} with PA={hex(shared_pa)}", level="error")
+                memory_logger.error("No matching cross-core page found in state %s with PA=%#x", page_table.page_table_name, shared_pa, level="error")
                 raise ValueError(f"No matching cross-core page found in state {page_table.page_table_name} with PA={hex(shared_pa)}")
             
-            memory_logger.info(f"Found matching cross-core page: VA={hex(matching_cross_core_page.va)}:{hex(matching_cross_core_page.va+matching_cross_core_page.size-1)}, PA={hex(matching_cross_core_page.pa)}:{hex(matching_cross_core_page.pa+matching_cross_core_page.size-1)}")
+            memory_logger.info("Found matching cross-core page: VA=%#x:%#x, PA=%#x:%#x", matching_cross_core_page.va, matching_cross_core_page.va+matching_cross_core_page.size-1, matching_cross_core_page.pa, matching_cross_core_page.pa+matching_cross_core_page.size-1)
             
             segment_size = byte_size
             segment_va_start = matching_cross_core_page.va+shared_interval_offset_from_page_start
             segment_pa_start = shared_pa_start
             segment_va_end = segment_va_start + shared_interval_size - 1
-            memory_logger.info(f"Current page interval: VA={hex(segment_va_start)}:{hex(segment_va_end)}, size={hex(shared_interval_size)}")
+            memory_logger.info("Current page interval: VA=%#x:%#x, size=%#x", segment_va_start, segment_va_end, shared_interval_size)
 
             # Mark as allocated for this specific page table's VA space (add to allocated, remove from non-allocated)
             page_table.allocated_va_intervals.add_region(segment_va_start, byte_size, metadata={"page_type": Configuration.Page_types.TYPE_DATA, "page_table_name": page_table.page_table_name})
@@ -281,10 +292,10 @@ class SegmentManager:
             )
             page_table.allocations.append(allocation)
 
-            memory_logger.info(f"Created allocation: VA={hex(segment_va_start)}:{hex(segment_va_end)}, PA={hex(shared_pa_start)}:{hex(shared_pa_start+byte_size-1)}, size={byte_size}")
+            memory_logger.info("Created allocation: VA=%#x:%#x, PA=%#x:%#x, size=%s", segment_va_start, segment_va_end, shared_pa_start, shared_pa_start+byte_size-1, byte_size)
                         
             # Log allocation information
-            memory_logger.info(f"Allocated memory segment at VA:{hex(segment_va_start)}:{hex(segment_va_end)}, PA:{hex(segment_pa_start)}:{hex(segment_pa_start+segment_size-1)}, size:{hex(segment_size)}, type:{page_type}, is_cross_core:True")
+            memory_logger.info("Allocated memory segment at VA:%#x:%#x, PA:%#x:%#x, size:%#x, type:%s, is_cross_core:True", segment_va_start, segment_va_end, segment_pa_start, segment_pa_start+segment_size-1, segment_size, page_type)
             
             memory_segment = DataSegment(name=name, page_table=page_table, address=segment_va_start, pa_address=segment_pa_start, byte_size=segment_size, memory_type=memory_type, is_cross_core=True, exclusive_segment=False)
             
@@ -295,17 +306,12 @@ class SegmentManager:
             if hasattr(allocation, 'covered_pages'):
                 memory_segment.covered_pages = allocation.covered_pages
             
-            segment_manager.memory_segments.append(memory_segment)
-            
-            # Map the segment to the pool type
-            if memory_type not in segment_manager.pool_type_mapping:
-                segment_manager.pool_type_mapping[memory_type] = []
-            segment_manager.pool_type_mapping[memory_type].append(memory_segment)
+            segment_manager._register_segment(memory_segment)
             
             created_segments.append(memory_segment)
 
         # Return the first segment for backward compatibility
-        memory_logger.info(f"Created cross-core memory segments at fixed PA={hex(shared_pa+page_offset)} across {len(created_segments)} cores")
+        memory_logger.info("Created cross-core memory segments at fixed PA=%#x across %s cores", shared_pa+page_offset, len(created_segments))
         return created_segments[0] if created_segments else None
 
 
@@ -313,41 +319,39 @@ class SegmentManager:
         """Helper to determine if a page type is code"""
         return page_type == Configuration.Page_types.TYPE_CODE
 
-    def get_segments(self, pool_type:[Configuration.Memory_types | list[Configuration.Memory_types]], non_exclusive_only:bool=False) -> List[MemorySegment]:
+    def get_segments(self, pool_type:[Configuration.Memory_types | list[Configuration.Memory_types]], non_exclusive_only:bool=False, cross_core:Optional[bool]=None) -> Tuple[MemorySegment, ...]:
         """
         Retrieve memory segments based on specific attributes.
 
         Args:
             pool_type [Memory_types|list[Memory_types]]: Filter segments by pool type, can receive one or list of many.
             non_exclusive_only [bool]: If True, only return non-exclusive segments. those that are not exclusive to a specific use-case.
+            cross_core [bool]: If True, only return cross-core segments, if False only the other segments, if None both.
 
         Returns:
-            List[MemorySegment]: A list of memory segments that match the criteria.
+            Tuple[MemorySegment]: The memory segments that match the criteria, per pool type in allocation order.
+            The tuple is cached until the next segment allocation, don't rely on its identity.
         """
-        memory_logger = get_memory_logger()
-        # If `pool_type` is not a list, wrap it in a single-element list
-        if not isinstance(pool_type, list):
-            pool_types = [pool_type]
-        else:
-            pool_types = pool_type
-
-        filtered_segments = []
-        for pool_type in pool_types:
-            if not isinstance(pool_type, Configuration.Memory_types):
-                memory_logger.warning(f"ID of pool_type's type:", id(type(pool_type)))
-                memory_logger.warning(f"ID of Memory_types:", id(Configuration.Memory_types))
-                raise ValueError(f"Invalid pool type {pool_type}.")
+        # If `pool_type` is not a list, wrap it in a single-element tuple
+        pool_types = tuple(pool_type) if isinstance(pool_type, list) else (pool_type,)
+        query = (pool_types, non_exclusive_only, cross_core)
+        filtered_segments = self._segment_views.get(query)
+
+        if filtered_segments is None:
+            memory_logger = get_memory_logger()
+            for pool_type in pool_types:
+                if not isinstance(pool_type, Configuration.Memory_types):
+                    memory_logger.warning("ID of pool_type's type: %s", id(type(pool_type)))
+                    memory_logger.warning("ID of Memory_types: %s", id(Configuration.Memory_types))
+                    raise ValueError(f"Invalid pool type {pool_type}.")
             # Filter blocks based on pool_type
-            if pool_type in self.pool_type_mapping:
-                for segment in self.memory_segments:
-                    if (segment in self.pool_type_mapping[pool_type]):
-                        if non_exclusive_only:
-                            if segment.exclusive_segment:
-                                continue
-                        filtered_segments.append(segment)
+            filtered_segments = tuple(segment for pool_type in pool_types for segment in self.pool_type_mapping.get(pool_type, ())
+                                      if not (non_exclusive_only and segment.exclusive_segment)
+                                      and (cross_core is None or getattr(segment, "is_cross_core", False) == cross_core))
+            self._segment_views[query] = filtered_segments
 
         if not filtered_segments:
-            memory_logger.error("No segments available to match the query request.")
+            get_memory_logger().error("No segments available to match the query request.")
             raise ValueError("No segments available to match the query request.")
 
         return filtered_segments
@@ -359,11 +363,10 @@ class SegmentManager:
         Returns:
             MemorySegment: A memory segments that match the criteria.
         """
-
-        for segment in self.memory_segments:
-            if segment.name == segment_name:
-                return segment
-        raise ValueError(f"No segment available to match the name requested {segment_name}.")
+        segment = self._segments_by_name.get(segment_name)
+        if segment is None:
+            raise ValueError(f"No segment available to match the name requested {segment_name}.")
+        return segment
 
 
     # def get_segment_dataUnit_list(self, segments_name:str) -> list[DataUnit]:
@@ -387,8 +390,8 @@ class SegmentManager:
         stack_blocks = self.get_segments(pool_type=Configuration.Memory_types.STACK)
         if len(stack_blocks) != 1:
             for segment in stack_blocks:
-                memory_logger.info(f"Stack segment: {segment.name}, VA:0x{segment.address:x}-0x{segment.address+segment.byte_size-1:x}, size:0x{segment.byte_size:x}")
-                memory_logger.info(f"segment: {segment}")
+                memory_logger.info("Stack segment: %s, VA:0x%x-0x%x, size:0x%x", segment.name, segment.address, segment.address+segment.byte_size-1, segment.byte_size)
+                memory_logger.info("segment: %s", segment)
             raise ValueError(
                 "stack_blocks must contain exactly one element, but it contains: {}".format(len(stack_blocks)))
         stack_block = stack_blocks[0]
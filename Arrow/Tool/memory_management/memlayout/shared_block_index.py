@@ -0,0 +1,79 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+from Arrow.Utils.configuration_management import Configuration
+
+'''
+SharedBlockIndex - reuse index of the shared MemoryBlocks of a single SegmentManager.
+
+Every MemoryBlock placed in a DATA_SHARED segment is registered once, when it is created, in a bucket keyed by
+its byte size and by its natural alignment (the largest power of two dividing its address). A reuse query is a
+bisect over the sorted bucket sizes: blocks whose natural alignment is a multiple of the requested alignment are
+taken as a whole bucket, only the less aligned buckets check the first aligned address of each block.
+
+Candidates are returned in segment order and then block creation order, the order of a scan over
+segment.memory_block_list, so a random pick among them selects the same block for the same seed.
+'''
+
+
+class SharedBlockIndex:
+
+    def __init__(self, segment_manager):
+        self.segment_manager = segment_manager
+        self._sizes: List[int] = []  # sorted distinct block sizes
+        # byte_size -> natural alignment -> [(segment_rank, seq, address, segment, memory_block)]
+        self._buckets: Dict[int, Dict[int, List[Tuple]]] = {}
+        self._segment_rank: Dict[str, int] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return self._seq
+
+    @staticmethod
+    def natural_alignment(address: Optional[int]) -> int:
+        """Largest power of two dividing the address, 0 when the address is 0 or unknown (fits any alignment)."""
+        if not address:
+            return 0
+        return address & -address
+
+    def add(self, segment, memory_block) -> None:
+        rank = self._segment_rank.get(segment.name)
+        if rank is None:
+            rank = self._segment_rank[segment.name] = self.segment_manager.memory_segments.index(segment)
+
+        # cross-core copies are registered before their get_address() mapping exists, use the raw address
+        address = memory_block._address
+        byte_size = memory_block.byte_size
+        if byte_size not in self._buckets:
+            self._buckets[byte_size] = {}
+            insort(self._sizes, byte_size)
+        alignment_bucket = self._buckets[byte_size].setdefault(self.natural_alignment(address), [])
+        alignment_bucket.append((rank, self._seq, address, segment, memory_block))
+        self._seq += 1
+
+    def rebuild(self) -> None:
+        """Re-register the blocks of all DATA_SHARED segments, after their memory_block_list were replaced as a whole."""
+        self.__init__(self.segment_manager)
+        for segment in self.segment_manager.memory_segments:
+            if segment.memory_type == Configuration.Memory_types.DATA_SHARED:
+                for memory_block in segment.memory_block_list:
+                    self.add(segment, memory_block)
+
+    def get_candidates(self, byte_size: int, alignment: Optional[int] = None) -> List[Tuple]:
+        """
+        Return the (segment, memory_block) pairs that can hold byte_size bytes at the requested alignment.
+        """
+        entries = []
+        for size in self._sizes[bisect_left(self._sizes, byte_size):]:
+            for natural_alignment, bucket in self._buckets[size].items():
+                if not alignment or alignment <= 1 or natural_alignment % alignment == 0:
+                    entries.extend(bucket)
+                    continue
+                # block not aligned, check that the first aligned address + required size fits within the block
+                for entry in bucket:
+                    address = entry[2]
+                    first_aligned_addr = ((address + alignment - 1) // alignment) * alignment
+                    if first_aligned_addr + byte_size <= address + size:
+                        entries.append(entry)
+
+        entries.sort(key=lambda entry: (entry[0], entry[1]))
+        return [(entry[3], entry[4]) for entry in entries]
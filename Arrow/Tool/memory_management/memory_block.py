@@ -6,6 +6,7 @@ from Arrow.Utils.logger_management import get_logger
 from Arrow.Tool.state_management import get_state_manager, get_current_state
 from Arrow.Tool.memory_management.utils import convert_int_value_to_bytes
 from Arrow.Tool.memory_management.memory_logger import get_memory_logger
+from Arrow.Utils.seed_management import rng
 #from Arrow.Tool.memory_management.memlayout.page_table_manager import get_page_table_manager
 '''
 #class MemoryBlock:
@@ -41,7 +42,7 @@ class MemoryBlock:
             shared: bool = False,
             alignment: Optional[int] = None,
             init_value: int = None,
-            init_value_byte_representation: list[int] = None, # an optional to pass the init_value as a list of smaller bytes
+            init_value_byte_representation: bytes | list[int] = None, # an optional to pass the init_value as bytes (or a list of byte values)
             cross_core: bool = False,
             _use_name_as_unique_label: bool = False, # needed for cases the MemoryBlock was auto-generated by Memory without a block
     ):
@@ -98,12 +99,8 @@ class MemoryBlock:
             if shared:
                 self.init_value_byte_representation = None
             else:
-                # Create a bytearray of specified size
-                random_block = bytearray(byte_size)
-                # Fill with random values
-                for i in range(byte_size):
-                    random_block[i] = random.randint(0, 255)
-                self.init_value_byte_representation = random_block
+                # Fill with random values, drawn in one go from the seeded generator
+                self.init_value_byte_representation = rng("memory").randbytes(byte_size)
         elif init_value is not None:
             # Validate that init_value fits within the specified block size
             if init_value == 0:
@@ -184,11 +181,13 @@ class MemoryBlock:
 
         memory_logger = get_memory_logger()
         memory_logger.info("")
-        memory_logger.info(f" MemoryBlock created: {self.memory_block_str}")
+        memory_logger.info(" MemoryBlock created: %s", self.memory_block_str)
         # print(self.memory_block_str)
 
         # add self to the memory_segment's memory_block_list
         self.memory_segment.memory_block_list.append(self)
+        if self.memory_segment.memory_type == Configuration.Memory_types.DATA_SHARED:
+            curr_page_table.segment_manager.shared_block_index.add(self.memory_segment, self)
 
         # creating cross-core "shallow" copies for all states.
         per_page_table_cross_core_blocks = {curr_page_table.page_table_name: self}
@@ -283,9 +282,11 @@ class MemoryBlock:
         
         # Log the new block
         memory_logger = get_memory_logger()
-        memory_logger.info(f" MemoryBlock copy created: {copy.memory_block_str}")
+        memory_logger.info(" MemoryBlock copy created: %s", copy.memory_block_str)
         
         # Add to memory segment
         copy.memory_segment.memory_block_list.append(copy)
+        if copy.memory_segment.memory_type == Configuration.Memory_types.DATA_SHARED:
+            page_table.segment_manager.shared_block_index.add(copy.memory_segment, copy)
         
         return copy
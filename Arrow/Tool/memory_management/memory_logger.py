@@ -7,10 +7,23 @@ from Arrow.Utils.singleton_management import SingletonManager
 from Arrow.Tool.state_management import get_state_manager
 
 
+# Convert string level to logging constant
+LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL
+}
+
+
 class MemoryLogger:
     """
     Specialized logger for memory-related operations.
     Provides separate logging for memory operations with configurable output levels.
+
+    Messages accept %-style lazy arguments (like the standard logging module), which are only formatted when
+    memory logging is enabled. Hot paths can also check `is_enabled_for(level)` before building expensive messages.
     """
     
     def __init__(self):
@@ -18,6 +31,8 @@ class MemoryLogger:
         self.file_handler = None
         self.console_handler = None
         self.initialized = False
+        self.memory_debug_prints = None
+        self.config_loaded = False
         
     def _initialize(self):
         """Initialize the memory logger if not already done"""
@@ -52,71 +67,98 @@ class MemoryLogger:
             standard_logger.warning(f"Failed to initialize memory logger: {e}")
             self.logger = standard_logger
             self.initialized = True
+
+    def _load_config(self):
+        """Read (once) the 'Memory_debug_prints' configuration, it can't change during a run"""
+        config_manager = get_config_manager()
+        self.memory_debug_prints = config_manager.get_value('Memory_debug_prints')
+        self.config_loaded = True
+
+    def is_enabled_for(self, level: str = "info") -> bool:
+        """
+        Check whether a message of the given level would be logged, to skip building expensive messages.
+        Nothing is logged with '--memory_debug_prints None', otherwise the level is compared to the memory logger level.
+        """
+        if not self.config_loaded:
+            try:
+                self._load_config()
+            except Exception:
+                return True  # let log() report the configuration problem
+        if self.memory_debug_prints is None:
+            return False
+        if not self.initialized:
+            self._initialize()
+        return self.logger.isEnabledFor(LEVEL_MAP.get(level.lower(), logging.INFO))
     
-    def log(self, message: str, level: str = "info", print_both: bool = False):
+    def log(self, message: str, level: str = "info", print_both: bool = False, args: tuple = ()):
         """
         Log a memory-related message.
         
         Args:
-            message: Message to log
+            message: Message to log, optionally with %-style placeholders
             level: Log level (debug, info, warning, error, critical)
             print_both: If True, also log to standard logger
+            args: Lazy arguments of the message placeholders, formatted only if the message is logged
         """
         if not self.initialized:
             self._initialize()
         
-        # Convert string level to logging constant
-        level_map = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-            "critical": logging.CRITICAL
-        }
-        log_level = level_map.get(level.lower(), logging.INFO)
+        log_level = LEVEL_MAP.get(level.lower(), logging.INFO)
         
         # Check configuration to see if memory logging is enabled
         try:
-            config_manager = get_config_manager()
-            memory_debug_prints = config_manager.get_value('Memory_debug_prints')
+            if not self.config_loaded:
+                self._load_config()
+            memory_debug_prints = self.memory_debug_prints
             
             if memory_debug_prints is None:
                 return  # Memory logging disabled
             
             # Log to memory logger
             if self.logger:
-                self.logger.log(log_level, message)
+                self.logger.log(log_level, message, *args)
             
             # Also log to standard logger if requested or if error level
             if print_both or memory_debug_prints == "info_log" or log_level >= logging.ERROR:
                 standard_logger = get_logger()
-                standard_logger.log(log_level, f"[MEMORY] {message}")
+                standard_logger.log(log_level, f"[MEMORY] {message}", *args)
                 
         except Exception as e:
             # Fallback to standard logger
             standard_logger = get_logger()
             standard_logger.warning(f"Memory logger error: {e}")
-            standard_logger.log(log_level, f"[MEMORY] {message}")
+            standard_logger.log(log_level, f"[MEMORY] {message}", *args)
     
-    def debug(self, message: str, print_both: bool = False):
+    def debug(self, message: str, *args, print_both: bool = False):
         """Log debug message"""
-        self.log(message, "debug", print_both)
+        self.log(message, "debug", print_both, args)
     
-    def info(self, message: str, print_both: bool = False):
+    def info(self, message: str, *args, print_both: bool = False):
         """Log info message"""
-        self.log(message, "info", print_both)
+        self.log(message, "info", print_both, args)
     
-    def warning(self, message: str, print_both: bool = False):
+    def warning(self, message: str, *args, print_both: bool = False):
         """Log warning message"""
-        self.log(message, "warning", print_both)
+        self.log(message, "warning", print_both, args)
     
-    def error(self, message: str, print_both: bool = True):
+    def error(self, message: str, *args, print_both: bool = True):
         """Log error message (defaults to print_both=True)"""
-        self.log(message, "error", print_both)
+        self.log(message, "error", print_both, args)
     
-    def critical(self, message: str, print_both: bool = True):
+    def critical(self, message: str, *args, print_both: bool = True):
         """Log critical message (defaults to print_both=True)"""
-        self.log(message, "critical", print_both)
+        self.log(message, "critical", print_both, args)
+
+    @staticmethod
+    def clean_logger():
+        """
+        remove all handlers associated with the memory logger (its file handler points to the previous output directory).
+        """
+        logger = logging.getLogger('memory_logger')
+        for handler in logger.handlers[:]:
+            handler.close()
+            logger.removeHandler(handler)
+
 
 # Factory function to get memory logger instance
 def get_memory_logger() -> MemoryLogger:
@@ -7,6 +7,7 @@ from Arrow.Tool.memory_management.memory_block import MemoryBlock
 from Arrow.Tool.register_management.register import Register
 from Arrow.Tool.state_management import get_state_manager, get_current_state
 from Arrow.Tool.memory_management.memory_logger import get_memory_logger
+from Arrow.Utils.seed_management import rng
 
 VALID_SIZES = [1, 2, 4, 8]  # Valid memory operand sizes
 
@@ -101,7 +102,7 @@ class Memory:
         #Validates the size of a memory operand. If no size is provided, it randomly selects one from VALID_SIZES.
         if byte_size is None:
             # Randomize size if not provided
-            self.byte_size = random.choice(VALID_SIZES)
+            self.byte_size = rng("memory").choice(VALID_SIZES)
         elif byte_size not in VALID_SIZES:
             # Raise error if size is invalid
             raise ValueError(f"Invalid memory byte size: {self.byte_size}. Valid sizes are {VALID_SIZES}.")
@@ -121,7 +122,7 @@ class Memory:
             if shared:
 
                 reuse_memory_probability = 50 # TODO:: create a knob for this!!!!
-                rand_num = random.randint(0,100)
+                rand_num = rng("memory").randint(0,100)
                 should_reuse = True if (rand_num < reuse_memory_probability) else False
 
                 if should_reuse and (name is None) and (self._address is None) and (self.init_value is None):
@@ -153,7 +154,7 @@ class Memory:
                                 
                                 if additional_positions > 0:
                                     # Choose random position among available aligned positions
-                                    chosen_position = random.randint(0, additional_positions)
+                                    chosen_position = rng("memory").randint(0, additional_positions)
                                     self.memory_block_offset = min_offset + (chosen_position * self.alignment)
                                 else:
                                     # Only one aligned position available
@@ -162,12 +163,12 @@ class Memory:
                                 # This shouldn't happen if filtering worked correctly
                                 self.memory_block_offset = 0
                         else:
-                            self.memory_block_offset = random.randint(0, max_offset) if max_offset > 0 else 0
+                            self.memory_block_offset = rng("memory").randint(0, max_offset) if max_offset > 0 else 0
 
                 if not self.reused_memory: # Either because reuse_memory=False or wasn't to find valid option
 
                     # In 50% probability, allocate a bigger memory block to allow later sharing with overlapping
-                    byte_size_extension = choice.choice(values={0:50, random.randint(1, 10):45, random.randint(10, 20):5})
+                    byte_size_extension = choice.choice(values={0:50, rng("memory").randint(1, 10):45, rng("memory").randint(10, 20):5})
                     new_byte_size = self.byte_size + byte_size_extension
                     self.memory_block = MemoryBlock(name=self.unique_label, byte_size=new_byte_size, address=self._address,
                                                     memory_type=self.memory_type, shared=shared, alignment=self.alignment,
@@ -180,12 +181,12 @@ class Memory:
                         max_aligned_positions = max_offset // self.alignment
                         if max_aligned_positions > 0:
                             # Choose random aligned position
-                            aligned_position = random.randint(0, max_aligned_positions)
+                            aligned_position = rng("memory").randint(0, max_aligned_positions)
                             self.memory_block_offset = aligned_position * self.alignment
                         else:
                             self.memory_block_offset = 0
                     else:
-                        self.memory_block_offset = random.randint(0, max_offset)
+                        self.memory_block_offset = rng("memory").randint(0, max_offset)
             else:
                 # creating a dedicated MemoryBlock
                 self.memory_block = MemoryBlock(name=self.unique_label, byte_size=self.byte_size, address=self._address,
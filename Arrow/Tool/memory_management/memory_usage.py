@@ -1,4 +1,4 @@
-import random
+from Arrow.Utils.seed_management import rng
 from typing import List, Dict
 
 from Arrow.Utils.configuration_management import Configuration, get_config_manager
@@ -29,7 +29,7 @@ def allocate_data_memory(segment_manager: SegmentManager,
         memory: A memory operand from a random data block.
     """
     memory_logger = get_memory_logger()
-    memory_logger.info(f"==================== allocate_data_memory: {name}, memory_block_id: {memory_block_id}, type: {pool_type}, size: {hex(byte_size)}, cross_core: {cross_core}, page_table: {segment_manager.page_table.page_table_name}")
+    memory_logger.info("==================== allocate_data_memory: %s, memory_block_id: %s, type: %s, size: %#x, cross_core: %s, page_table: %s", name, memory_block_id, pool_type, byte_size, cross_core, segment_manager.page_table.page_table_name)
     config_manager = get_config_manager()
     execution_platform = config_manager.get_value('Execution_platform')
 
@@ -40,25 +40,20 @@ def allocate_data_memory(segment_manager: SegmentManager,
     if pool_type is Configuration.Memory_types.DATA_SHARED and init_value_byte_representation is not None:
         raise ValueError(f"Can't initialize value in a shared memory")
 
-    data_segments = segment_manager.get_segments(pool_type, non_exclusive_only=True)
+    if cross_core and pool_type is not Configuration.Memory_types.DATA_PRESERVE:
+        raise ValueError(f"Cross-core memory can only be allocated from DATA_PRESERVE segments")
 
-    if cross_core:
-        if pool_type is not Configuration.Memory_types.DATA_PRESERVE:
-            raise ValueError(f"Cross-core memory can only be allocated from DATA_PRESERVE segments")
-        
-        # filter data_segments to only include cross-core segments
-        data_segments = [segment for segment in data_segments if segment.is_cross_core]
-    else:  
-        #NOTE:: we DONT allow non-cross-core memory to be allocated inside cross-core segments. as later in Linker we only map a single PA block! 
-        # filter out all cross-core segments
-        data_segments = [segment for segment in data_segments if not segment.is_cross_core]
-
-    memory_logger.info(f"Found {len(data_segments)} segments of type {pool_type}:")
-    for i, segment in enumerate(data_segments):
-        memory_logger.info(f"  {i+1}. Segment '{segment.name}' VA:0x{segment.address:x}-0x{segment.address+segment.byte_size-1:x}, size:0x{segment.byte_size:x}, is_cross_core: {segment.is_cross_core}")
+    # cross-core memory comes from the cross-core segments only, other memory never does
+    #NOTE:: we DONT allow non-cross-core memory to be allocated inside cross-core segments. as later in Linker we only map a single PA block! 
+    data_segments = segment_manager.get_segments(pool_type, non_exclusive_only=True, cross_core=bool(cross_core))
+
+    memory_logger.info("Found %s segments of type %s:", len(data_segments), pool_type)
+    if memory_logger.is_enabled_for("info"):
+        for i, segment in enumerate(data_segments):
+            memory_logger.info("  %s. Segment '%s' VA:0x%x-0x%x, size:0x%x, is_cross_core: %s", i+1, segment.name, segment.address, segment.address+segment.byte_size-1, segment.byte_size, segment.is_cross_core)
     
-    selected_segment = random.choice(data_segments)
-    memory_logger.info(f"Selected segment '{selected_segment.name}' VA:0x{selected_segment.address:x}-0x{selected_segment.address+selected_segment.byte_size-1:x}, size:0x{selected_segment.byte_size:x}")
+    selected_segment = rng("memory").choice(data_segments)
+    memory_logger.info("Selected segment '%s' VA:0x%x-0x%x, size:0x%x", selected_segment.name, selected_segment.address, selected_segment.address+selected_segment.byte_size-1, selected_segment.byte_size)
 
     if execution_platform == 'baremetal':
         # Always use DATA page type for data memory allocations
@@ -84,16 +79,16 @@ def allocate_data_memory(segment_manager: SegmentManager,
                 max_aligned_positions = max_offset // alignment
                 if max_aligned_positions > 0:
                     # Choose random aligned position
-                    aligned_position = random.randint(0, max_aligned_positions)
+                    aligned_position = rng("memory").randint(0, max_aligned_positions)
                     segment_offset = aligned_position * alignment
                 else:
                     segment_offset = 0
             else:
-                segment_offset = random.randint(0, max_offset) if max_offset > 0 else 0
+                segment_offset = rng("memory").randint(0, max_offset) if max_offset > 0 else 0
             
             address = start_block + segment_offset
             pa_address = selected_segment.pa_address + segment_offset
-            memory_logger.info(f"DATA_SHARED allocation {state_name} - Segment '{selected_segment.name}' at VA:{hex(address)}, PA:{hex(pa_address)}, size:{byte_size}, type:{page_type}")
+            memory_logger.info("DATA_SHARED allocation %s - Segment '%s' at VA:%#x, PA:%#x, size:%s, type:%s", state_name, selected_segment.name, address, pa_address, byte_size, page_type)
         else: # pool_type is Memory_types.DATA_PRESERVE:
             '''
             When DATA_PRESERVE is asked, the heuristic is as following:
@@ -109,7 +104,7 @@ def allocate_data_memory(segment_manager: SegmentManager,
                 # Find an available region with proper alignment
                 allocation = selected_segment.interval_tracker.find_region(byte_size, alignment)
                 if not allocation:
-                    memory_logger.error(f"No available space in segment for allocation", level="error")
+                    memory_logger.error("No available space in segment for allocation", level="error")
                     raise ValueError(f"No available space in segment {selected_segment.name}")
                         
                 address, _ = allocation
@@ -119,16 +114,16 @@ def allocate_data_memory(segment_manager: SegmentManager,
                 
                 segment_offset = address - selected_segment.address
                 pa_address = selected_segment.pa_address + segment_offset
-                memory_logger.info(f"DATA_PRESERVE allocation {state_name} - Segment '{selected_segment.name}' at VA:{hex(address)}, PA:{hex(pa_address)}, size:{byte_size}")
+                memory_logger.info("DATA_PRESERVE allocation %s - Segment '%s' at VA:%#x, PA:%#x, size:%s", state_name, selected_segment.name, address, pa_address, byte_size)
                     
             except Exception as e:
-                memory_logger.error(f"Failed to allocate data memory: {e}", level="error")
+                memory_logger.error("Failed to allocate data memory: %s", e, level="error")
                 raise ValueError(f"Could not allocate data memory in segment {selected_segment.name}")
     else:  # 'linked_elf'
         address = None
         pa_address = None
         segment_offset = None
-        memory_logger.info(f"Using 'linked_elf' execution platform, address will be determined at link time")
+        memory_logger.info("Using 'linked_elf' execution platform, address will be determined at link time")
 
     data_unit = DataUnit(name=name, memory_block_id=memory_block_id, 
                             address=address, pa_address=pa_address, segment_offset=segment_offset, byte_size=byte_size,
@@ -136,7 +131,7 @@ def allocate_data_memory(segment_manager: SegmentManager,
                             init_value_byte_representation=init_value_byte_representation, 
                             alignment=alignment)
     selected_segment.data_units_list.append(data_unit)
-    memory_logger.info(f"Created DataUnit '{name}' in memory block '{memory_block_id}', segment '{selected_segment.name}'")
+    memory_logger.info("Created DataUnit '%s' in memory block '%s', segment '%s'", name, memory_block_id, selected_segment.name)
 
     per_page_table_data_units = {segment_manager.page_table.page_table_name: data_unit}
 
@@ -166,7 +161,7 @@ def allocate_data_memory(segment_manager: SegmentManager,
 
             # Remove the allocated region from the available pool
             other_cross_core_segment.interval_tracker.remove_region(other_state_block_va_address, byte_size)
-            memory_logger.info(f"DATA_PRESERVE allocation {other_page_table.page_table_name} - Segment '{other_cross_core_segment.name}' at VA:{hex(other_state_block_va_address)}, PA:{hex(pa_address)}, size:{byte_size}")
+            memory_logger.info("DATA_PRESERVE allocation %s - Segment '%s' at VA:%#x, PA:%#x, size:%s", other_page_table.page_table_name, other_cross_core_segment.name, other_state_block_va_address, pa_address, byte_size)
 
             other_name = f"{name}__{other_page_table.page_table_name}"
             other_memory_block_id = f"{memory_block_id}__{other_page_table.page_table_name}"
@@ -177,7 +172,7 @@ def allocate_data_memory(segment_manager: SegmentManager,
                                 alignment=alignment)
             other_cross_core_segment.data_units_list.append(other_state_data_unit)
 
-            memory_logger.info(f"Created DataUnit '{name}' in memory block '{memory_block_id}', segment '{other_cross_core_segment.name}'")
+            memory_logger.info("Created DataUnit '%s' in memory block '%s', segment '%s'", name, memory_block_id, other_cross_core_segment.name)
 
             per_page_table_data_units[other_page_table.page_table_name] = other_state_data_unit
 
@@ -195,54 +190,18 @@ def get_used_memory_block(segment_manager: SegmentManager, byte_size:int=8, alig
         DataUnit: A memory operand from a random data block.
     """
     memory_logger = get_memory_logger()
-    memory_logger.info(f"==================== get_used_memory_block: requested size: {byte_size} bytes")
+    memory_logger.info("==================== get_used_memory_block: requested size: %s bytes", byte_size)
 
-    # extract all shared memory-blocks with byte_size bigger than 'byte-size'
-    valid_memory_blocks = []
-
-    data_shared_segments = segment_manager.get_segments(Configuration.Memory_types.DATA_SHARED)
-    memory_logger.info(f"Searching through {len(data_shared_segments)} DATA_SHARED segments")
-    
-    for segment in data_shared_segments:
-        memory_logger.info(f"Checking segment '{segment.name}' at address 0x{segment.address:x}, size: 0x{segment.byte_size:x}")
-        for mem_block in segment.memory_block_list:
-            #print(f"mem_block: {mem_block}")
-            if mem_block.byte_size >= byte_size:
-                # Check if this block can provide the required alignment
-                block_address = mem_block.get_address()
-                alignment_compatible = True
-                
-                if alignment and alignment > 1 and block_address is not None:
-                    # Check if we can find an aligned position within this block
-                    if (block_address % alignment) == 0:
-                        # Block itself is aligned, we can use it
-                        alignment_compatible = True
-                    else:
-                        # Block not aligned, find first aligned address within block
-                        first_aligned_addr = ((block_address + alignment - 1) // alignment) * alignment
-                        block_end = block_address + mem_block.byte_size
-                        
-                        # Check if aligned position + required size fits within block
-                        if first_aligned_addr + byte_size <= block_end:
-                            alignment_compatible = True
-                            memory_logger.info(f"  Block '{mem_block.name}' can provide alignment: first_aligned=0x{first_aligned_addr:x}, block_end=0x{block_end:x}")
-                        else:
-                            alignment_compatible = False
-                            memory_logger.info(f"  Block '{mem_block.name}' rejected: first_aligned=0x{first_aligned_addr:x} + size={byte_size} > block_end=0x{block_end:x}")
-                
-                if alignment_compatible:
-                    memory_logger.info(f"  Found valid memory block '{mem_block.name}' in segment '{segment.name}', "
-                                f"size: {mem_block.byte_size} bytes, address: {hex(block_address if block_address is not None else 0)}, alignment-compatible: {alignment_compatible}")
-                    valid_memory_blocks.append((segment, mem_block))
+    # all shared memory-blocks with byte_size bigger than 'byte-size' that can provide the alignment, see SharedBlockIndex
+    valid_memory_blocks = segment_manager.shared_block_index.get_candidates(byte_size=byte_size, alignment=alignment)
+    memory_logger.info("Found %s valid memory blocks out of %s shared memory blocks", len(valid_memory_blocks), len(segment_manager.shared_block_index))
 
     if not valid_memory_blocks:
         memory_logger.warning("No valid memory blocks found that meet the size requirement")
         return None
 
     # Select a random memory block
-    selected_segment, selected_memory_block = random.choice(valid_memory_blocks)
-    memory_logger.info(f"Selected memory block '{selected_memory_block.name}' from segment '{selected_segment.name}', "
-                f"address: {hex(selected_memory_block.get_address() if selected_memory_block.get_address() is not None else 0)}, "
-                f"size: {selected_memory_block.byte_size} bytes")
+    selected_segment, selected_memory_block = rng("memory").choice(valid_memory_blocks)
+    memory_logger.info("Selected memory block '%s' from segment '%s', address: %#x, size: %s bytes", selected_memory_block.name, selected_segment.name, selected_memory_block.get_address() if selected_memory_block.get_address() is not None else 0, selected_memory_block.byte_size)
 
     return selected_memory_block
@@ -1,52 +1,35 @@
+import struct
+
 
 def convert_int_value_to_bytes(init_value, element_size):
     """
-    Convert a large integer into a list of bytes, ensuring the block size is respected.
-    Returns a list of integers, each representing a byte.
+    Convert a large integer into bytes, ensuring the block size is respected.
+    Returns a little-endian bytes object, zero padded up to element_size.
     """
-    byte_representation = []
-
     # Calculate the number of bytes needed to represent the value
     num_bytes = (init_value.bit_length() + 7) // 8
 
-    # Collect bytes into a list (little-endian order)
-    for i in range(num_bytes):
-        byte_representation.append((init_value >> (i * 8)) & 0xFF)
+    # Mask to the needed bytes (keeps negative values as their low two's complement bytes)
+    init_value &= (1 << (num_bytes * 8)) - 1
 
     # Pad with zeros if the init_value is smaller than the element size
-    while len(byte_representation) < element_size:
-        byte_representation.append(0)
-
-    return byte_representation
+    return init_value.to_bytes(max(num_bytes, element_size), byteorder='little')
 
 
 def convert_bytes_to_words(byte_representation):
     """
-    Convert a list of bytes (integers) into a list of words (and smaller chunks if needed).
+    Convert bytes (or a list of byte values) into a list of words (and smaller chunks if needed).
     Returns a list of tuples in the format (value, type) where type is "word" or "byte".
     """
     word_size = 4  # Number of bytes per word
-    words = []  # List to hold the result
-    num_bytes = len(byte_representation)
-
-    idx = 0
-    while idx < num_bytes:
-        # If enough bytes are available for a word
-        if idx + word_size <= num_bytes:
-            # Combine 4 bytes into a word (little-endian order)
-            word_value = 0
-            for i in range(word_size):
-                word_value |= byte_representation[idx + i] << (i * 8)
-            words.append((word_value, "word"))
-            idx += word_size
-        else:
-            # Handle remaining bytes
-            remaining_bytes = num_bytes - idx
-            byte_value = 0
-            for i in range(remaining_bytes):
-                byte_value |= byte_representation[idx + i] << (i * 8)
-            words.append((byte_value, "byte"))
-            idx += remaining_bytes
+    data = memoryview(bytes(byte_representation))
+    words_end = len(data) - (len(data) % word_size)
 
-    return words
+    # Combine every 4 bytes into a word (little-endian order)
+    words = [(word_value, "word") for (word_value,) in struct.iter_unpack("<I", data[:words_end])]
+
+    # Handle remaining bytes
+    if words_end < len(data):
+        words.append((int.from_bytes(data[words_end:], byteorder='little'), "byte"))
 
+    return words
@@ -16,6 +16,9 @@ class Register:
         self.default_size = default_size # in gpr default is 64, in simd and sve default is 128
         self._reserve = False
         self.name = f"{self.name_mapping[self.default_size]}"
+        # owning RegisterManager and this register's bit in its masks, set by RegisterManager
+        self._manager = None
+        self._bit = 0
 
     def is_reserve(self) -> bool:
         return self._reserve
@@ -30,9 +33,13 @@ class Register:
 
     def set_reserve(self):
         self._reserve = True
+        if self._manager is not None:
+            self._manager._reserved_mask |= self._bit
 
     def set_free(self):
         self._reserve = False
+        if self._manager is not None:
+            self._manager._reserved_mask &= ~self._bit
 
     def __str__(self):
         return self.name
@@ -1,4 +1,4 @@
-import random
+from Arrow.Utils.seed_management import rng
 from Arrow.Tool.register_management.register import Register
 from Arrow.Utils.logger_management import get_logger
 from Arrow.Utils.configuration_management import Configuration
@@ -110,23 +110,78 @@ class RegisterManager:
         else:
             raise ValueError(f"Unknown Architecture requested")
 
+        self._build_register_masks()
+
+    def _build_register_masks(self) -> None:
+        """
+        Index the register pool as bitmasks: bit i stands for self._registers_pool[i].
+        Reserve/free only flip a bit of _reserved_mask (see Register.set_reserve), and every query is a mask operation,
+        whose registers are listed in pool order.
+        """
+        self._registers_by_name = {}
+        self._type_masks = {}        # type -> all registers of that type
+        self._random_masks = {None: 0}  # type or sub-pool -> registers that can be selected randomly, None for all types
+        self._reserved_mask = 0
+        for index, register in enumerate(self._registers_pool):
+            register._manager = self
+            register._bit = 1 << index
+            if register.is_reserve():
+                self._reserved_mask |= register._bit
+            self._registers_by_name.setdefault(register.name, register)
+            self._type_masks[register.type] = self._type_masks.get(register.type, 0) | register._bit
+            if register.is_random:
+                self._random_masks[None] |= register._bit
+                self._random_masks[register.type] = self._random_masks.get(register.type, 0) | register._bit
+
+        # precomputed sub-pools
+        self._random_masks["sve_pred_low"] = self._random_masks.get("sve_pred", 0) & self._names_mask([f"p{i}" for i in range(8)])
+        # in riscv, temp registers are preferred by get, and saved registers by get_and_reserve
+        self._riscv_temp_mask = self._names_mask([register.name for register in self._registers_pool if register.name.startswith('t')])
+        self._riscv_saved_mask = self._names_mask([register.name for register in self._registers_pool if register.name.startswith('s')])
+
+    def _names_mask(self, names: list[str]) -> int:
+        mask = 0
+        for name in names:
+            if name in self._registers_by_name:
+                mask |= self._registers_by_name[name]._bit
+        return mask
+
+    def get_registers_of_mask(self, mask: int) -> list[Register]:
+        """Registers of a mask (e.g. of reserved_mask), in pool order."""
+        registers = []
+        while mask:
+            low_bit = mask & -mask
+            registers.append(self._registers_pool[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return registers
+
+    def _select_random(self, mask: int) -> Register:
+        # same draw as rng.choice(self.get_registers_of_mask(mask)), without building the list
+        index = rng("register").randrange(mask.bit_count())
+        for _ in range(index):
+            mask &= mask - 1
+        return self._registers_pool[(mask & -mask).bit_length() - 1]
+
+    def _free_mask(self, reg_type: str = None) -> int:
+        return self._random_masks.get(reg_type, 0) & ~self._reserved_mask
+
+    @property
+    def reserved_mask(self) -> int:
+        """Bitmask of the reserved registers, a cheap snapshot to compare reservations before and after some code."""
+        return self._reserved_mask
+
 
     def is_valid_register(self, reg_name:str=None, reg_type:str=None) -> bool:
         if reg_name is None:
-            return reg_type in [reg.type for reg in self._registers_pool]
+            return reg_type in self._type_masks
         else:
-            return reg_name in [reg.name for reg in self._registers_pool]
+            return reg_name in self._registers_by_name
 
     def get_free_registers(self, reg_type:str=None) -> list[Register]:
         """
-        Returns a list of all free registers.
+        Returns a list of all free registers (of a type or sub-pool, e.g. "sve_pred_low" for p0-p7).
         """
-        #return [register for register in self._random_register_pool if not register.is_reserve()]
-        if reg_type is None:
-            return [register for register in self._registers_pool if (not register.is_reserve() and register.is_random==True)]
-        else:
-            return [register for register in self._registers_pool
-                    if (not register.is_reserve() and register.type==reg_type and register.is_random==True)]
+        return self.get_registers_of_mask(self._free_mask(reg_type))
 
 
     def get_used_registers(self, reg_type:str=None) -> list[Register]:
@@ -134,9 +189,9 @@ class RegisterManager:
         Returns a list of all reserved registers.
         """
         if reg_type is None:
-            return [register for register in self._registers_pool if register.is_reserve()]
+            return self.get_registers_of_mask(self._reserved_mask)
         else:
-            return [register for register in self._registers_pool if (register.is_reserve() and register.type==reg_type)]
+            return self.get_registers_of_mask(self._reserved_mask & self._type_masks.get(reg_type, 0))
 
     def get(self, reg_name:str=None, reg_type:str=None) -> Register:
         """
@@ -144,27 +199,21 @@ class RegisterManager:
         and returns the selected register. If no available child is found, raise Error
         """
         if reg_name:
-            for reg in self._registers_pool:
-                if reg.name == reg_name:
-                    return reg
+            if reg_name in self._registers_by_name:
+                return self._registers_by_name[reg_name]
             raise ValueError(f'Invalid value, register {reg_name} is not part of registers list ')
         else:
-            if reg_type == "sve_pred_low":
-                # if reg_type is sve_pred_low, we need to check if there are any free predicate registers available at the range of p0-p7 , which is a subset of sve_pred (p0-p17)
-                all_free_regs = self.get_free_registers(reg_type="sve_pred")
-                low_registers = [reg for reg in all_free_regs if reg.name in ["p0", "p1", "p2", "p3", "p4", "p5", "p6", "p7"]]
-                free_regs = low_registers
-            else:
-                free_regs = self.get_free_registers(reg_type=reg_type)
+            # sve_pred_low is the p0-p7 sub-pool of sve_pred (p0-p17)
+            free_mask = self._free_mask(reg_type)
 
-            if free_regs:
+            if free_mask:
                 if Configuration.Architecture.riscv:
                     # in riscv, try preferring temp registers when ask for get, and saved registers when asked for get_and_reserve
-                    temp_registers = [reg for reg in free_regs if str(reg).startswith('t')]
-                    selected_reg = random.choice(temp_registers) if temp_registers else random.choice(free_regs)
+                    temp_mask = free_mask & self._riscv_temp_mask
+                    selected_reg = self._select_random(temp_mask if temp_mask else free_mask)
                 else:
                     # Default selection for non-RISC-V architectures
-                    selected_reg = random.choice(free_regs)
+                    selected_reg = self._select_random(free_mask)
                 return selected_reg
             else:
                 # No available child
@@ -176,19 +225,18 @@ class RegisterManager:
         and returns the selected register. If no available child is found, raise Error
         """
         if not self.is_valid_register(reg_type=reg_type):
-            reg_types = [reg.type for reg in self._registers_pool]
-            unique_reg_types = list(set(reg_types))            # get unique types
+            unique_reg_types = list(self._type_masks)            # get unique types
             raise ValueError(f"Invalid register type: `{reg_type}`. Please use one of the following types: {', '.join(unique_reg_types)}")
 
-        free_regs = self.get_free_registers(reg_type=reg_type)
-        if free_regs:
+        free_mask = self._free_mask(reg_type)
+        if free_mask:
             if Configuration.Architecture.riscv:
                 # in riscv, try preferring temp_registers when ask for get, and saved-registers when asked for get_and_reserve
-                saved_registers = [reg for reg in free_regs if str(reg).startswith('s')]
-                selected_reg = random.choice(saved_registers) if saved_registers else random.choice(free_regs)
+                saved_mask = free_mask & self._riscv_saved_mask
+                selected_reg = self._select_random(saved_mask if saved_mask else free_mask)
             else:
                 # Default selection for non-RISC-V architectures
-                selected_reg = random.choice(free_regs)
+                selected_reg = self._select_random(free_mask)
 
             selected_reg.set_reserve()
             return selected_reg
@@ -2,7 +2,8 @@ from typing import Optional, Dict, Callable, Union, List
 from Arrow.Utils.singleton_management import SingletonManager
 from Arrow.Utils.configuration_management import Configuration
 from Arrow.Utils.logger_management import get_logger
-from Arrow.Utils.APIs.choice import choice
+from Arrow.Utils.APIs.weighted_sampler import WeightedSampler, normalize_tags, get_tags_cache_key, get_tag_weights
+from Arrow.Tool.scenario_management.content_manifest import LazyContent
 
 class ScenarioWrapper:
     """
@@ -58,6 +59,8 @@ class ScenarioManager:
         logger = get_logger()
         logger.info("======================== ScenarioManager")
         self._scenarios_pool = []
+        self._scenarios_by_name = {}  # name -> position in _scenarios_pool
+        self._samplers = {}  # tag query -> WeightedSampler of the random scenarios, invalidated when the pool changes
 
     def list_scenarios(self):
         """Return a list of all scenarios for debugging or reporting purposes."""
@@ -66,6 +69,7 @@ class ScenarioManager:
     def add_scenario(self, scenario: ScenarioWrapper):
         """
         Add a new scenario to the pool.
+        A scenario whose content manifest placeholder (LazyContent) is in the pool takes the placeholder's place.
 
         Args:
             scenario (ScenarioWrapper): The scenario instance to add.
@@ -75,13 +79,23 @@ class ScenarioManager:
         """
         #print(f"Adding scenario {scenario.name()}")
         # Check if a scenario with the same name already exists
-        if any(existing_scenario.name() == scenario.name() for existing_scenario in self._scenarios_pool):
+        position = self._scenarios_by_name.get(scenario.name())
+        if position is not None:
+            existing_scenario = self._scenarios_pool[position]
+            if isinstance(existing_scenario, LazyContent) and existing_scenario.resolved is None \
+                    and not isinstance(scenario, LazyContent):
+                # the placeholder's module was imported, same metadata so the cached samplers stay valid
+                existing_scenario.resolved = scenario
+                self._scenarios_pool[position] = scenario
+                return
             raise ValueError(f"A scenario with the name '{scenario.name()}' already exists in the pool.")
 
         # Add the scenario to the pool
         logger = get_logger()
         logger.debug(f"Add new scenario {scenario.name()}")
+        self._scenarios_by_name[scenario.name()] = len(self._scenarios_pool)
         self._scenarios_pool.append(scenario)
+        self._samplers.clear()
 
     # Functions to query scenarios
     def get_scenario_by_name(self, name: str) -> Optional[ScenarioWrapper]:
@@ -94,13 +108,44 @@ class ScenarioManager:
         Returns:
             ScenarioWrapper: The ScenarioWrapper object or None if not found.
         """
-        for scenario_inst in self._scenarios_pool:
-            if scenario_inst.name() == name:
-                return scenario_inst
+        position = self._scenarios_by_name.get(name)
+        if position is None:
+            raise ValueError(f"Scenario '{name}' not found.")
 
-        raise ValueError(f"Scenario '{name}' not found.")
+        scenario_inst = self._scenarios_pool[position]
+        if isinstance(scenario_inst, LazyContent):
+            scenario_inst = scenario_inst.resolve()
+        return scenario_inst
 
 
+    def _get_sampler(self, tags) -> WeightedSampler:
+        """
+        Return the weighted sampler of the random scenarios for a tag query, building it on first use.
+        Samplers are cached per tag query until a scenario is added to the pool.
+        """
+        tags = normalize_tags(tags)
+        cache_key = get_tags_cache_key(tags)
+        sampler = self._samplers.get(cache_key) if cache_key is not None else None
+        if sampler is not None:
+            return sampler
+
+        # Filter scenarios that have random=True
+        random_scenarios = [s for s in self._scenarios_pool if s.random]
+
+        if not random_scenarios:
+            raise ValueError("No random scenarios available.")
+
+        weighted_objects_dict = get_tag_weights(random_scenarios, tags)
+
+        # Create a mapping of scenarios by tag, and ensure scenarios without tags are part of REST
+        if not weighted_objects_dict:
+            raise RuntimeError("No valid tags found with associated scenarios.")
+
+        sampler = WeightedSampler(weighted_objects_dict, subsystem="scenario")
+        if cache_key is not None:
+            self._samplers[cache_key] = sampler
+        return sampler
+
     def get_random_scenario(self, tags: Optional[Union[Dict[Configuration.Tag, int],List[Configuration.Tag]]] = None, _precondition_retries: int = 10) -> ScenarioWrapper:
         """
             Returns a single random scenario that matches the tag distribution, is random=True, satisfies the precondition, and
@@ -118,69 +163,12 @@ class ScenarioManager:
                 ValueError: If no valid scenario is found after 'retries' attempts.
         """
 
-        # Filter scenarios that have random=True
-        random_scenarios = [s for s in self._scenarios_pool if s.random]
-
-        if not random_scenarios:
-            raise ValueError("No random scenarios available.")
-
-
-        if tags is None:
-            # If no tags provided, default to 100% REST
-            tags = {Configuration.Tag.REST: 100}
-        elif isinstance(tags, list):
-            # If tags is a list, convert to dict with uniform weights
-            uniform_weight = 100 / len(tags) if tags else 0  # Avoid division by zero
-            tags = {tag: uniform_weight for tag in tags}
-        elif isinstance(tags, dict):
-            # list is of the correct instance, do nothing
-            pass
-        else:
-            # list is at an invalid type
-            raise TypeError(f"Expected 'tags' to be a dictionary or List, but got {type(tags).__name__}")
-
-        '''
-        Calculate Combined Weights: 
-        For each object, calculate a weight based on both its priority and the requested tag distribution. 
-        This combined weight can be the product of the object's priority and the distribution weight for each tag it has.
-        Construct a Weighted List: 
-        Create a list where each object appears with its combined weight. 
-        This list will include all objects with weights that reflect both the priority and the tag distribution.
-        Weighted Sampling: 
-        Use a single weighted random selection based on these combined weights to choose the required number of objects.
-        '''
-
-        # Step 1: Calculate combined weights for each object
-        weighted_objects_dict = {}
-        total_weight = 0
-        for scenario in random_scenarios:
-            # calculate based on tags sum
-            tag_weights = sum(tags.get(tag, 0) for tag in scenario.tags)
-            combined_weight = Configuration.PRIORITY_WEIGHTS[scenario.priority] * tag_weights
-
-            # Only add to the list if combined_weight > 0
-            if combined_weight > 0:
-                total_weight += combined_weight
-                weighted_objects_dict[scenario] = combined_weight
-
-        # Step 2: handle "direct" scenarios, calculate their weight and add to dict
-
-        for scenario in random_scenarios:
-            if str(scenario) in tags.keys():
-                # calculate relative weight
-                direct_scenario_portion = tags[str(scenario)] / sum(tags.values())
-                all_other_portion = 1 - direct_scenario_portion
-                overall_weight = total_weight / all_other_portion
-                weighted_objects_dict[scenario] = overall_weight * direct_scenario_portion
-
-        # Step 3: use `Tool.choices` to randomize from weighted_objects_dict
-
-        # Create a mapping of scenarios by tag, and ensure scenarios without tags are part of REST
-        if not weighted_objects_dict:
-            raise RuntimeError("No valid tags found with associated scenarios.")
+        sampler = self._get_sampler(tags)
 
         for _ in range(_precondition_retries):
-            candidate = choice(values=weighted_objects_dict)
+            candidate = sampler.choice()
+            if isinstance(candidate, LazyContent):
+                candidate = candidate.resolve()  # first selection of a content manifest scenario, import it
 
             # Check precondition, if it exists and is callable
             if hasattr(candidate, 'precondition') and callable(candidate.precondition):
@@ -0,0 +1,243 @@
+import os
+import sys
+import json
+import hashlib
+import importlib
+import importlib.util
+from typing import Callable, Dict, List, Optional
+from Arrow.Utils.configuration_management import Configuration
+
+"""
+Content manifest, a persistent cache of the scenarios and ingredients registered by the content packages.
+
+The first run imports the content packages as usual and records, for every scenario and ingredient they register,
+its name, tags, priority, random flag, precondition kind and module, together with the signature (mtime, size and
+sha256) of every content file that was loaded. The next runs validate the signatures and, when nothing changed,
+register lazy placeholders (LazyContent) in the scenario and ingredient pools instead of importing the content.
+A placeholder keeps its pool position, tags and priority, so the weighted selections are unchanged; the module
+defining it is only imported when it is first selected (or its precondition is evaluated).
+
+Content modules are expected to only register scenarios and ingredients at import time (any other import-time
+side effect happens on first selection instead), run with '--content_manifest False' to always import the content.
+The manifests are kept under $ARROW_CONTENT_MANIFEST_DIR, or ~/.arrow/content_manifest by default.
+"""
+
+MANIFEST_VERSION = 1
+MANIFEST_DIR_ENV_VARIABLE = "ARROW_CONTENT_MANIFEST_DIR"
+EXTERNAL_CONTENT_MODULE = "scenarios_path"  # module name the external content __init__.py is executed as
+
+_NO_PRECONDITION = None
+_CALLABLE_PRECONDITION = "callable"
+
+
+class ContentSource:
+    """A content package imported by init_scenarios: the internal content, or the external content __init__.py."""
+
+    def __init__(self, name: str, root: str, load: Callable[[], None]):
+        self.name = name
+        self.root = os.path.abspath(root)
+        self.load = load
+
+    def owns(self, file_path: str) -> bool:
+        return os.path.abspath(file_path).startswith(self.root + os.sep)
+
+
+def internal_content_source(internal_content_dir_path) -> ContentSource:
+    def load():
+        importlib.import_module("Arrow.Internal_content")
+    return ContentSource("internal", str(internal_content_dir_path), load)
+
+
+def external_content_source(init_file_path: str) -> ContentSource:
+    def load():
+        if EXTERNAL_CONTENT_MODULE in sys.modules:
+            return
+        spec = importlib.util.spec_from_file_location(EXTERNAL_CONTENT_MODULE, init_file_path)
+        if spec is None:
+            raise ImportError(f"Failed to create spec from file location: {init_file_path}")
+        content_module = importlib.util.module_from_spec(spec)
+        sys.modules[EXTERNAL_CONTENT_MODULE] = content_module
+        try:
+            spec.loader.exec_module(content_module)
+        except BaseException:
+            del sys.modules[EXTERNAL_CONTENT_MODULE]
+            raise
+    return ContentSource("external", os.path.dirname(init_file_path), load)
+
+
+class LazyContent:
+    """
+    Placeholder of a manifest scenario or ingredient in its manager's pool, exposing the metadata used by the
+    weighted selection. resolve() imports the defining module, whose decorator replaces the placeholder in the pool.
+    """
+
+    def __init__(self, entry: Dict, source: ContentSource):
+        self.kind = entry["kind"]
+        self._name = entry["name"]
+        self.__name__ = entry["name"]
+        self.display_name = entry["display_name"]
+        self.random = entry["random"]
+        self.priority = Configuration.Priority[entry["priority"]]
+        self.tags = [Configuration.Tag[tag] for tag in entry["tags"]]
+        self.module = entry["module"]
+        self.source = source
+        self.resolved = None
+        # the precondition kind is kept, as batch selections depend on whether it is callable
+        if entry["precondition"] == _CALLABLE_PRECONDITION:
+            self.precondition = self._call_precondition
+        else:
+            self.precondition = entry["precondition"]
+
+    def name(self) -> str:
+        return self._name
+
+    def __str__(self) -> str:
+        return self.display_name
+
+    def __repr__(self) -> str:
+        return f"LazyContent({self.kind}={self._name}, module={self.module})"
+
+    def _call_precondition(self):
+        return self.resolve().precondition()
+
+    def resolve(self):
+        """The actual ScenarioWrapper or ingredient class, importing its module on first use."""
+        if self.resolved is None:
+            if self.module != EXTERNAL_CONTENT_MODULE:
+                try:
+                    importlib.import_module(self.module)
+                except ModuleNotFoundError:
+                    pass  # not importable on its own, loaded with its whole content package below
+            if self.resolved is None:
+                self.source.load()
+            if self.resolved is None:
+                raise RuntimeError(f"Content {self.kind} '{self._name}' is not defined by module '{self.module}' "
+                                   f"anymore, run with '--content_manifest False' to rebuild the content manifest")
+        return self.resolved
+
+
+def get_manifest_path(sources: List[ContentSource], architecture: str) -> str:
+    manifest_dir = os.environ.get(MANIFEST_DIR_ENV_VARIABLE) or \
+                   os.path.join(os.path.expanduser("~"), ".arrow", "content_manifest")
+    key = hashlib.sha256(repr(([source.root for source in sources], architecture)).encode()).hexdigest()[:16]
+    return os.path.join(manifest_dir, f"{key}.json")
+
+
+def _hash_file(file_path: str) -> str:
+    with open(file_path, "rb") as content_file:
+        return hashlib.sha256(content_file.read()).hexdigest()
+
+
+def _file_signature(file_path: str) -> Dict:
+    file_stat = os.stat(file_path)
+    return {"mtime_ns": file_stat.st_mtime_ns, "size": file_stat.st_size, "sha256": _hash_file(file_path)}
+
+
+def _is_unchanged(file_path: str, signature: Dict) -> bool:
+    """Compare the mtime and size first, the content hash only if they differ (e.g. after a fresh checkout)."""
+    try:
+        file_stat = os.stat(file_path)
+    except OSError:
+        return False
+    if file_stat.st_mtime_ns == signature["mtime_ns"] and file_stat.st_size == signature["size"]:
+        return True
+    return file_stat.st_size == signature["size"] and _hash_file(file_path) == signature["sha256"]
+
+
+def load_content_manifest(sources: List[ContentSource], architecture: str) -> Optional[Dict]:
+    """Returns the cached manifest of the content sources, or None if missing or any of its files changed."""
+    manifest_path = get_manifest_path(sources, architecture)
+    try:
+        with open(manifest_path) as manifest_file:
+            manifest = json.load(manifest_file)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("architecture") != architecture \
+            or manifest.get("sources") != [source.root for source in sources]:
+        return None
+    if not all(_is_unchanged(file_path, signature) for file_path, signature in manifest["files"].items()):
+        return None
+    return manifest
+
+
+def _precondition_kind(precondition):
+    if precondition is None or isinstance(precondition, bool):
+        return precondition
+    if callable(precondition):
+        return _CALLABLE_PRECONDITION
+    raise TypeError(f"Unsupported precondition {precondition!r}")
+
+
+def _build_entry(kind: str, name: str, content, module: str, source_index: int) -> Dict:
+    if not isinstance(content.random, bool) or not isinstance(content.priority, Configuration.Priority) \
+            or not all(isinstance(tag, Configuration.Tag) for tag in content.tags):
+        raise TypeError(f"Unsupported metadata of {kind} '{name}'")
+    return {
+        "kind": kind,
+        "name": name,
+        "display_name": str(content),
+        "random": content.random,
+        "priority": content.priority.name,
+        "tags": [tag.name for tag in content.tags],
+        "precondition": _precondition_kind(content.precondition),
+        "module": module,
+        "source": source_index,
+    }
+
+
+def import_and_record_content(sources: List[ContentSource], architecture: str, scenario_manager,
+                              ingredient_manager) -> Optional[Dict]:
+    """
+    Import the content sources, in order, and build the manifest of what they registered.
+
+    Returns:
+        dict: the manifest, or None if some content can't be described by a manifest (and must always be imported).
+    """
+    entries = []
+    files = {}
+    describable = True
+    for source_index, source in enumerate(sources):
+        loaded_modules = set(sys.modules)
+        scenario_count = len(scenario_manager.list_scenarios())
+        ingredient_count = len(ingredient_manager.list_ingredients())
+
+        source.load()
+
+        for module_name in set(sys.modules) - loaded_modules:
+            file_path = getattr(sys.modules[module_name], "__file__", None)
+            if file_path and source.owns(file_path):
+                files[os.path.abspath(file_path)] = _file_signature(file_path)
+        try:
+            for scenario in scenario_manager.list_scenarios()[scenario_count:]:
+                entries.append(_build_entry("scenario", scenario.name(), scenario, scenario.func.__module__,
+                                            source_index))
+            for ingredient in ingredient_manager.list_ingredients()[ingredient_count:]:
+                entries.append(_build_entry("ingredient", ingredient.__name__, ingredient, ingredient.__module__,
+                                            source_index))
+        except TypeError:
+            describable = False
+
+    if not describable:
+        return None
+    return {"version": MANIFEST_VERSION, "architecture": architecture,
+            "sources": [source.root for source in sources], "files": files, "entries": entries}
+
+
+def save_content_manifest(manifest: Dict, sources: List[ContentSource], architecture: str) -> None:
+    manifest_path = get_manifest_path(sources, architecture)
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    temp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as manifest_file:
+        json.dump(manifest, manifest_file)
+    os.replace(temp_path, manifest_path)  # atomic, concurrent runs may write the same manifest
+
+
+def register_content_manifest(manifest: Dict, sources: List[ContentSource], scenario_manager,
+                              ingredient_manager) -> None:
+    """Register the manifest scenarios and ingredients as lazy placeholders, in their original order."""
+    for entry in manifest["entries"]:
+        placeholder = LazyContent(entry, sources[entry["source"]])
+        if entry["kind"] == "scenario":
+            scenario_manager.add_scenario(placeholder)
+        else:
+            ingredient_manager.add_ingredient(placeholder)
@@ -5,26 +5,34 @@ from Arrow.Externals.db_manager.models import get_instruction_db
 from Arrow.Utils.singleton_management import SingletonManager
 
 from Arrow.Externals.binary_generation.asm_generation import generate_assembly
-from Arrow.Externals.binary_generation.binary_generation import generate_binary
-from Arrow.Externals.binary_generation.pgt_page_table_generation import run_PGT_prototype
 
 def final_section():
     logger = get_logger()
     config_manager = get_config_manager()
     logger.info("======== final_section")
 
-    generation_json_dump()
-    memory_usage_json_dump()
+    if config_manager.get_value('Json_dump'):
+        generation_json_dump()
+        memory_usage_json_dump()
 
     create_binary = config_manager.get_value('Create_binary')
 
     enable_mmu = True # config_manager.get_value('Enable_MMU')
     if enable_mmu and create_binary:
+        from Arrow.Externals.binary_generation.pgt_page_table_generation import run_PGT_prototype
         run_PGT_prototype()
 
-    generate_assembly()
+    binary_dump = config_manager.get_value('Binary_dump')
+    data_payloads = {} if binary_dump else None
+    generate_assembly(data_payloads)
+
+    if binary_dump:
+        from Arrow.Tool.stages.final_stage.binary_dump import generation_binary_dump
+        generation_binary_dump(data_payloads)
 
     if create_binary:
+        # the binary toolchain pipelines are only loaded when a binary is requested
+        from Arrow.Externals.binary_generation.binary_generation import generate_binary
         try:
             generate_binary()
         except Exception as e:
@@ -53,18 +61,27 @@ def close_instruction_db():
     logger.debug(f"------ close DB connection")
 
 
-def reset_tool():
+def reset_tool(keep_singletons=()):
     """
     Reset tool states (e.g., factories, settings, ...).
     this is needed when running under cloud mode and rerun the tool without reinitialize all its instances.
+
+    Args:
+        keep_singletons: SingletonManager keys of run-independent instances to keep (e.g., the instruction catalog).
     """
     logger = get_logger()
     logger.debug(f"------ reset_tool")
     # resetting logger
     logger_manager = get_logger(get_manager=True)
     logger_manager.clean_logger()
+    from Arrow.Tool.memory_management.memory_logger import MemoryLogger
+    MemoryLogger.clean_logger()
 
     # resetting all managers, including State, logger, Configuration, Knobs, ingredients, scenarios...
-    SingletonManager.reset()
+    SingletonManager.reset(keep=keep_singletons)
+
+    # knobs are created once at import time, restore their defaults and register them in the new KnobManager
+    from Arrow.Utils.configuration_management.knobs import reset_knobs
+    reset_knobs()
 
 
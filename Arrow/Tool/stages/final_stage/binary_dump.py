@@ -0,0 +1,63 @@
+import os
+from typing import Dict, Optional
+from Arrow.Utils.configuration_management import Configuration, get_config_manager
+from Arrow.Utils.logger_management import get_logger
+from Arrow.Utils.generation_dump import GenerationDumpWriter, DUMP_FILE_NAME, VIEW_SUMMARY, VIEW_CODE, VIEW_DATA
+from Arrow.Tool.state_management import get_current_state
+from Arrow.Tool.asm_blocks.asm_unit import get_comment_mark
+from Arrow.Tool.asm_blocks.data_unit import get_source_context_tracker
+from Arrow.Tool.memory_management.memlayout.page_table_manager import get_page_table_manager
+
+
+def generation_binary_dump(data_payloads: Optional[Dict[str, bytes]] = None):
+    """
+    Write generation_dump.bin, the columnar binary dump of the test (see Arrow.Utils.generation_dump).
+
+    The segments of the current page table come first, in the order of memory_usage.json and flagged with the JSON
+    outputs they belong to, followed by the other segments written to the asm file (all page tables).
+    data_payloads: the random payloads of the shared data segments by segment name, as drawn by generate_assembly
+    """
+    logger = get_logger()
+    logger.info(f"---- {DUMP_FILE_NAME} dump")
+
+    current_page_table = get_current_state().current_el_page_table
+    segment_manager = current_page_table.segment_manager
+    code_types = [Configuration.Memory_types.BOOT_CODE, Configuration.Memory_types.CODE]
+    data_types = [Configuration.Memory_types.DATA_SHARED, Configuration.Memory_types.DATA_PRESERVE]
+
+    # ordered segment -> views, the JSON segments first
+    segment_views = {segment: VIEW_SUMMARY for segment in segment_manager.get_segments(pool_type=code_types + data_types)}
+    for segment in segment_manager.get_segments(pool_type=code_types):
+        segment_views[segment] |= VIEW_CODE
+    for segment in segment_manager.get_segments(pool_type=data_types):
+        segment_views[segment] |= VIEW_DATA
+    for page_table in get_page_table_manager().get_all_page_tables():
+        for memory_type in (Configuration.Memory_types.BSP_BOOT_CODE, *code_types, *data_types, Configuration.Memory_types.STACK):
+            for segment in page_table.segment_manager.pool_type_mapping.get(memory_type, ()):
+                segment_views.setdefault(segment, 0)
+
+    config_manager = get_config_manager()
+    output_file = os.path.join(config_manager.get_value('output_dir_path'), DUMP_FILE_NAME)
+    meta = {
+        "architecture": Configuration.Architecture.arch_str,
+        "comment_mark": get_comment_mark(),
+        "page_table": current_page_table.page_table_name,
+    }
+    writer = GenerationDumpWriter(output_file, meta)
+    get_provenance = get_source_context_tracker().get_provenance
+    data_payloads = data_payloads or {}
+
+    for segment, views in segment_views.items():
+        writer.add_segment(segment.name, segment.page_table.page_table_name, segment.memory_type, views,
+                           segment.address, segment.pa_address, segment.byte_size,
+                           payload=data_payloads.get(segment.name))
+        for asm_unit in getattr(segment, "asm_units_list", ()):
+            operands = ', '.join(map(str, asm_unit.operands)) if asm_unit.mnemonic else None
+            writer.add_asm_unit(asm_unit.type, asm_unit.prefix, asm_unit.asm_string, asm_unit.mnemonic, operands,
+                                asm_unit.comment, get_provenance(asm_unit.provenance_id))
+        for data_unit in getattr(segment, "data_units_list", ()):
+            writer.add_data_unit(data_unit.name, data_unit.memory_block_id, data_unit.memory_segment_id,
+                                 data_unit.address, data_unit.pa_address, data_unit.segment_offset,
+                                 data_unit.byte_size, data_unit.alignment, data_unit.init_value_byte_representation,
+                                 (data_unit.file_name, data_unit.file_name_shortened_path, data_unit.line_number))
+    writer.close()
@@ -1,7 +1,5 @@
 import os
-import random
-import importlib.util
-import sys
+from Arrow.Utils.seed_management import rng
 from Arrow.Utils.configuration_management import get_config_manager, Configuration
 from Arrow.Utils.logger_management import get_logger
 from Arrow.Tool.state_management import get_state_manager, get_current_state
@@ -153,10 +151,10 @@ def init_page_tables():
             page_table.allocate_page(size=Configuration.Page_sizes.SIZE_2M, page_type=Configuration.Page_types.TYPE_CODE, sequential_page_count=1, VA_eq_PA=True)
         
         for type in [Configuration.Page_types.TYPE_CODE, Configuration.Page_types.TYPE_DATA]:
-            count = random.randint(6, 8)
+            count = rng("layout").randint(6, 8)
             for _ in range(count):
                 sequential_page_count = choice(values={1:90, 2:9, 3:1})
-                size = random.choice([Configuration.Page_sizes.SIZE_4K, Configuration.Page_sizes.SIZE_2M])
+                size = rng("layout").choice([Configuration.Page_sizes.SIZE_4K, Configuration.Page_sizes.SIZE_2M])
                 page_table.allocate_page(size=size, page_type=type, sequential_page_count=sequential_page_count)
 
 
@@ -267,10 +265,13 @@ def init_exception_tables():
 def init_scenarios():
     logger = get_logger()
     logger.info("============ init_scenarios")
-    logger.info("================ import Internal_content")
-    import Arrow.Internal_content
+    from Arrow.Tool.scenario_management import get_scenario_manager
+    from Arrow.Tool.ingredient_management import get_ingredient_manager
+    from Arrow.Tool.scenario_management import content_manifest
 
     config_manager = get_config_manager()
+    content_sources = [content_manifest.internal_content_source(config_manager.get_value('internal_content_dir_path'))]
+
     external_content_dir_path = config_manager.get_value('external_content_dir_path')
     if external_content_dir_path != "External-content-not-available":
 
@@ -291,27 +292,43 @@ def init_scenarios():
             # logger.warning("Skipping Content initialization, using only scenarios from main template.")
             # return
 
+        # Check if the __init__.py file exists
+        if os.path.exists(normalized_path):
+            content_sources.append(content_manifest.external_content_source(normalized_path))
+        else:
+            logger.error(f"External content __init__.py not found at: {normalized_path}")
+
+    scenario_manager = get_scenario_manager()
+    ingredient_manager = get_ingredient_manager()
+    architecture = config_manager.get_value('Architecture')
+    use_manifest = config_manager.get_value('Content_manifest')
+
+    if use_manifest:
+        manifest = content_manifest.load_content_manifest(content_sources, architecture)
+        if manifest is not None:
+            # content modules are imported on first selection of one of their scenarios or ingredients
+            content_manifest.register_content_manifest(manifest, content_sources, scenario_manager, ingredient_manager)
+            logger.info(f"================ Content registered from manifest ({len(manifest['entries'])} scenarios and ingredients)")
+            return
+
+    logger.info("================ import Internal_content")
+    if len(content_sources) > 1:
         logger.info("================ import External content")
+    try:
+        manifest = content_manifest.import_and_record_content(content_sources, architecture, scenario_manager,
+                                                              ingredient_manager)
+    except Exception as e:
+        logger.error(f"Failed to import content: {e}")
+        logger.error(f"Content paths: {[source.root for source in content_sources]}")
+        raise
+    if len(content_sources) > 1:
+        logger.info("================ External content import successful")
+
+    if use_manifest and manifest is not None:
         try:
-            # Check if the __init__.py file exists
-            if not os.path.exists(normalized_path):
-                logger.error(f"External content __init__.py not found at: {normalized_path}")
-                return
-            
-            spec = importlib.util.spec_from_file_location("scenarios_path", normalized_path)
-            if spec is None:
-                logger.error(f"Failed to create spec from file location: {normalized_path}")
-                return
-                
-            foo = importlib.util.module_from_spec(spec)
-            sys.modules["scenarios_path"] = foo
-            spec.loader.exec_module(foo)
-            logger.info("================ External content import successful")
-            
-        except Exception as e:
-            logger.error(f"Failed to import external content: {e}")
-            logger.error(f"External content path: {normalized_path}")
-            raise
+            content_manifest.save_content_manifest(manifest, content_sources, architecture)
+        except OSError as e:
+            logger.debug(f"Failed to save the content manifest: {e}")
 
 
 def init_section():
@@ -0,0 +1,478 @@
+import gc
+import io
+import os
+import sys
+import copy
+import pickle
+import logging
+import tempfile
+import traceback
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from Arrow.Utils.logger_management import get_logger
+from Arrow.Utils.configuration_management import get_config_manager
+from Arrow.Utils.seed_management import derive_seed, reseed, get_random_streams
+from Arrow.Utils.statistics_managment import get_statistics_manager
+from Arrow.Tool.state_management import get_state_manager
+from Arrow.Tool.state_management.switch_state import SwitchState
+from Arrow.Tool.memory_management.memlayout.page_table_manager import get_page_table_manager
+from Arrow.Tool.asm_libraries.barrier.barrier_manager import get_barrier_manager
+from Arrow.Tool.asm_blocks.data_unit import get_source_context_tracker
+
+"""
+Per-core body generation, enabled with '--body_workers N' (N >= 1).
+
+Instead of round-robin over the cores, each core generates all of its scenarios as one unit:
+    - with its own random streams: the core's tool streams (see RandomStreams), and derive_seed(seed, core, "body")
+      for content code drawing from the global `random` module
+    - with its own range of label / memory / segment ids (ID_STRIDE ids per core)
+    - with its own slot of the cross-core resources: a slice of every cross-core DATA_PRESERVE segment, and a slice of
+      every cross-core page, so of the physical memory the cores share (see _core_partition)
+so the body of a core does not depend on the other cores, nor on the order the cores are generated in.
+
+The cores are generated in forked worker processes, at most N at a time. A worker sends back the code, data and
+memory blocks of its own segments, the segments and allocations of its page tables, the physical memory they took,
+what it allocated in the cross-core segments, the barriers it created or registered to, its state and the positions
+of its random streams. Objects that already existed at fork time are sent as references (persistent ids), and the
+parent merges the cores in core order.
+A core that created a barrier an earlier core created first (e.g. AR.Barrier("sync") in every body) is generated
+again, forked once the earlier cores are merged, so it only registers to it - as it would in-process. Only those
+cores are generated again.
+
+Whenever a forked result can't be used, the cores not merged yet are generated in-process, core after core, with
+the same seeds, id ranges and slots:
+    - a core that changes what can't be partitioned (another core's state, segments or random streams - e.g. a
+      scenario switching into another core -, or its reserved registers), or whose result can't be read back
+    - a failing worker (e.g. a core allocating more cross-core memory than its slot, or a worker killed before it
+      wrote its result) - then without the slots, where a genuine error raises.
+Without os.fork the body is generated in-process with the slots, a barrier requested by several cores then being
+created by the first of them.
+"""
+
+ID_STRIDE = 1000000
+SLOT_ALIGNMENT = 16  # byte alignment of the per-core slots of the cross-core resources
+
+
+def _id_counters() -> List:
+    # class level id counters used to name labels, memory operands, memory blocks and segments
+    from Arrow.Tool.asm_libraries.label import Label
+    from Arrow.Tool.memory_management.memory_operand import Memory
+    from Arrow.Tool.memory_management.memory_block import MemoryBlock
+    from Arrow.Tool.memory_management.memlayout.segment import MemorySegment
+    return [(Label, "_label_index"),
+            (Memory, "_memory_initial_seed_id"),
+            (MemoryBlock, "_memory_block_initial_seed_id"),
+            (MemorySegment, "_memory_segment_initial_seed_id")]
+
+
+def _get_id_counters() -> List[int]:
+    return [getattr(counter_class, attr_name) for counter_class, attr_name in _id_counters()]
+
+
+def _restore_id_counters(values: List[int]) -> None:
+    for (counter_class, attr_name), value in zip(_id_counters(), values):
+        setattr(counter_class, attr_name, value)
+
+
+def _set_id_counters(id_bases: List[int], slot: int) -> None:
+    _restore_id_counters([base + slot * ID_STRIDE for base in id_bases])
+
+
+def _check_id_counters(id_bases: List[int], slot: int, core: str) -> None:
+    for (counter_class, attr_name), base in zip(_id_counters(), id_bases):
+        if getattr(counter_class, attr_name) >= base + (slot + 1) * ID_STRIDE:
+            raise ValueError(f"Body of {core} used more than {ID_STRIDE} ids of {counter_class.__name__}.{attr_name}")
+
+
+def _slot_range(byte_size: int, slot: int, slots: int) -> Tuple[int, int]:
+    """[start, end) offsets of the slot of a core, when byte_size bytes are split between `slots` cores."""
+    slot_size = (byte_size // slots) & ~(SLOT_ALIGNMENT - 1)
+    start = slot * slot_size
+    return start, (byte_size if slot == slots - 1 else start + slot_size)
+
+
+def _restrict_intervals(intervals, start: int, end: int, keep_start: int, keep_end: int) -> List:
+    """Remove the free parts of [start, end) outside of [keep_start, keep_end), return them as (start, size, metadata)."""
+    removed = []
+    for interval in intervals.get_intervals(custom_filter=lambda interval: interval.overlaps(start, end - start)):
+        for part_start, part_end in ((max(interval.start, start), min(interval.end, keep_start)),
+                                     (max(interval.start, keep_end), min(interval.end, end))):
+            if part_start < part_end:
+                removed.append((part_start, part_end - part_start, dict(interval.metadata)))
+    for part_start, size, _ in removed:
+        intervals.remove_region(part_start, size)
+    return removed
+
+
+def _is_cross_core(segment) -> bool:
+    return getattr(segment, "is_cross_core", False)
+
+
+@contextmanager
+def _core_partition(slot: int, slots: int):
+    """
+    Restrict the generation to the slot of a core in the cross-core resources, in every page table:
+    the free space of the cross-core DATA_PRESERVE segments, and the free VA of the cross-core pages - so the
+    physical memory the new segments of the core take there.
+    """
+    restricted = []  # (intervals, removed regions)
+    for page_table in get_page_table_manager().get_all_page_tables():
+        for segment in page_table.segment_manager.memory_segments:
+            if _is_cross_core(segment) and segment.interval_tracker is not None and segment.address is not None:
+                keep_start, keep_end = _slot_range(segment.byte_size, slot, slots)
+                restricted.append((segment.interval_tracker,
+                                   _restrict_intervals(segment.interval_tracker, segment.address, segment.address + segment.byte_size,
+                                                       segment.address + keep_start, segment.address + keep_end)))
+        for page in page_table.get_pages():
+            if page.is_cross_core:
+                keep_start, keep_end = _slot_range(page.size, slot, slots)
+                restricted.append((page_table.non_allocated_va_intervals,
+                                   _restrict_intervals(page_table.non_allocated_va_intervals, page.va, page.va + page.size,
+                                                       page.va + keep_start, page.va + keep_end)))
+    try:
+        yield
+    finally:
+        for intervals, removed in reversed(restricted):
+            for start, size, metadata in removed:
+                intervals.add_region(start, size, metadata)
+
+
+def generate_core_body(core: str, max_scenario: int) -> None:
+    from Arrow.Tool.stages.test_stage.test_body import do_scenario
+    with SwitchState(core):
+        for current_scenario in range(1, max_scenario + 1):
+            do_scenario(current_scenario, max_scenario)
+
+
+def _generate_core(slot: int, core: str, max_scenario: int, id_bases: List[int], slots: Optional[int]) -> None:
+    """Generate the body of a core, restricted to its slot of the cross-core resources unless slots is None."""
+    reseed(derive_seed(get_config_manager().get_value('Seed'), core, "body"))
+    _set_id_counters(id_bases, slot)
+    if slots is None:
+        generate_core_body(core, max_scenario)
+    else:
+        with _core_partition(slot, slots):
+            generate_core_body(core, max_scenario)
+    _check_id_counters(id_bases, slot, core)
+
+
+def _shared_fingerprint(core: str) -> List:
+    """Everything a core body must not change for its worker result to be mergeable."""
+    page_table_manager = get_page_table_manager()
+    own_page_tables = {page_table.page_table_name for page_table in page_table_manager.get_core_page_tables(core)}
+    fingerprint = []
+    for page_table in page_table_manager.get_all_page_tables():
+        if page_table.page_table_name in own_page_tables:
+            continue
+        segments = page_table.segment_manager.memory_segments
+        fingerprint.append((page_table.page_table_name, len(segments)))
+        # the cross-core segments get the memory allocated in the slot of the core, see _build_core_delta
+        fingerprint.extend((segment.name,
+                            len(getattr(segment, "asm_units_list", ())),
+                            len(getattr(segment, "data_units_list", ())),
+                            len(getattr(segment, "memory_block_list", ())),
+                            len(segment.interval_tracker.intervals) if getattr(segment, "interval_tracker", None) else 0)
+                           for segment in segments if not _is_cross_core(segment))
+    fingerprint.append(tuple(len(intervals.intervals) for intervals in (page_table_manager.unmapped_pa_intervals,
+                                                                         page_table_manager.mapped_pa_intervals)))
+    fingerprint.append(tuple(interval.to_tuple() for interval in page_table_manager.allocated_pa_intervals.get_intervals()
+                             if interval.metadata.get("page_table") not in own_page_tables))
+    state_id = get_state_manager().states_dict[core].state_id
+    fingerprint.append(tuple((barrier.name, tuple(sorted(set(barrier.get_all_registered_cores()) - {state_id})))
+                             for barrier in get_barrier_manager().get_all_barriers()
+                             if set(barrier.get_all_registered_cores()) - {state_id}))
+    fingerprint.append(get_state_manager().states_dict[core].register_manager.reserved_mask)
+    random_streams = get_random_streams()
+    fingerprint.extend(random_streams.get_core_states(other_core) for other_core in [None, *get_state_manager().states_dict] if other_core != core)
+    return fingerprint
+
+
+def _registered_barriers(core: str) -> set:
+    state_id = get_state_manager().states_dict[core].state_id
+    return {barrier.name for barrier in get_barrier_manager().get_all_barriers() if barrier.is_core_registered(state_id)}
+
+
+def _build_core_delta(core: str, snapshot_ids: set, statistics_before: Dict, barriers_before: set) -> Dict:
+    page_table_manager = get_page_table_manager()
+    page_tables = []
+    segments = []
+    new_asm_units = []
+    pa_allocations = []
+    for page_table in page_table_manager.get_core_page_tables(core):
+        segment_manager = page_table.segment_manager
+        page_tables.append((page_table,
+                            {"allocated_va_intervals": copy.deepcopy(page_table.allocated_va_intervals),
+                             "non_allocated_va_intervals": copy.deepcopy(page_table.non_allocated_va_intervals),
+                             "allocations": list(page_table.allocations)},
+                            {"memory_segments": list(segment_manager.memory_segments),
+                             "pool_type_mapping": {memory_type: list(pool) for memory_type, pool in segment_manager.pool_type_mapping.items()},
+                             "_segments_by_name": dict(segment_manager._segments_by_name)}))
+        # physical memory taken by the new segments, with the metadata allocate_segment gave it
+        for allocation in page_table.allocations:
+            if id(allocation) not in snapshot_ids:
+                interval = page_table_manager.allocated_pa_intervals.get_intervals(
+                    custom_filter=lambda interval: interval.contains(allocation.pa_start, allocation.size))[0]
+                pa_allocations.append((allocation.pa_start, allocation.size, dict(interval.metadata)))
+
+        for segment in segment_manager.memory_segments:
+            if _is_cross_core(segment):
+                continue
+            unit_lists = {attr_name: list(getattr(segment, attr_name))
+                          for attr_name in ("asm_units_list", "data_units_list", "memory_block_list")
+                          if hasattr(segment, attr_name)}
+            new_asm_units.extend(asm_unit for asm_unit in unit_lists.get("asm_units_list", ())
+                                 if id(asm_unit) not in snapshot_ids)
+            interval_tracker = copy.deepcopy(getattr(segment, "interval_tracker", None))
+            segments.append((segment, unit_lists, interval_tracker))
+
+    # the memory allocated in the slot of the core, in the cross-core segments of every page table
+    cross_core_units = []
+    for page_table in page_table_manager.get_all_page_tables():
+        for segment in page_table.segment_manager.memory_segments:
+            if _is_cross_core(segment):
+                new_data_units = [data_unit for data_unit in segment.data_units_list if id(data_unit) not in snapshot_ids]
+                new_memory_blocks = [memory_block for memory_block in segment.memory_block_list if id(memory_block) not in snapshot_ids]
+                if new_data_units or new_memory_blocks:
+                    cross_core_units.append((segment, new_data_units, new_memory_blocks))
+
+    barriers = get_barrier_manager().barriers
+    state = get_state_manager().states_dict[core]
+    state_attributes = {attr_name: (dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value)
+                        for attr_name, value in vars(state).items()}
+
+    statistics_after = get_statistics_manager().all()
+    return {
+        "page_tables": page_tables,
+        "segments": segments,
+        "cross_core_units": cross_core_units,
+        "pa_allocations": pa_allocations,
+        "new_barriers": [(name, barrier) for name, barrier in barriers.items() if id(barrier) not in snapshot_ids],
+        "barrier_registrations": [name for name in sorted(_registered_barriers(core) - barriers_before)
+                                  if id(barriers[name]) in snapshot_ids],
+        "new_asm_units": new_asm_units,
+        "provenance_table": list(get_source_context_tracker().provenance_table),
+        "state": state_attributes,
+        "random_streams": get_random_streams().get_core_states(core),
+        "statistics": {key: value - statistics_before.get(key, 0) for key, value in statistics_after.items()
+                       if value != statistics_before.get(key, 0)},
+    }
+
+
+class _DeltaPickler(pickle.Pickler):
+    # objects that existed when the worker was forked are sent as references to the parent's objects
+    def __init__(self, file, snapshot_ids: set):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.snapshot_ids = snapshot_ids
+
+    def persistent_id(self, obj):
+        return id(obj) if id(obj) in self.snapshot_ids else None
+
+
+class _DeltaUnpickler(pickle.Unpickler):
+    def __init__(self, file, objects_by_id: Dict):
+        super().__init__(file)
+        self.objects_by_id = objects_by_id
+
+    def persistent_load(self, pid):
+        return self.objects_by_id[pid]
+
+
+def _reset_database_connections() -> None:
+    # a forked worker must not share the parent's sqlite connection, peewee reconnects on the next query
+    from Arrow.Utils.singleton_management import SingletonManager
+    model_cache = SingletonManager.get("model_cache_instance", default=None) or {}
+    for models in model_cache.values():
+        for model in (models.values() if isinstance(models, dict) else [models]):
+            model._meta.database._state.reset()
+
+
+def _core_worker(slot: int, core: str, max_scenario: int, id_bases: List[int], slots: int, snapshot_ids: set, result_path: str) -> None:
+    """Runs in the forked process, writes (status, payload, created barrier names) into result_path and exits."""
+    try:
+        _reset_database_connections()
+        fingerprint = _shared_fingerprint(core)
+        statistics_before = dict(get_statistics_manager().all())
+        barriers_before = _registered_barriers(core)
+        _generate_core(slot, core, max_scenario, id_bases, slots)
+        created_barriers = [name for name, barrier in get_barrier_manager().barriers.items() if id(barrier) not in snapshot_ids]
+        if _shared_fingerprint(core) != fingerprint:
+            result = ("shared", f"{core} body changed state shared with other cores", created_barriers)
+        else:
+            delta = _build_core_delta(core, snapshot_ids, statistics_before, barriers_before)
+            buffer = io.BytesIO()
+            try:
+                _DeltaPickler(buffer, snapshot_ids).dump(delta)
+                result = ("ok", buffer.getvalue(), created_barriers)
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                result = ("shared", f"{core} body can't be sent back to the main process: {e}", created_barriers)
+        payload = pickle.dumps(result)
+    except BaseException:
+        payload = pickle.dumps(("error", traceback.format_exc(), []))
+
+    with open(result_path, "wb") as result_file:
+        result_file.write(payload)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    logging.shutdown()
+    os._exit(0)
+
+
+def _run_forked_cores(cores: List[str], per_core_scenario_count: Dict, id_bases: List[int], workers: int) -> Dict:
+    """
+    Generate the given cores, each in a forked worker, return the (status, payload, created barrier names, objects by id)
+    of each core - the objects that existed at fork time, that the payload refers to.
+    A worker that exits without a readable result counts as a failed ("error") worker.
+    """
+    # the snapshot keeps every object alive, in the workers too, so their ids can't be reused by new objects
+    snapshot = gc.get_objects()
+    snapshot_ids = set(map(id, snapshot))
+    all_cores = list(per_core_scenario_count)
+    slots = len(all_cores)
+
+    pending = list(cores)
+    running = []  # (pid, core, result_path), in fork order
+    results = {}
+    try:
+        while pending or running:
+            while pending and len(running) < workers:
+                core = pending.pop(0)
+                result_fd, result_path = tempfile.mkstemp(prefix=f"arrow_body_{core}_", suffix=".pkl")
+                os.close(result_fd)
+                sys.stdout.flush()
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:
+                    _core_worker(all_cores.index(core), core, per_core_scenario_count[core][1], id_bases, slots,
+                                 snapshot_ids, result_path)
+                running.append((pid, core, result_path))
+
+            pid, core, result_path = running.pop(0)
+            _, status = os.waitpid(pid, 0)
+            with open(result_path, "rb") as result_file:
+                payload = result_file.read()
+            os.remove(result_path)
+            try:
+                results[core] = pickle.loads(payload)
+            except Exception as e:
+                results[core] = ("error", f"body worker of {core} exited without a result ({e!r}), wait status {status}", [])
+    finally:
+        for pid, _, result_path in running:
+            os.waitpid(pid, 0)
+            os.remove(result_path)
+
+    objects_by_id = {id(obj): obj for obj in snapshot}
+    return {core: (*result, objects_by_id) for core, result in results.items()}
+
+
+def _merge_core_delta(core: str, delta: Dict) -> None:
+    page_table_manager = get_page_table_manager()
+    for page_table, page_table_attributes, segment_manager_attributes in delta["page_tables"]:
+        vars(page_table).update(page_table_attributes)
+        vars(page_table.segment_manager).update(segment_manager_attributes)
+        page_table.segment_manager._segment_views.clear()
+    for pa_start, size, metadata in delta["pa_allocations"]:
+        page_table_manager.allocated_pa_intervals.add_region(pa_start, size, metadata)
+        page_table_manager.non_allocated_pa_intervals.remove_region(pa_start, size)
+
+    segment_managers = [page_table.segment_manager for page_table, _, _ in delta["page_tables"]]
+    for segment, unit_lists, interval_tracker in delta["segments"]:
+        for attr_name, units in unit_lists.items():
+            getattr(segment, attr_name)[:] = units
+        if interval_tracker is not None:
+            segment.interval_tracker = interval_tracker
+    for segment_manager in segment_managers:
+        segment_manager.shared_block_index.rebuild()
+
+    for segment, new_data_units, new_memory_blocks in delta["cross_core_units"]:
+        segment.data_units_list.extend(new_data_units)
+        segment.memory_block_list.extend(new_memory_blocks)
+        for data_unit in new_data_units:
+            if data_unit.address is not None:
+                segment.interval_tracker.remove_region(data_unit.address, data_unit.byte_size)
+
+    barrier_manager = get_barrier_manager()
+    for name, barrier in delta["new_barriers"]:
+        barrier_manager.barriers[name] = barrier
+    state_id = get_state_manager().states_dict[core].state_id
+    for name in delta["barrier_registrations"]:
+        barrier_manager.barriers[name].register_core(state_id)
+
+    # provenance ids of the new instructions point into the worker's table
+    source_context_tracker = get_source_context_tracker()
+    worker_provenance_table = delta["provenance_table"]
+    for asm_unit in delta["new_asm_units"]:
+        asm_unit.provenance_id = source_context_tracker.intern_context(worker_provenance_table[asm_unit.provenance_id])
+
+    vars(get_state_manager().states_dict[core]).update(delta["state"])
+    get_random_streams().set_core_states(delta["random_streams"])
+
+    statistics_manager = get_statistics_manager()
+    for key, amount in delta["statistics"].items():
+        statistics_manager.increment(key, amount)
+
+
+def _forked_body(per_core_scenario_count: Dict, id_bases: List[int], workers: int) -> Tuple[List[str], Optional[int]]:
+    """
+    Generate the cores in forked workers and merge them, in core order.
+    Return the cores left to generate in-process and the slots to generate them with (None for no slots).
+    """
+    logger = get_logger()
+    cores = list(per_core_scenario_count)
+    barriers = get_barrier_manager().barriers
+    results = {}
+    to_run = cores
+    merged = 0
+    while merged < len(cores):
+        results.update(_run_forked_cores(to_run, per_core_scenario_count, id_bases, workers))
+        for core in to_run:
+            status, payload, _, _ = results[core]
+            if status == "error":
+                logger.warning(f"BODY:: body worker of {core} failed, generating the body in-process without the per-core slots:\n{payload}")
+                return cores[merged:], None
+        for core in to_run:
+            status, payload, _, _ = results[core]
+            if status == "shared":
+                logger.info(f"BODY:: {payload}, generating the body in-process")
+                return cores[merged:], len(cores)
+
+        # a core that created a barrier an earlier core created first must only register to it, as in-process
+        while merged < len(cores):
+            core = cores[merged]
+            _, payload, created_barriers, objects_by_id = results[core]
+            if any(name in barriers for name in created_barriers):
+                break
+            try:
+                delta = _DeltaUnpickler(io.BytesIO(payload), objects_by_id).load()
+            except Exception as e:
+                logger.warning(f"BODY:: {core} body can't be read back from its worker ({e!r}), generating the body in-process")
+                return cores[merged:], len(cores)
+            _merge_core_delta(core, delta)
+            logger.info(f"BODY:: merged {core} body from its worker")
+            merged += 1
+
+        to_run = [core for core in cores[merged:] if any(name in barriers for name in results[core][2])]
+        if to_run:
+            logger.info(f"BODY:: {to_run} created barriers an earlier core created first, generating them again")
+    return [], len(cores)
+
+
+def do_parallel_body(per_core_scenario_count: Dict, workers: int) -> None:
+    """
+    Generate the scenarios of every core, per core, in up to `workers` forked processes.
+    per_core_scenario_count maps each core to its (first, max) scenario numbers.
+    """
+    id_bases = _get_id_counters()
+    # the rest of the test continues on its own ids, whichever way the body was generated
+    post_body_ids = [base + len(per_core_scenario_count) * ID_STRIDE for base in id_bases]
+
+    if hasattr(os, "fork"):
+        in_process_cores, slots = _forked_body(per_core_scenario_count, id_bases, workers)
+    else:
+        in_process_cores, slots = list(per_core_scenario_count), len(per_core_scenario_count)
+
+    for slot, (core, (_, max_scenario)) in enumerate(per_core_scenario_count.items()):
+        if core in in_process_cores:
+            _generate_core(slot, core, max_scenario, id_bases, slots)
+
+    _restore_id_counters(post_body_ids)
+    reseed(derive_seed(get_config_manager().get_value('Seed'), "post_body"))
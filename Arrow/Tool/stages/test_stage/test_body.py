@@ -1,6 +1,6 @@
 from typing import Optional
 from Arrow.Utils.logger_management import get_logger
-from Arrow.Utils.configuration_management import Configuration
+from Arrow.Utils.configuration_management import Configuration, get_config_manager
 from Arrow.Tool.state_management import get_state_manager, get_current_state
 from Arrow.Tool.state_management.switch_state import SwitchState
 from Arrow.Tool.scenario_management import ScenarioWrapper, get_scenario_manager
@@ -8,6 +8,7 @@ from Arrow.Tool.asm_libraries.asm_logger import AsmLogger
 from Arrow.Utils.APIs import choice
 from Arrow.Tool.asm_libraries.branch_to_segment import branch_to_segment
 from Arrow.Utils.statistics_managment import get_statistics_manager
+from Arrow.Utils.profiler_management import get_profiler
 
 
 def execute_scenario(scenario_instance):
@@ -21,19 +22,18 @@ def execute_scenario(scenario_instance):
     statistics_manager.increment("scenario_count")
 
     current_state = get_current_state()
-    pre_scenario_reserved_registers = current_state.register_manager.get_used_registers()
-
-    scenario_instance.func()  # Call the wrapped function
-
-    post_scenario_reserved_registers = current_state.register_manager.get_used_registers()
-        
-    if pre_scenario_reserved_registers != post_scenario_reserved_registers:
-        # find the difference between the two lists
-        pre_set = set(pre_scenario_reserved_registers)
-        post_set = set(post_scenario_reserved_registers)
-        # Changed to post_set - pre_set to find registers that were added but not freed
-        difference = post_set - pre_set
-                
+    register_manager = current_state.register_manager
+    pre_scenario_reserved_mask = register_manager.reserved_mask
+
+    with get_profiler().section(f"scenario {scenario_instance}", "scenario", state=current_state.state_name):
+        scenario_instance.func()  # Call the wrapped function
+
+    post_scenario_reserved_mask = register_manager.reserved_mask
+
+    if pre_scenario_reserved_mask != post_scenario_reserved_mask:
+        # find registers that were added but not freed
+        difference = register_manager.get_registers_of_mask(post_scenario_reserved_mask & ~pre_scenario_reserved_mask)
+
         raise ValueError(f"Error: Scenario {scenario_instance} has reserved registers that were not freed: {[str(reg) for reg in difference]}")
 
 
@@ -83,19 +83,26 @@ def do_body():
             AsmLogger.comment(f"========================= core {core} - TEST BODY - start =====================")
 
     state_manager.set_active_state("core_0")
-    available_cores = list(available_states.keys())
-    while available_cores:
-        # go over each of the cores, execute scenarios as long as there is what to execute
-        # once a certain core reach out its max scenario count, he will be removed from the list
-
-        # Iterate over a copy of the list to avoid modifying the list during iteration
-        for core in available_cores[:]:  # Create a shallow copy of the list
-            with SwitchState(core):
-                current_scenario, max_scenario = per_core_scenario_count.get(core)
-                per_core_scenario_count[core] = (current_scenario + 1, max_scenario)
-                if current_scenario == max_scenario:
-                    available_cores.remove(core)
-                do_scenario(current_scenario, max_scenario)
+    config_manager = get_config_manager()
+    body_workers = config_manager.get_value('Body_workers') if config_manager.is_exist('Body_workers') else 0
+    if body_workers:
+        # per-core bodies, generated in parallel worker processes
+        from Arrow.Tool.stages.test_stage.parallel_body import do_parallel_body
+        do_parallel_body(per_core_scenario_count, body_workers)
+    else:
+        available_cores = list(available_states.keys())
+        while available_cores:
+            # go over each of the cores, execute scenarios as long as there is what to execute
+            # once a certain core reach out its max scenario count, he will be removed from the list
+
+            # Iterate over a copy of the list to avoid modifying the list during iteration
+            for core in available_cores[:]:  # Create a shallow copy of the list
+                with SwitchState(core):
+                    current_scenario, max_scenario = per_core_scenario_count.get(core)
+                    per_core_scenario_count[core] = (current_scenario + 1, max_scenario)
+                    if current_scenario == max_scenario:
+                        available_cores.remove(core)
+                    do_scenario(current_scenario, max_scenario)
 
     available_cores = list(available_states.keys())
     for core in available_cores:
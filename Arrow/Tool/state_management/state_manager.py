@@ -5,6 +5,7 @@ from Arrow.Tool.memory_management.memlayout.segment import MemorySegment
 #from Arrow.Tool.memory_management.page_manager import MMU
 from Arrow.Tool.memory_management.memlayout.page_table import PageTable
 from Arrow.Utils.configuration_management import Configuration
+from Arrow.Utils.seed_management import get_random_streams
 from abc import ABC, abstractmethod
 from typing import Optional, Union
 
@@ -171,6 +172,7 @@ class State_manager:
         if state_id not in self.states_dict:
             raise ValueError(f"State with ID {state_id} does not exist.")
         self.active_state_id = state_id
+        get_random_streams().set_active_core(state_id)
         return self.states_dict[state_id]
 
     def get_active_state(self) -> State:
@@ -196,6 +198,7 @@ class State_manager:
         """
         self.states_dict.clear()
         self.active_state_id = None
+        get_random_streams().set_active_core(None)
 
     def is_active_state(self, state_id: str) -> bool:
         """
@@ -1,4 +1,4 @@
-import random
+from Arrow.Utils.seed_management import rng
 import inspect
 from typing import Union, Dict, Any, Tuple
 from Arrow.Utils.singleton_management import SingletonManager
@@ -36,7 +36,7 @@ class AdaptiveChoiceManager:
                 if isinstance(weight, tuple) and len(weight) == 2:  # Weight range
                     # Ensure the range is valid
                     lower, upper = sorted(weight)  # Sort the range to ensure lower <= upper
-                    weights.append(random.randint(lower, upper))
+                    weights.append(rng("choice").randint(lower, upper))
                     #weights.append(random.randint(weight[0], weight[1]))
                 elif isinstance(weight, int):  # Fixed weight
                     weights.append(weight)
@@ -54,7 +54,7 @@ class AdaptiveChoiceManager:
 
         # Retrieve the stored distribution and make a choice
         elements, weights = self.contexts[caller_info]
-        return random.choices(elements, weights=weights, k=1)[0]
+        return rng("choice").choices(elements, weights=weights, k=1)[0]
 
 
 # Factory function to retrieve the AdaptiveChoiceManager instance
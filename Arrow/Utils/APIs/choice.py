@@ -1,8 +1,8 @@
-import random
-from typing import Union, List, Dict, Any, Optional
+from Arrow.Utils.seed_management import rng
+from typing import Union, List, Dict, Any, Optional, Tuple
 
 def choice(
-        values: Union[Dict[Any, int], List[Any]],
+        values: Union[Dict[Any, int], List[Any], Tuple[Any, ...]],
         name: Optional[str] = None,
 ) -> Any:
     """
@@ -11,9 +11,9 @@ def choice(
 
     Args:
         name (str): The name of the choice.
-        values (Union[Dict[Any, int], List[Any]]):
+        values (Union[Dict[Any, int], List[Any], Tuple[Any, ...]]):
             - If a dict is provided, the keys are the values and the values are the weights.
-            - If a list is provided, uniform random selection is performed.
+            - If a list or tuple is provided, uniform random selection is performed.
 
     Returns:
         Any: The randomly selected value.
@@ -22,13 +22,13 @@ def choice(
     if isinstance(values, dict):
         elements = list(values.keys())  # Extract the elements
         weights = list(values.values())  # Extract the weights
-        return random.choices(elements, weights=weights, k=1)[0]
+        return rng("choice").choices(elements, weights=weights, k=1)[0]
 
-    # If values is a list (uniform list), use random.choice
-    elif isinstance(values, list):
-        return random.choice(values)
+    # If values is a list or tuple (uniform list), use random.choice
+    elif isinstance(values, (list, tuple)):
+        return rng("choice").choice(values)
 
     # If neither a list nor a dictionary, raise a ValueError
     else:
-        raise ValueError("Input must be either a list or a dictionary")
+        raise ValueError("Input must be either a list, a tuple or a dictionary")
 
@@ -1,4 +1,4 @@
-import numpy as np
+from Arrow.Utils.seed_management import numpy_rng
 
 def rangeWithPeak(start:int, end:int, peak:int, peak_width='normal'):
     # Standard deviation (spread) for each width type
@@ -19,7 +19,7 @@ def rangeWithPeak(start:int, end:int, peak:int, peak_width='normal'):
 
     while True:
         # Generate a candidate value from a normal distribution centered at the peak
-        candidate = int(np.random.normal(peak, std_dev))
+        candidate = int(numpy_rng("choice").normal(peak, std_dev))
         #candidate = int(random.normalvariate(peak, std_dev))
 
         # Return only if the candidate is within the start and end range
@@ -0,0 +1,120 @@
+from Arrow.Utils.seed_management import rng
+from typing import Any, Dict, Hashable, List, Optional, Union
+from Arrow.Utils.configuration_management import Configuration
+
+
+class WeightedSampler:
+    """
+    Precomputed weighted random selection over a fixed set of items.
+
+    A Vose alias table is built once (O(n)), so every draw is O(1): one uniform number picks a column, and its
+    fraction picks between the column's item and its alias. Draws come from the `subsystem` stream of the active core
+    (see rng), so the selections of a sampler don't shift with the other random choices of the core.
+    """
+
+    def __init__(self, weighted_items: Dict[Any, float], subsystem: Hashable = "choice"):
+        if not weighted_items:
+            raise ValueError("WeightedSampler requires at least one weighted item")
+        self.items: List[Any] = list(weighted_items.keys())
+        self.subsystem = subsystem
+
+        total_weight = sum(weighted_items.values())
+        if total_weight <= 0:
+            raise ValueError("WeightedSampler requires a positive total weight")
+        size = len(self.items)
+        scaled = [weight * size / total_weight for weight in weighted_items.values()]
+        self.probabilities: List[float] = [1.0] * size
+        self.aliases: List[int] = list(range(size))
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        # leftovers are 1.0 up to rounding, they keep their own item
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, k: int = 1) -> List[Any]:
+        """Draw k items, with replacement."""
+        stream = rng(self.subsystem)
+        size = len(self.items)
+        samples = []
+        for _ in range(k):
+            column, fraction = divmod(stream.random() * size, 1.0)
+            column = int(column)
+            samples.append(self.items[column if fraction < self.probabilities[column] else self.aliases[column]])
+        return samples
+
+    def choice(self) -> Any:
+        return self.sample(1)[0]
+
+
+def normalize_tags(tags: Optional[Union[Dict[Configuration.Tag, int], List[Configuration.Tag]]]) -> Dict[Any, float]:
+    """
+    Convert a tag query into a {tag: weight} dict.
+    If no tags are provided, treat it as 100% REST tag, a list of tags gets uniform weights.
+    """
+    if tags is None:
+        # If no tags provided, default to 100% REST
+        return {Configuration.Tag.REST: 100}
+    elif isinstance(tags, list):
+        # If tags is a list, convert to dict with uniform weights
+        uniform_weight = 100 / len(tags) if tags else 0  # Avoid division by zero
+        return {tag: uniform_weight for tag in tags}
+    elif isinstance(tags, dict):
+        # list is of the correct instance, do nothing
+        return tags
+    else:
+        # list is at an invalid type
+        raise TypeError(f"Expected 'tags' to be a dictionary or List, but got {type(tags).__name__}")
+
+
+def get_tags_cache_key(tags: Dict[Any, float]) -> Optional[Hashable]:
+    """Hashable form of a normalized tag query (order preserving), or None if it can't be hashed."""
+    key = tuple(tags.items())
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_tag_weights(candidates: List[Any], tags: Dict[Any, float]) -> Dict[Any, float]:
+    """
+    Calculate the combined priority x tag weight of each candidate (scenario or ingredient).
+
+    Calculate Combined Weights:
+    For each object, calculate a weight based on both its priority and the requested tag distribution.
+    This combined weight can be the product of the object's priority and the distribution weight for each tag it has.
+    "Direct" candidates (requested by name in the tags) get their requested portion of the overall weight.
+
+    Returns:
+        dict: candidate -> weight, only for candidates with a positive weight.
+    """
+    # Step 1: Calculate combined weights for each object
+    weighted_objects_dict = {}
+    total_weight = 0
+    for candidate in candidates:
+        # calculate based on tags sum
+        tag_weights = sum(tags.get(tag, 0) for tag in candidate.tags)
+        combined_weight = Configuration.PRIORITY_WEIGHTS[candidate.priority] * tag_weights
+
+        # Only add to the list if combined_weight > 0
+        if combined_weight > 0:
+            total_weight += combined_weight
+            weighted_objects_dict[candidate] = combined_weight
+
+    # Step 2: handle "direct" candidates, calculate their weight and add to dict
+    for candidate in candidates:
+        if str(candidate) in tags.keys():
+            # calculate relative weight
+            direct_portion = tags[str(candidate)] / sum(tags.values())
+            all_other_portion = 1 - direct_portion
+            overall_weight = total_weight / all_other_portion
+            weighted_objects_dict[candidate] = overall_weight * direct_portion
+
+    return weighted_objects_dict
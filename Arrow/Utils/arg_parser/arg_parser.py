@@ -57,6 +57,15 @@ def parse_arguments(input_args=None):
     parser.add_argument('--create_binary', choices=['True', 'False'],
                         help="Continue with binary creation or stop at generation stage, ('True', 'False').")
 
+    parser.add_argument('--incbin_data', choices=['True', 'False'],
+                        help="Write the random payload of shared data segments to side .bin files referenced by .incbin, instead of .quad lines, ('True', 'False').")
+
+    parser.add_argument('--binary_dump', choices=['True', 'False'],
+                        help="Write generation_dump.bin, a compact columnar dump of the segments, units, provenance and data payloads of the test, ('True', 'False').")
+
+    parser.add_argument('--json_dump', choices=['True', 'False'],
+                        help="Write generation.json and memory_usage.json, they can also be converted from generation_dump.bin, ('True', 'False').")
+
     parser.add_argument('--identifier', type=str, help='Identifier to use during statistics upload.')
 
     parser.add_argument('--debug_mode', choices=['True', 'False'],
@@ -65,6 +74,21 @@ def parse_arguments(input_args=None):
     parser.add_argument('--instruction_debug_prints', choices=['True', 'False'],
                         help="Run Arrow with additional debug prints checking logic, ('True', 'False').")
 
+    parser.add_argument('--source_provenance', choices=['True', 'False'],
+                        help="Track the user file and line of every generated instruction and data unit, disable for throughput runs, ('True', 'False').")
+
+    parser.add_argument('--profile', choices=['None', 'time', 'memory'],
+                        help="Write a per stage, per scenario and per API profile (profile.json, profile.folded) to the output directory, 'memory' also traces allocations, ('None', 'time', 'memory').")
+
+    parser.add_argument('--body_workers', type=int,
+                        help="Generate the test body of each core in a forked worker process, at most N at a time (0 keeps the round-robin body in the main process).")
+
+    parser.add_argument('--import_profile', choices=['True', 'False'],
+                        help="Print the import time breakdown of the run (cumulative and self time per imported module), ('True', 'False').")
+
+    parser.add_argument('--content_manifest', choices=['True', 'False'],
+                        help="Register the content scenarios and ingredients from a cached manifest and import their modules on first selection, instead of importing all the content, ('True', 'False').")
+
     parser.add_argument('--memory_debug_prints', choices=['None', 'memory_log', 'info_log'],
                         help="Run Arrow with additional debug prints checking logic, ('None', 'memory_log', 'info_log').")
 
@@ -165,6 +189,49 @@ def parse_arguments(input_args=None):
         logger.info(f"--------------- instruction_debug_prints: {instruction_debug_prints} (defaults)")
     config_manager.set_value('Instruction_debug_prints', instruction_debug_prints)
 
+    if args.source_provenance:
+        source_provenance = True if (args.source_provenance == "True") else False
+        logger.info(f"--------------- source_provenance: {source_provenance}")
+    else:
+        source_provenance = True
+        logger.info(f"--------------- source_provenance: {source_provenance} (defaults)")
+    config_manager.set_value('Source_provenance', source_provenance)
+
+    if args.profile:
+        profile = None if (args.profile == "None") else args.profile
+        logger.info(f"--------------- profile: {args.profile}")
+    else:
+        profile = None
+        logger.info(f"--------------- profile: {profile} (defaults)")
+    config_manager.set_value('Profile', profile)
+
+    if args.body_workers is not None:
+        if args.body_workers < 0:
+            raise ValueError(f"--body_workers must be >= 0, got {args.body_workers}")
+        body_workers = args.body_workers
+        logger.info(f"--------------- body_workers: {body_workers}")
+    else:
+        body_workers = 0
+        logger.info(f"--------------- body_workers: {body_workers} (defaults)")
+    config_manager.set_value('Body_workers', body_workers)
+
+    # the import profiler itself is started by main before any tool import, see import_profiler
+    if args.import_profile:
+        import_profile = True if (args.import_profile == "True") else False
+        logger.info(f"--------------- import_profile: {import_profile}")
+    else:
+        import_profile = False
+        logger.info(f"--------------- import_profile: {import_profile} (defaults)")
+    config_manager.set_value('Import_profile', import_profile)
+
+    if args.content_manifest:
+        content_manifest = True if (args.content_manifest == "True") else False
+        logger.info(f"--------------- content_manifest: {content_manifest}")
+    else:
+        content_manifest = True
+        logger.info(f"--------------- content_manifest: {content_manifest} (defaults)")
+    config_manager.set_value('Content_manifest', content_manifest)
+
     if args.memory_debug_prints:
         memory_debug_prints = None if (args.memory_debug_prints == "None") else args.memory_debug_prints
         logger.info(f"--------------- memory_debug_prints: {args.memory_debug_prints}")
@@ -179,13 +246,36 @@ def parse_arguments(input_args=None):
     else:
         create_binary = True
         logger.info(f"--------------- create_binary: {create_binary} (defaults)")
-    config_manager.set_value('Create_binary', create_binary)
-
 
     # when in 'Cloud_mode' there is no need to Continue with Binary creation unless explicitly asked for
     if args.cloud_mode == "True":
         if args.create_binary != "True":
-            config_manager.set_value('Create_binary', False)
+            create_binary = False
+    config_manager.set_value('Create_binary', create_binary)
+
+    if args.incbin_data:
+        incbin_data = True if (args.incbin_data == "True") else False
+        logger.info(f"--------------- incbin_data: {incbin_data}")
+    else:
+        incbin_data = False
+        logger.info(f"--------------- incbin_data: {incbin_data} (defaults)")
+    config_manager.set_value('Incbin_data', incbin_data)
+
+    if args.binary_dump:
+        binary_dump = True if (args.binary_dump == "True") else False
+        logger.info(f"--------------- binary_dump: {binary_dump}")
+    else:
+        binary_dump = False
+        logger.info(f"--------------- binary_dump: {binary_dump} (defaults)")
+    config_manager.set_value('Binary_dump', binary_dump)
+
+    if args.json_dump:
+        json_dump = True if (args.json_dump == "True") else False
+        logger.info(f"--------------- json_dump: {json_dump}")
+    else:
+        json_dump = True
+        logger.info(f"--------------- json_dump: {json_dump} (defaults)")
+    config_manager.set_value('Json_dump', json_dump)
 
     # Process --define arguments
     if args.define:
@@ -8,6 +8,8 @@ from Arrow.Utils.configuration_management.enums import Architecture
 def setup_chosen_architecture():
     config_manager = get_config_manager()
     architecture = config_manager.get_value('Architecture')
+    # flags are class attributes, clear leftovers of a previous run within the same process
+    Architecture.x86 = Architecture.riscv = Architecture.arm = False
     if architecture == "x86":
         Architecture.x86 = True
         Architecture.arch_str = "x86"
@@ -15,6 +15,7 @@ class Knob:
         """
         self.name = name
         self.value_func = value_func  # Function to evaluate the knob's value.
+        self.default_value_func = value_func  # Original value, restored by reset()
         self.read_only = read_only
         self.dynamic = dynamic
         self.global_knob = global_knob
@@ -55,6 +56,14 @@ class Knob:
         """Seal the knob to prevent further modifications."""
         self.sealed = True
 
+    def reset(self):
+        """Restore the knob to its default, unsealed state and register it in the current KnobManager."""
+        self.value_func = self.default_value_func
+        self.value_cache = None
+        self.sealed = False
+        knob_manager = get_knob_manager()
+        knob_manager.add_knob(self)
+
     # Implicit conversion methods
     def __bool__(self):
         return bool(self.get_value()) # Return the evaluated value as bool
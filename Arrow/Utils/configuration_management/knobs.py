@@ -17,3 +17,14 @@ class Knobs:
         data_segment_count = Knob(name='data_segment_count', value_func=lambda: random.randint(3,6), read_only=True, dynamic=False, global_knob=False)
         shared_memory_reuse = Knob(name='shared_memory_reuse', value_func=lambda: random.randint(45, 60), read_only=True, dynamic=False, global_knob=False, description="Probability to reuse shared memory, 100 mean always, default is around 50 ")
 
+
+def reset_knobs():
+    """
+    Restore all knobs to their default values and register them again in the KnobManager.
+    Knobs are created once at import time, so this is needed when rerunning the tool within the same process.
+    """
+    for knob_group in vars(Knobs).values():
+        if isinstance(knob_group, type):
+            for knob in vars(knob_group).values():
+                if isinstance(knob, Knob):
+                    knob.reset()
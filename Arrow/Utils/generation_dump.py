@@ -0,0 +1,406 @@
+import os
+import sys
+import json
+import mmap
+import struct
+import argparse
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from Arrow.Tool.asm_blocks.asm_unit import render_asm_unit
+from Arrow.Tool.asm_blocks.data_unit import render_data_unit
+
+"""
+File: generation_dump.py
+
+Description:
+Compact binary dump of a generated test (generation_dump.bin), written next to test.asm with '--binary_dump True'.
+It holds the segments, asm units, data units, provenance and data payloads of the test as little-endian columnar
+tables, so post-processing tools can memory-map it and read only what they need instead of re-parsing the text outputs.
+
+Layout (all integers little-endian, every section 8-byte aligned):
+    header      magic b"ARWGDUMP", version u32, reserved u32, directory offset u64, directory entry count u64
+    payload     shared data segment payloads and data unit init values, streamed to the file while the dump is built
+    sections    meta (json), str_offsets / str_data (deduplicated string table), provenance, segments, asm_units, data_units
+    directory   per section: name (16 bytes), offset u64, length u64
+
+Strings are referenced by their index in the string table, -1 meaning None. The asm and data unit texts of generation.json
+and memory_usage.json are not stored, they are rendered from their parts by render_asm_unit / render_data_unit of
+Arrow.Tool.asm_blocks, the ones AsmUnit and DataUnit use, so the JSON converter reproduces the JSON outputs exactly.
+
+Usage (from the project root):
+    python -m Arrow.Utils.generation_dump info <output_dir>/generation_dump.bin
+    python -m Arrow.Utils.generation_dump convert <output_dir>/generation_dump.bin --output <dir>
+"""
+
+MAGIC = b"ARWGDUMP"
+FORMAT_VERSION = 1
+DUMP_FILE_NAME = "generation_dump.bin"
+
+_HEADER = struct.Struct("<8sIIQQ")
+_ALIGNMENT = 8
+
+# segment views, the segments of each JSON output
+VIEW_SUMMARY = 1  # memory_usage.json segment_summary
+VIEW_CODE = 2  # generation.json
+VIEW_DATA = 4  # memory_usage.json segments_data_units
+
+ASM_UNIT_TYPES = ("asm_string", "generation", "comment")
+
+# data unit flags
+DATA_UNIT_HAS_ADDRESS = 1
+DATA_UNIT_HAS_ALIGNMENT = 2
+
+DIRECTORY_DTYPE = np.dtype([("name", "S16"), ("offset", "<u8"), ("length", "<u8")])
+PROVENANCE_DTYPE = np.dtype([("file", "<i4"), ("short_path", "<i4"), ("line", "<i8")])
+SEGMENT_DTYPE = np.dtype([
+    ("name", "<i4"), ("page_table", "<i4"), ("memory_type", "<i4"), ("views", "u1"),
+    ("address", "<u8"), ("pa_address", "<u8"), ("byte_size", "<u8"),
+    ("unit_start", "<u8"), ("unit_count", "<u8"), ("data_start", "<u8"), ("data_count", "<u8"),
+    ("payload_offset", "<u8"), ("payload_length", "<i8"),
+])
+ASM_UNIT_DTYPE = np.dtype([
+    ("type", "u1"), ("prefix", "<i4"), ("asm_string", "<i4"), ("mnemonic", "<i4"), ("operands", "<i4"),
+    ("comment", "<i4"), ("provenance", "<i4"),
+])
+DATA_UNIT_DTYPE = np.dtype([
+    ("name", "<i4"), ("memory_block", "<i4"), ("memory_segment", "<i4"), ("flags", "u1"),
+    ("address", "<u8"), ("pa_address", "<u8"), ("segment_offset", "<u8"), ("byte_size", "<u8"), ("alignment", "<i8"),
+    ("init_offset", "<u8"), ("init_length", "<i8"), ("provenance", "<i4"),
+])
+
+
+def _padding(length: int) -> bytes:
+    return b"\0" * (-length % _ALIGNMENT)
+
+
+class GenerationDumpWriter:
+    """
+    Builds a generation dump. Payloads are streamed to the file as they are added, the tables are written by close().
+    Segments must be added before their units, the units of a segment right after it.
+    """
+
+    def __init__(self, path: str, meta: Optional[Dict] = None):
+        self.path = path
+        self.meta = dict(meta or {})
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, 0, 0))
+        self._payload_start = self._file.tell()
+        self._payload_length = 0
+
+        self._strings: Dict[str, int] = {}
+        self._provenance: Dict[tuple, int] = {(None, None, None): 0}
+        self._segments: List[list] = []
+        self._asm_units: List[tuple] = []
+        self._data_units: List[tuple] = []
+
+    def intern(self, value) -> int:
+        """Index of str(value) in the string table, -1 for None."""
+        if value is None:
+            return -1
+        value = str(value)
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = len(self._strings)
+        return string_id
+
+    def intern_provenance(self, source_context: tuple) -> int:
+        """Index of a (file_name, shortened_path, line_number) context in the provenance table, 0 is 'no provenance'."""
+        provenance_id = self._provenance.get(source_context)
+        if provenance_id is None:
+            provenance_id = self._provenance[source_context] = len(self._provenance)
+        return provenance_id
+
+    def add_payload(self, payload) -> Tuple[int, int]:
+        """Stream payload bytes to the file, returns their (offset, length) in the payload section."""
+        offset = self._payload_length
+        length = len(payload)
+        self._file.write(payload)
+        self._payload_length += length
+        return offset, length
+
+    def add_segment(self, name: str, page_table: str, memory_type, views: int, address: int, pa_address: int,
+                    byte_size: int, payload=None) -> None:
+        payload_offset, payload_length = self.add_payload(payload) if payload is not None else (0, -1)
+        self._segments.append([
+            self.intern(name), self.intern(page_table), self.intern(memory_type), views,
+            address, pa_address, byte_size,
+            len(self._asm_units), 0, len(self._data_units), 0,
+            payload_offset, payload_length,
+        ])
+
+    def add_asm_unit(self, unit_type: str, prefix, asm_string, mnemonic, operands, comment, source_context) -> None:
+        """Add an asm unit to the last segment. prefix, asm_string, mnemonic and comment are omitted when empty."""
+        intern = self.intern
+        self._asm_units.append((
+            ASM_UNIT_TYPES.index(unit_type),
+            intern(prefix) if prefix else -1,
+            intern(asm_string) if asm_string else -1,
+            intern(mnemonic) if mnemonic else -1,
+            intern(operands),
+            intern(comment) if comment else -1,
+            self.intern_provenance(source_context),
+        ))
+        self._segments[-1][8] += 1
+
+    def add_data_unit(self, name, memory_block_id, memory_segment_id, address, pa_address, segment_offset,
+                      byte_size, alignment, init_value, source_context) -> None:
+        """Add a data unit to the last segment."""
+        flags = 0
+        if address is not None:
+            flags |= DATA_UNIT_HAS_ADDRESS
+        if alignment is not None:
+            flags |= DATA_UNIT_HAS_ALIGNMENT
+        init_offset, init_length = self.add_payload(bytes(init_value)) if init_value is not None else (0, -1)
+        self._data_units.append((
+            self.intern(name), self.intern(memory_block_id), self.intern(memory_segment_id), flags,
+            address or 0, pa_address or 0, segment_offset or 0, byte_size,
+            alignment if alignment is not None else 0,
+            init_offset, init_length,
+            self.intern_provenance(source_context),
+        ))
+        self._segments[-1][10] += 1
+
+    def _write_section(self, directory: list, name: str, data: bytes) -> None:
+        directory.append((name.encode(), self._file.tell(), len(data)))
+        self._file.write(data)
+        self._file.write(_padding(len(data)))
+
+    def close(self) -> None:
+        directory = [(b"payload", self._payload_start, self._payload_length)]
+        self._file.write(_padding(self._payload_length))
+
+        # the provenance table interns its paths, the string table is complete from here
+        provenance = np.array([(self.intern(file_name), self.intern(shortened_path),
+                                line_number if line_number is not None else -1)
+                               for file_name, shortened_path, line_number in self._provenance], dtype=PROVENANCE_DTYPE)
+        encoded_strings = [string.encode("utf-8", "surrogatepass") for string in self._strings]
+        string_offsets = np.zeros(len(encoded_strings) + 1, dtype="<u8")
+        np.cumsum([len(string) for string in encoded_strings], out=string_offsets[1:])
+
+        self.meta.update(segment_count=len(self._segments), asm_unit_count=len(self._asm_units),
+                         data_unit_count=len(self._data_units))
+        self._write_section(directory, "meta", json.dumps(self.meta).encode())
+        self._write_section(directory, "str_offsets", string_offsets.tobytes())
+        self._write_section(directory, "str_data", b"".join(encoded_strings))
+        self._write_section(directory, "provenance", provenance.tobytes())
+        self._write_section(directory, "segments", np.array([tuple(segment) for segment in self._segments],
+                                                            dtype=SEGMENT_DTYPE).tobytes())
+        self._write_section(directory, "asm_units", np.array(self._asm_units, dtype=ASM_UNIT_DTYPE).tobytes())
+        self._write_section(directory, "data_units", np.array(self._data_units, dtype=DATA_UNIT_DTYPE).tobytes())
+
+        directory_offset = self._file.tell()
+        self._file.write(np.array(directory, dtype=DIRECTORY_DTYPE).tobytes())
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, FORMAT_VERSION, 0, directory_offset, len(directory)))
+        self._file.close()
+
+
+class GenerationDump:
+    """
+    Reader of a generation dump. The file is memory-mapped and its tables are exposed as zero-copy numpy structured
+    arrays (segments, asm_units, data_units, provenance), strings are decoded on first use.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, directory_offset, directory_count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a generation dump")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported generation dump version {version} of {path}, expected {FORMAT_VERSION}")
+        self.version = version
+
+        directory = np.frombuffer(self._mmap, dtype=DIRECTORY_DTYPE, count=directory_count, offset=directory_offset)
+        self._sections = {entry["name"].decode(): (int(entry["offset"]), int(entry["length"])) for entry in directory}
+
+        self.meta = json.loads(bytes(self._section("meta")))
+        self.comment_mark = self.meta["comment_mark"]
+        self.payload = self._section("payload")
+        self._string_offsets = self._table("str_offsets", np.dtype("<u8"))
+        self._string_data = self._section("str_data")
+        self._strings: List[Optional[str]] = [None] * (len(self._string_offsets) - 1)
+        self.provenance = self._table("provenance", PROVENANCE_DTYPE)
+        self.segments = self._table("segments", SEGMENT_DTYPE)
+        self.asm_units = self._table("asm_units", ASM_UNIT_DTYPE)
+        self.data_units = self._table("data_units", DATA_UNIT_DTYPE)
+
+    def _section(self, name: str) -> memoryview:
+        offset, length = self._sections[name]
+        return memoryview(self._mmap)[offset:offset + length]
+
+    def _table(self, name: str, dtype: np.dtype) -> np.ndarray:
+        offset, length = self._sections[name]
+        return np.frombuffer(self._mmap, dtype=dtype, count=length // dtype.itemsize, offset=offset)
+
+    def close(self) -> None:
+        self.payload = self._string_data = None
+        self.provenance = self.segments = self.asm_units = self.data_units = self._string_offsets = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass  # records or payload views are still referenced by the caller, unmapped once they are released
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def string(self, string_id: int) -> Optional[str]:
+        if string_id < 0:
+            return None
+        string = self._strings[string_id]
+        if string is None:
+            start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+            string = self._strings[string_id] = str(self._string_data[start:end], "utf-8", "surrogatepass")
+        return string
+
+    def get_provenance(self, provenance_id: int) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+        """(file_name, shortened_path, line_number) of a provenance id, as in the SourceContextTracker."""
+        file_id, short_path_id, line_number = self.provenance[provenance_id].tolist()
+        return self.string(file_id), self.string(short_path_id), line_number if line_number >= 0 else None
+
+    def iter_segments(self, view: Optional[int] = None) -> Iterator[Tuple[int, np.void]]:
+        """(index, segment record) of the segments, in dump order, only those in `view` (a VIEW_* flag) if given."""
+        for index, segment in enumerate(self.segments):
+            if view is None or int(segment["views"]) & view:
+                yield index, segment
+
+    def segment_payload(self, segment_index: int) -> Optional[memoryview]:
+        """The random payload of a shared data segment, None for the other segments."""
+        segment = self.segments[segment_index]
+        if segment["payload_length"] < 0:
+            return None
+        offset = int(segment["payload_offset"])
+        return self.payload[offset:offset + int(segment["payload_length"])]
+
+    def iter_asm_units(self, segment_index: int) -> Iterator[Tuple[str, str]]:
+        """(type, asm text) of the asm units of a segment, in order."""
+        segment = self.segments[segment_index]
+        start = int(segment["unit_start"])
+        for unit in self.asm_units[start:start + int(segment["unit_count"])].tolist():
+            yield ASM_UNIT_TYPES[unit[0]], self.asm_unit_text(unit)
+
+    def asm_unit_text(self, unit) -> str:
+        _, prefix, asm_string, mnemonic, operands, comment, provenance_id = unit
+        _, shortened_path, line_number = self.get_provenance(provenance_id)
+        string = self.string
+        return render_asm_unit(string(prefix), string(asm_string), string(mnemonic), string(operands),
+                               string(comment), self.comment_mark, shortened_path, line_number)
+
+    def data_unit_init_value(self, data_unit_index: int) -> Optional[memoryview]:
+        data_unit = self.data_units[data_unit_index]
+        if data_unit["init_length"] < 0:
+            return None
+        offset = int(data_unit["init_offset"])
+        return self.payload[offset:offset + int(data_unit["init_length"])]
+
+    def iter_data_units(self, segment_index: int) -> Iterator[Dict]:
+        """The data units of a segment as dicts, in order."""
+        segment = self.segments[segment_index]
+        start = int(segment["data_start"])
+        for data_unit_index in range(start, start + int(segment["data_count"])):
+            yield self.get_data_unit(data_unit_index)
+
+    def get_data_unit(self, data_unit_index: int) -> Dict:
+        (name, memory_block, memory_segment, flags, address, pa_address, segment_offset, byte_size, alignment,
+         _, _, provenance_id) = self.data_units[data_unit_index].tolist()
+        has_address = flags & DATA_UNIT_HAS_ADDRESS
+        init_value = self.data_unit_init_value(data_unit_index)
+        file_name, shortened_path, line_number = self.get_provenance(provenance_id)
+        return {
+            "name": self.string(name),
+            "memory_block_id": self.string(memory_block),
+            "memory_segment_id": self.string(memory_segment),
+            "address": address if has_address else None,
+            "pa_address": pa_address if has_address else None,
+            "segment_offset": segment_offset if has_address else None,
+            "byte_size": byte_size,
+            "alignment": alignment if flags & DATA_UNIT_HAS_ALIGNMENT else None,
+            "init_value": bytes(init_value) if init_value is not None else None,
+            "file_name": file_name,
+            "file_name_shortened_path": shortened_path,
+            "line_number": line_number,
+        }
+
+    def to_generation_json(self) -> List[Dict]:
+        """The content of generation.json."""
+        data = []
+        for index, segment in self.iter_segments(VIEW_CODE):
+            data.append({
+                "segment_name": self.string(int(segment["name"])),
+                "segment_address": hex(int(segment["address"])),
+                "asm_units": [{unit_type: text} for unit_type, text in self.iter_asm_units(index)],
+            })
+        return data
+
+    def to_memory_usage_json(self) -> Dict:
+        """The content of memory_usage.json."""
+        output_data = {"segment_summary": [], "segments_data_units": []}
+        for _, segment in self.iter_segments(VIEW_SUMMARY):
+            output_data["segment_summary"].append({
+                "segment_name": self.string(int(segment["name"])),
+                "segment_info": f"address={hex(int(segment['address']))}, pa_address={hex(int(segment['pa_address']))}, "
+                                f"byte_size={int(segment['byte_size'])}, type={self.string(int(segment['memory_type']))}",
+            })
+        for index, segment in self.iter_segments(VIEW_DATA):
+            data_units = []
+            for data_unit in self.iter_data_units(index):
+                data_units.append({
+                    "data_unit": render_data_unit(
+                        data_unit["name"], data_unit["memory_block_id"], data_unit["memory_segment_id"],
+                        data_unit["address"], data_unit["pa_address"], data_unit["segment_offset"],
+                        data_unit["byte_size"], data_unit["alignment"], data_unit["init_value"],
+                        data_unit["file_name_shortened_path"], data_unit["line_number"]),
+                    "data_unit_address": hex(data_unit["address"]),
+                    "data_unit_pa_address": hex(data_unit["pa_address"]),
+                    "data_unit_segment_offset": hex(data_unit["segment_offset"]),
+                })
+            output_data["segments_data_units"].append({
+                "segment_name": self.string(int(segment["name"])),
+                "segment_address": hex(int(segment["address"])),
+                "segment_pa_address": hex(int(segment["pa_address"])),
+                "data_units": data_units,
+            })
+        return output_data
+
+
+def convert_to_json(dump_path: str, output_dir: str) -> List[str]:
+    """Write the generation.json and memory_usage.json of a dump to output_dir, returns their paths."""
+    os.makedirs(output_dir, exist_ok=True)
+    written = []
+    with GenerationDump(dump_path) as dump:
+        for file_name, content in (("generation.json", dump.to_generation_json()),
+                                   ("memory_usage.json", dump.to_memory_usage_json())):
+            output_file = os.path.join(output_dir, file_name)
+            with open(output_file, "w") as json_file:
+                json.dump(content, json_file, indent=4)
+            written.append(output_file)
+    return written
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description="Arrow generation dump reader")
+    parser.add_argument('command', choices=['info', 'convert'])
+    parser.add_argument('dump', type=str, help=f'Generation dump file ({DUMP_FILE_NAME} of the output directory).')
+    parser.add_argument('--output', type=str, help='Directory of the converted JSON files. Defaults to the dump directory.')
+    args = parser.parse_args(args)
+
+    if args.command == 'info':
+        with GenerationDump(args.dump) as dump:
+            print(json.dumps({"path": args.dump, "version": dump.version, **dump.meta,
+                              "payload_bytes": len(dump.payload), "string_count": len(dump._strings),
+                              "provenance_count": len(dump.provenance)}))
+        return 0
+
+    output_dir = args.output or os.path.dirname(os.path.abspath(args.dump))
+    for output_file in convert_to_json(args.dump, output_dir):
+        print(output_file)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
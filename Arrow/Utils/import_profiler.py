@@ -0,0 +1,106 @@
+import sys
+import time
+import builtins
+import threading
+import importlib.util
+from typing import Dict, List, Optional
+
+"""
+Import profiler, enabled with '--import_profile True'. Times every import statement executed by the main thread
+from the start of main (before the tool modules are loaded), and prints the import time breakdown at the end of the
+run: the total time spent in imports and the modules with the highest cumulative (including nested imports) time.
+
+Imports executed before main (interpreter startup, site packages) are not seen, `python -X importtime` covers them.
+"""
+
+REPORT_MODULE_COUNT = 30
+
+
+def import_profile_requested(argv: Optional[List[str]] = None) -> bool:
+    """
+    Whether '--import_profile True' is in the command line. Checked before the arguments are parsed, as the argument
+    parser itself is one of the modules to profile.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    for index, arg in enumerate(argv):
+        if arg == '--import_profile':
+            return index + 1 < len(argv) and argv[index + 1] == "True"
+        if arg == '--import_profile=True':
+            return True
+    return False
+
+
+class ImportProfiler:
+    def __init__(self):
+        self._original_import = None
+        self._thread_id = None
+        self._stack: List[List] = []  # [module name, child time] of the imports in progress
+        self.modules: Dict[str, Dict] = {}  # module name -> {"cumulative": s, "self": s, "imports": n}
+        self.total_seconds = 0.0
+
+    def start(self) -> None:
+        self._original_import = builtins.__import__
+        self._thread_id = threading.get_ident()
+        builtins.__import__ = self._import
+
+    def stop(self) -> None:
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original_import = self._original_import
+        if threading.get_ident() != self._thread_id:
+            return original_import(name, globals, locals, fromlist, level)
+
+        module_name = name
+        if level:
+            try:
+                package = globals.get('__package__') or globals['__name__'].rpartition('.')[0]
+                module_name = importlib.util.resolve_name('.' * level + name, package)
+            except (AttributeError, KeyError, ImportError, ValueError):
+                pass  # let the real import raise
+
+        # already loaded, nothing to time
+        module = sys.modules.get(module_name)
+        if module is not None and all(hasattr(module, attribute) for attribute in fromlist or () if attribute != '*'):
+            return original_import(name, globals, locals, fromlist, level)
+
+        recursive = any(frame[0] == module_name for frame in self._stack)  # counted once, by the outer import
+        frame = [module_name, 0.0]
+        self._stack.append(frame)
+        start_time = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            duration = time.perf_counter() - start_time
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] += duration
+            else:
+                self.total_seconds += duration
+            stats = self.modules.get(module_name)
+            if stats is None:
+                stats = self.modules[module_name] = {"cumulative": 0.0, "self": 0.0, "imports": 0}
+            if not recursive:
+                stats["cumulative"] += duration
+            stats["self"] += duration - frame[1]
+            stats["imports"] += 1
+
+    def get_report_lines(self, module_count: int = REPORT_MODULE_COUNT) -> List[str]:
+        lines = [f"---- Import profile: {self.total_seconds * 1000:.1f} ms in imports, {len(self.modules)} modules, "
+                 f"top {module_count} by cumulative time"]
+        lines.append(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        ordered = sorted(self.modules.items(), key=lambda item: -item[1]["cumulative"])
+        for module_name, stats in ordered[:module_count]:
+            lines.append(f"{stats['cumulative'] * 1000:>14.2f} {stats['self'] * 1000:>9.2f}  {module_name}")
+        return lines
+
+
+def start_import_profiler(argv: Optional[List[str]] = None) -> Optional[ImportProfiler]:
+    """Start an ImportProfiler if '--import_profile True' was requested, returns None otherwise."""
+    if not import_profile_requested(argv):
+        return None
+    import_profiler = ImportProfiler()
+    import_profiler.start()
+    return import_profiler
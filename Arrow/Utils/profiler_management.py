@@ -0,0 +1,235 @@
+import os
+import json
+import time
+import functools
+import tracemalloc
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+from Arrow.Utils.singleton_management import SingletonManager
+
+"""
+Generation profiler, enabled with '--profile time' (wall time) or '--profile memory' (wall time and tracemalloc
+allocations, slower). Records every stage of main, every scenario execution and every public API call (and the
+`with` body of the context manager APIs, e.g. "AR.Loop body") as nested frames, under a "main" root frame, and
+writes at the end of the run:
+    profile.json   - per stage, per scenario execution and per API (calls, total/self/max time, allocations) report
+    profile.folded - collapsed stacks ("main;test_stage;scenario random_instructions;AR.generate <self us>"),
+                     to be rendered by flamegraph.pl or speedscope
+"""
+
+_NULL_SECTION = nullcontext()
+
+
+class _Frame:
+    __slots__ = ("name", "category", "attributes", "path", "start_time", "child_time", "start_memory", "peak_memory")
+
+    def __init__(self, name: str, category: str, attributes: Dict, path: str, start_memory: int):
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.path = path
+        self.child_time = 0.0
+        self.start_memory = start_memory
+        self.peak_memory = start_memory
+        self.start_time = time.perf_counter()
+
+
+class _ProfiledSection:
+    __slots__ = ("profiler", "name", "category", "attributes")
+
+    def __init__(self, profiler, name: str, category: str, attributes: Dict):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+
+    def __enter__(self):
+        self.profiler.push(self.name, self.category, self.attributes)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler.pop()
+        return False
+
+
+class _ProfiledContext:
+    """
+    Context manager returned by a profiled API (e.g. AR.Loop), profiling its `with` body as a "<api> body" frame.
+    Other attributes are forwarded to the wrapped object.
+    """
+    __slots__ = ("profiler", "name", "context")
+
+    def __init__(self, profiler, name: str, context):
+        self.profiler = profiler
+        self.name = name
+        self.context = context
+
+    def __enter__(self):
+        self.profiler.push(self.name, "api")
+        try:
+            return self.context.__enter__()
+        except BaseException:
+            self.profiler.pop()
+            raise
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            return self.context.__exit__(exc_type, exc_value, traceback)
+        finally:
+            self.profiler.pop()
+
+    def __getattr__(self, name):
+        return getattr(self.context, name)
+
+
+class GenerationProfiler:
+    MODES = ("time", "memory")
+
+    def __init__(self, mode: Optional[str] = None):
+        if mode is not None and mode not in self.MODES:
+            raise ValueError(f"Unknown profile mode '{mode}', expected one of {self.MODES}")
+        self.mode = mode
+        self.enabled = mode is not None
+        self.trace_memory = mode == "memory"
+        self._started_tracemalloc = False
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+        self._stack: List[_Frame] = []
+        self.records = {"stage": [], "scenario": []}  # every execution, in order
+        self.api_stats: Dict[str, Dict] = {}          # aggregated per API name
+        self.folded_stacks: Dict[str, float] = {}     # stack path -> self time
+        self.start_time = time.perf_counter()
+
+    def section(self, name: str, category: str = "section", **attributes):
+        """Context manager profiling the enclosed code as a `category` frame, a no-op when profiling is disabled."""
+        if not self.enabled:
+            return _NULL_SECTION
+        return _ProfiledSection(self, name, category, attributes)
+
+    def _current_memory(self) -> int:
+        if not self.trace_memory:
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            parent = self._stack[-1]
+            parent.peak_memory = max(parent.peak_memory, peak)
+        tracemalloc.reset_peak()
+        return current
+
+    def push(self, name: str, category: str, attributes: Optional[Dict] = None) -> None:
+        path = f"{self._stack[-1].path};{name}" if self._stack else name
+        self._stack.append(_Frame(name, category, attributes or {}, path, self._current_memory()))
+
+    def pop(self) -> None:
+        frame = self._stack.pop()
+        duration = time.perf_counter() - frame.start_time
+        self_time = duration - frame.child_time
+        if self._stack:
+            self._stack[-1].child_time += duration
+        self.folded_stacks[frame.path] = self.folded_stacks.get(frame.path, 0.0) + self_time
+
+        record = {"name": frame.name, **frame.attributes, "seconds": round(duration, 6)}
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            peak_memory = max(frame.peak_memory, peak)
+            if self._stack:
+                parent = self._stack[-1]
+                parent.peak_memory = max(parent.peak_memory, peak_memory)
+            record["allocated_bytes"] = current - frame.start_memory
+            record["peak_bytes"] = peak_memory - frame.start_memory
+
+        if frame.category == "api":
+            stats = self.api_stats.get(frame.name)
+            if stats is None:
+                stats = self.api_stats[frame.name] = {"calls": 0, "total_seconds": 0.0, "self_seconds": 0.0, "max_seconds": 0.0}
+                if self.trace_memory:
+                    stats.update(allocated_bytes=0, peak_bytes=0)
+            stats["calls"] += 1
+            stats["total_seconds"] += duration
+            stats["self_seconds"] += self_time
+            stats["max_seconds"] = max(stats["max_seconds"], duration)
+            if self.trace_memory:
+                stats["allocated_bytes"] += record["allocated_bytes"]
+                stats["peak_bytes"] = max(stats["peak_bytes"], record["peak_bytes"])
+        elif frame.category in self.records:
+            self.records[frame.category].append(record)
+
+    def get_report(self) -> Dict:
+        apis = {name: {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+                for name, stats in sorted(self.api_stats.items(), key=lambda item: -item[1]["total_seconds"])}
+        return {
+            "mode": self.mode,
+            "total_seconds": round(time.perf_counter() - self.start_time, 6),
+            "stages": self.records["stage"],
+            "scenarios": self.records["scenario"],
+            "apis": apis,
+        }
+
+    def dump_report(self, output_dir: str) -> None:
+        """Write profile.json and profile.folded into output_dir, closing any frame left open by a failure."""
+        while self._stack:
+            self.pop()
+        with open(os.path.join(output_dir, "profile.json"), "w") as json_file:
+            json.dump(self.get_report(), json_file, indent=4)
+        with open(os.path.join(output_dir, "profile.folded"), "w") as folded_file:
+            for path, self_time in self.folded_stacks.items():
+                folded_file.write(f"{path} {max(int(self_time * 1e6), 0)}\n")
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+
+def get_profiler() -> GenerationProfiler:
+    # Access or initialize the singleton variable
+    profiler_instance = SingletonManager.get("profiler_instance", default=None)
+    if profiler_instance is None:
+        from Arrow.Utils.configuration_management import get_config_manager
+        config_manager = get_config_manager()
+        mode = config_manager.get_value('Profile') if config_manager.is_exist('Profile') else None
+        profiler_instance = GenerationProfiler(mode)
+        SingletonManager.set("profiler_instance", profiler_instance)
+    return profiler_instance
+
+
+def profile_api(name: str, func):
+    """
+    Wrap an API function so each call is recorded as an 'api' frame, at the cost of one flag check when disabled.
+    When the API returns a context manager (e.g. AR.Loop, AR.BranchToSegment), its `with` body is recorded too,
+    as a "<name> body" frame.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profiler = get_profiler()
+        if not profiler.enabled:
+            return func(*args, **kwargs)
+        profiler.push(name, "api")
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            profiler.pop()
+        if hasattr(type(result), "__enter__") and hasattr(type(result), "__exit__"):
+            return _ProfiledContext(profiler, f"{name} body", result)
+        return result
+    return wrapper
+
+
+def profile_api_class(api_class, prefix: str) -> None:
+    """
+    Wrap the public functions and static methods of an API class (e.g. AR, MemoryManager_API) with profile_api,
+    recursing into nested API classes (e.g. AR.Stack). Other class attributes (models, base classes) are left as is.
+    """
+    for attr_name, attr in list(vars(api_class).items()):
+        if attr_name.startswith("_"):
+            continue
+        is_static = isinstance(attr, staticmethod)
+        func = attr.__func__ if is_static else attr
+        if isinstance(func, type):
+            if is_static:
+                profile_api_class(func, f"{prefix}.{attr_name}")
+            continue
+        if not callable(func) or not hasattr(func, "__code__"):
+            continue
+        wrapper = profile_api(f"{prefix}.{attr_name}", func)
+        setattr(api_class, attr_name, staticmethod(wrapper) if is_static else wrapper)
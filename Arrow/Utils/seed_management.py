@@ -1,6 +1,9 @@
 import random
+import hashlib
 import numpy as np
+from typing import Dict, Hashable, Optional
 from Arrow.Utils.configuration_management import get_config_manager
+from Arrow.Utils.singleton_management import SingletonManager
 
 def set_seed(seed):
     """
@@ -21,6 +24,9 @@ def set_seed(seed):
     # Set the seed for numpy random number generator
     np.random.seed(seed)
 
+    # Tool randomness is drawn from per-core, per-subsystem streams of the same seed
+    SingletonManager.set("random_streams_instance", RandomStreams(seed))
+
     return seed
 
     # If using PyTorch, set the seed (uncomment if needed)
@@ -31,6 +37,92 @@ def set_seed(seed):
     # torch.backends.cudnn.benchmark = False
 
 
+def derive_seed(seed, *keys) -> int:
+    """
+    Derive a deterministic 32-bit seed for a sub-stream of `seed`, e.g. derive_seed(seed, "core_1", "body").
+    The same (seed, keys) always gives the same value, independently of any random state.
+    """
+    digest = hashlib.sha256(repr((seed, *keys)).encode()).digest()
+    return int.from_bytes(digest[:4], "little")
+
+
+def reseed(seed):
+    """
+    Restart the built-in and numpy random streams from `seed`, without touching the configured 'Seed'.
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+
+class RandomStreams:
+    """
+    Independent, reproducible random streams, keyed by (seed, core, subsystem).
+
+    Each tool subsystem ("register", "memory", "layout", "generate", ...) draws from the stream of the active core,
+    so the draws of one core don't shift any other core, nor any other subsystem of the same core. Code running
+    outside of a core (init, final) uses the core-less streams (core None).
+    Content code calling `random` directly keeps using the global stream seeded by set_seed.
+    """
+
+    def __init__(self, seed):
+        self.seed = seed
+        self.active_core: Optional[str] = None
+        self._streams: Dict[tuple, random.Random] = {}
+        self._numpy_streams: Dict[tuple, np.random.Generator] = {}
+
+    def set_active_core(self, core: Optional[str]) -> None:
+        self.active_core = core
+
+    def stream(self, core: Optional[str], subsystem: Hashable) -> random.Random:
+        key = (core, subsystem)
+        rng = self._streams.get(key)
+        if rng is None:
+            rng = self._streams[key] = random.Random(derive_seed(self.seed, core, subsystem))
+        return rng
+
+    def numpy_stream(self, core: Optional[str], subsystem: Hashable) -> np.random.Generator:
+        key = (core, subsystem)
+        rng = self._numpy_streams.get(key)
+        if rng is None:
+            rng = self._numpy_streams[key] = np.random.default_rng(derive_seed(self.seed, core, subsystem, "numpy"))
+        return rng
+
+    def get_core_states(self, core: Optional[str]) -> Dict:
+        """Positions of all the streams of a core, to continue them in another process (see set_core_states)."""
+        return {
+            "random": {key: rng.getstate() for key, rng in self._streams.items() if key[0] == core},
+            "numpy": {key: rng.bit_generator.state for key, rng in self._numpy_streams.items() if key[0] == core},
+        }
+
+    def set_core_states(self, states: Dict) -> None:
+        for (core, subsystem), state in states["random"].items():
+            self.stream(core, subsystem).setstate(state)
+        for (core, subsystem), state in states["numpy"].items():
+            self.numpy_stream(core, subsystem).bit_generator.state = state
+
+
+def get_random_streams() -> RandomStreams:
+    # Access or initialize the singleton variable
+    random_streams_instance = SingletonManager.get("random_streams_instance", default=None)
+    if random_streams_instance is None:
+        config_manager = get_config_manager()
+        random_streams_instance = RandomStreams(config_manager.get_value('Seed') if config_manager.is_exist('Seed') else None)
+        SingletonManager.set("random_streams_instance", random_streams_instance)
+    return random_streams_instance
+
+
+def rng(subsystem: Hashable) -> random.Random:
+    """The `subsystem` stream of the active core."""
+    random_streams = get_random_streams()
+    return random_streams.stream(random_streams.active_core, subsystem)
+
+
+def numpy_rng(subsystem: Hashable) -> np.random.Generator:
+    """The `subsystem` NumPy stream of the active core."""
+    random_streams = get_random_streams()
+    return random_streams.numpy_stream(random_streams.active_core, subsystem)
+
+
 # # Example function that uses randomness
 # def random_number_example(seed=None):
 #     set_seed()
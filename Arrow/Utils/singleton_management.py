@@ -39,13 +39,18 @@ class SingletonManager:
         cls._instances[key] = value
 
     @classmethod
-    def reset(cls):
+    def reset(cls, keep=()):
         """
         Reset all singleton variables.
 
         Clears all stored keys and their associated values.
+
+        Args:
+            keep (Iterable[str]): Keys to preserve (e.g., run-independent caches). Defaults to none.
         """
+        kept = {key: cls._instances[key] for key in keep if key in cls._instances}
         cls._instances.clear()
+        cls._instances.update(kept)
 
     @classmethod
     def reset_key(cls, key: str):